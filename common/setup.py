@@ -36,6 +36,7 @@ test_requirements = [
     'types-requests',
     'types-setuptools',
     'pytest-mypy',
+    'moto',
 ]
 
 test_requirements = list(set(test_requirements))
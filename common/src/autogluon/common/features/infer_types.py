@@ -1,13 +1,27 @@
 import logging
+import re
 from collections import defaultdict
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype
 
 logger = logging.getLogger(__name__)
 
+# Number of rows sampled to infer whether a column is text
+_TEXT_SAMPLE_SIZE = 5000
+# Number of rows sampled to infer whether a column is datetime_as_object
+_DATETIME_SAMPLE_SIZE = 500
+# Columns are considered datetime_as_object if at least this ratio of the sampled rows (including missing values) parse as datetimes
+_DATETIME_MIN_PARSED_RATIO = 0.2
+# Strings longer than this are never considered datetimes by the probe
+_DATETIME_MAX_LENGTH = 64
+# Strings are only parsed as datetimes if they contain a digit or are a keyword such as 'now', other strings are never parsed by pandas
+_DATETIME_PROBE_PATTERN = r'\d|now|today'
+
 
 def get_type_family_raw(dtype) -> str:
     """From dtype, gets the dtype family."""
@@ -49,13 +63,47 @@ def get_type_map_raw(df: DataFrame) -> dict:
     return {k: get_type_family_raw(v) for k, v in features_types.items()}
 
 
-def get_type_map_special(X: DataFrame) -> dict:
-    type_map_special = {}
-    for column in X:
-        types_special = get_types_special(X[column])
-        if types_special:
-            type_map_special[column] = types_special
-    return type_map_special
+def get_type_map_special(X: DataFrame, num_workers: int = 1) -> dict:
+    """
+    Returns a dictionary mapping column names of X to their special types.
+
+    Rows are sampled once for the whole DataFrame, then each object column is checked on the sample with cheap probes
+    (numeric parsing, a regex for date-like strings, datetime format guessing) before any element-wise datetime parsing.
+    Columns are checked by up to `num_workers` threads. As most checks hold the GIL, this only helps when the checks are dominated
+    by vectorized parsing, which is why a single thread is used by default.
+    """
+    num_rows = len(X)
+    columns = list(X.columns)
+    object_columns = [column for column, dtype in zip(columns, X.dtypes) if get_type_family_raw(dtype) == 'object']
+    X_sample = None
+    if object_columns:
+        X_sample = X[object_columns]
+        if num_rows > _TEXT_SAMPLE_SIZE:
+            # Same rows as `X[column].sample(n=_TEXT_SAMPLE_SIZE, random_state=0)` for every column
+            X_sample = X_sample.sample(n=_TEXT_SAMPLE_SIZE, random_state=0)
+    object_columns_set = set(object_columns)
+
+    def _get_types_special(column) -> List[str]:
+        series = X[column]
+        types_special = []
+        if isinstance(series.dtype, pd.SparseDtype):
+            types_special.append('sparse')
+        if column in object_columns_set:
+            series_sample = X_sample[column]
+            # The full column only needs to be scanned for non-null values if the sampled rows are all null
+            if not (series_sample.isnull().all() and series.isnull().all()):
+                if _check_if_datetime_as_object_sample(series_sample):
+                    types_special.append('datetime_as_object')
+                elif _check_if_nlp_sample(series_sample):
+                    types_special.append('text')
+        return types_special
+
+    if num_workers > 1 and len(object_columns) > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            types_special_list = list(executor.map(_get_types_special, columns))
+    else:
+        types_special_list = [_get_types_special(column) for column in columns]
+    return {column: types_special for column, types_special in zip(columns, types_special_list) if types_special}
 
 
 def get_types_special(X: Series) -> List[str]:
@@ -96,43 +144,121 @@ def get_type_group_map_special(df: DataFrame) -> defaultdict:
 
 
 # TODO: Expand to int64 -> date features (milli from epoch etc)
-# TODO: This takes a surprisingly long time to run, ~30 seconds a laptop for
-#  50,000 rows of datetime_as_object for a single column. Try to optimize.
 def check_if_datetime_as_object_feature(X: Series) -> bool:
     type_family = get_type_family_raw(X.dtype)
     # TODO: Check if low numeric numbers, could be categorical encoding!
     # TODO: If low numeric, potentially it is just numeric instead of date
-    if X.isnull().all():
-        return False
     if type_family != 'object':  # TODO: seconds from epoch support
         return False
+    if X.isnull().all():
+        return False
+    if len(X) > _TEXT_SAMPLE_SIZE:
+        # Sample to speed-up type inference
+        X = X.sample(n=_TEXT_SAMPLE_SIZE, random_state=0)
+    return _check_if_datetime_as_object_sample(X)
+
+
+def _check_if_datetime_as_object_sample(X: Series) -> bool:
+    """Checks if the sampled rows of an object column that is not all null are datetimes."""
+    # TODO: pd.Series(['20170204','20170205','20170206']) is incorrectly not detected as datetime_as_object
+    #  But we don't want pd.Series(['184','822828','20170206']) to be detected as datetime_as_object
+    #  Need some smart logic (check min/max values?, check last 2 values don't go >31?)
     try:
-        # TODO: pd.Series(['20170204','20170205','20170206']) is incorrectly not detected as datetime_as_object
-        #  But we don't want pd.Series(['184','822828','20170206']) to be detected as datetime_as_object
-        #  Need some smart logic (check min/max values?, check last 2 values don't go >31?)
         pd.to_numeric(X)
-    except:
-        try:
-            if len(X) > 500:
-                # Sample to speed-up type inference
-                X = X.sample(n=500, random_state=0)
-            result = pd.to_datetime(X, errors='coerce')
-            if result.isnull().mean() > 0.8:  # If over 80% of the rows are NaN
-                return False
-            return True
-        except:
-            return False
+    except (ValueError, TypeError):
+        pass
     else:
         return False
+    if len(X) > _DATETIME_SAMPLE_SIZE:
+        # Sample rather than take the first rows, which are not representative of sorted data.
+        # Columns with at most `_TEXT_SAMPLE_SIZE` rows are checked on the same rows as `X.sample(n=_DATETIME_SAMPLE_SIZE, random_state=0)`.
+        X = X.sample(n=_DATETIME_SAMPLE_SIZE, random_state=0)
+    num_rows = len(X)
+    X = X.dropna()
+    if infer_dtype(X, skipna=False) == 'string':
+        # Strings not matching the probe and long strings are not parsed as datetimes, skip parsing if too few remain
+        X = X[X.str.contains(_DATETIME_PROBE_PATTERN, case=False, regex=True) & (X.str.len() <= _DATETIME_MAX_LENGTH)]
+        if len(X) < _DATETIME_MIN_PARSED_RATIO * num_rows:
+            return False
+        datetime_format = _guess_datetime_format(X)
+        if datetime_format is not None:
+            # Parsing all rows with the guessed format is fast, element-wise parsing is only required if some rows do not match it.
+            # Only the number of parsed rows is used, so the guess does not need to give the same values as element-wise parsing.
+            num_parsed = pd.to_datetime(X, format=datetime_format, errors='coerce').notnull().sum()
+            if num_parsed >= _DATETIME_MIN_PARSED_RATIO * num_rows:
+                return True
+            elif num_parsed == len(X):
+                return False
+    try:
+        num_parsed = pd.to_datetime(X, errors='coerce').notnull().sum()
+    except Exception:
+        return False
+    return num_parsed >= _DATETIME_MIN_PARSED_RATIO * num_rows
+
+
+def infer_datetime_format(X: Series, min_match_ratio: float = 0.9) -> Optional[str]:
+    """
+    Returns the strftime format at least `min_match_ratio` of the non-null sampled string values of X can be parsed with,
+    or None if there is no such format.
+    Parsing with an explicit format is vectorized, which is much faster than the element-wise parsing done without a format.
+    Values not matching the format must be parsed element-wise.
+    """
+    X = X.dropna()
+    if len(X) > _DATETIME_SAMPLE_SIZE:
+        X = X.sample(n=_DATETIME_SAMPLE_SIZE, random_state=0)
+    if len(X) == 0 or infer_dtype(X, skipna=False) != 'string':
+        return None
+    datetime_format = _guess_datetime_format(X)
+    if datetime_format is None:
+        return None
+    X_datetime = pd.to_datetime(X, format=datetime_format, errors='coerce')
+    is_matched = X_datetime.notnull()
+    if is_matched.mean() < min_match_ratio:
+        return None
+    # The format is only used if rows parsed with it get the same values as when parsed element-wise without a format
+    try:
+        X_datetime_expected = pd.to_datetime(X[is_matched], errors='coerce')
+    except Exception:
+        return None
+    if not X_datetime[is_matched].equals(X_datetime_expected):
+        return None
+    return datetime_format
+
+
+def _guess_datetime_format(X: Series) -> Optional[str]:
+    """
+    Guesses the datetime format of the first value of a Series of strings, None if no format is found.
+    The guess is not validated against the other values, callers relying on the parsed values must check them.
+    """
+    try:
+        from pandas._libs.tslibs.parsing import guess_datetime_format
+        datetime_format = guess_datetime_format(X.iloc[0])
+    except Exception:
+        return None
+    # Formats with a timezone offset are excluded, rows with different offsets are not parsed consistently with a single format
+    if datetime_format is None or re.search(r'%z|%Z', datetime_format):
+        return None
+    if '%p' in datetime_format:
+        # AM/PM is ignored when parsing with a 24-hour clock
+        datetime_format = datetime_format.replace('%H', '%I')
+    if '%d' in datetime_format and '%m' in datetime_format and datetime_format.index('%d') < datetime_format.index('%m'):
+        # Ambiguous values of day-first formats are parsed month-first when parsed element-wise
+        return None
+    return datetime_format
 
 
 def check_if_nlp_feature(X: Series) -> bool:
     type_family = get_type_family_raw(X.dtype)
     if type_family != 'object':
         return False
-    if len(X) > 5000:
+    if len(X) > _TEXT_SAMPLE_SIZE:
         # Sample to speed-up type inference
-        X = X.sample(n=5000, random_state=0)
+        X = X.sample(n=_TEXT_SAMPLE_SIZE, random_state=0)
+    return _check_if_nlp_sample(X)
+
+
+def _check_if_nlp_sample(X: Series) -> bool:
+    """Checks if the sampled rows of an object column are text."""
     X_unique = X.unique()
     num_unique = len(X_unique)
     num_rows = len(X)
@@ -1,7 +1,9 @@
 import logging
 import multiprocessing
+import operator
 from os import listdir
 from os.path import isfile, join
+from typing import List, Tuple
 
 import pandas as pd
 from pandas import DataFrame
@@ -10,17 +12,43 @@ from . import load_pointer
 from .load_s3 import list_bucket_prefix_suffix_contains_s3
 from ..savers import save_pointer
 from ..utils import multiprocessing_utils, s3_utils
+from ..utils.try_import import try_import_pyarrow
 
 logger = logging.getLogger(__name__)
 
 
 # TODO: v1.0 consider renaming function so it isn't 'load'. Consider instead 'load_pd', or something more descriptive.
-# TODO: Add full docstring
 # TODO: Add full docstring for usage within TabularDataset
 def load(path, delimiter=None, encoding='utf-8', columns_to_keep=None, dtype=None, header=0,
          names=None, format=None, nrows=None, skiprows=None, usecols=None, low_memory=False, converters=None,
-         filters=None, sample_count=None, worker_count=None, multiprocessing_method='forkserver') -> DataFrame:
+         filters=None, sample_count=None, worker_count=None, multiprocessing_method='forkserver',
+         dictionary_as_category=False) -> DataFrame:
+    """
+    Loads a csv or parquet file, a multipart directory of files or a list of files into a DataFrame.
+
+    Parquet data is read through an Arrow dataset when pyarrow is installed:
+    only the columns in `columns_to_keep` are decoded, predicate `filters` are pushed down to skip row groups,
+    and files are decoded by Arrow's thread pool and concatenated in-process without pickling parts between processes.
+
+    Parameters
+    ----------
+    columns_to_keep : List[str], default = None
+        If specified, only these columns are loaded, in this order.
+    filters : callable, tuple or list, default = None
+        Filters to apply to the loaded rows. Can be any combination of:
+            callables: Functions taking the loaded DataFrame and returning a filtered DataFrame, applied in order after loading.
+            predicates: Tuples `(column, op, value)` with op in `=, ==, !=, <, <=, >, >=, in, not in`.
+                A list of predicates keeps rows satisfying all of them,
+                a list of lists of predicates keeps rows satisfying all predicates of any of the inner lists (pyarrow's DNF format).
+                Predicates are pushed down to the reader for parquet data loaded with pyarrow, otherwise they are evaluated after loading.
+    dictionary_as_category : bool, default = False
+        If True, string columns of parquet data are read dictionary-encoded and returned as pandas categoricals,
+        avoiding the materialization of a Python object per value. Requires pyarrow.
+    """
     if isinstance(path, list):
+        if (format == 'parquet' or (format is None and _is_parquet_path(path))) and _is_pyarrow_available():
+            return _load_parquet_arrow(path=path, columns_to_keep=columns_to_keep, nrows=nrows, filters=filters,
+                                       dictionary_as_category=dictionary_as_category)
         return _load_multipart(
             paths=path, delimiter=delimiter, encoding=encoding, columns_to_keep=columns_to_keep,
             dtype=dtype, header=header, names=names, format=format,
@@ -54,48 +82,66 @@ def load(path, delimiter=None, encoding='utf-8', columns_to_keep=None, dtype=Non
         return load(path=content_path, delimiter=delimiter, encoding=encoding, columns_to_keep=columns_to_keep, dtype=dtype,
                     header=header, names=names, format=None, nrows=nrows, skiprows=skiprows,
                     usecols=usecols, low_memory=low_memory, converters=converters, filters=filters, sample_count=sample_count,
-                    worker_count=worker_count, multiprocessing_method=multiprocessing_method)
+                    worker_count=worker_count, multiprocessing_method=multiprocessing_method,
+                    dictionary_as_category=dictionary_as_category)
     elif format == 'multipart_s3':
         bucket, prefix = s3_utils.s3_path_to_bucket_prefix(path)
         return _load_multipart_s3(bucket=bucket, prefix=prefix, columns_to_keep=columns_to_keep, dtype=dtype, filters=filters,
-                                 sample_count=sample_count, worker_count=worker_count, multiprocessing_method=multiprocessing_method)  # TODO: Add arguments!
+                                  sample_count=sample_count, worker_count=worker_count, multiprocessing_method=multiprocessing_method,
+                                  dictionary_as_category=dictionary_as_category)  # TODO: Add arguments!
     elif format == 'multipart_local':
         paths = [join(path, f) for f in listdir(path) if (isfile(join(path, f))) & (f.startswith('part-'))]
-        return load_multipart(
-            paths=paths, delimiter=delimiter, encoding=encoding, columns_to_keep=columns_to_keep,
+        return load(
+            path=paths, delimiter=delimiter, encoding=encoding, columns_to_keep=columns_to_keep,
             dtype=dtype, header=header, names=names, format=None,
             nrows=nrows, skiprows=skiprows, usecols=usecols, low_memory=low_memory, converters=converters,
             filters=filters,
             worker_count=worker_count,
             multiprocessing_method=multiprocessing_method,
+            dictionary_as_category=dictionary_as_category,
         )
-    elif format == 'parquet':
-        try:
-            # TODO: Deal with extremely strange issue resulting from torch being present in package,
-            #  will cause read_parquet to either freeze or Segmentation Fault when performing multiprocessing
-            df = pd.read_parquet(path, columns=columns_to_keep, engine='fastparquet')
-        except:
-            df = pd.read_parquet(path, columns=columns_to_keep, engine='pyarrow')
-        column_count_full = len(df.columns)
-    elif format == 'csv':
-        df = pd.read_csv(path, converters=converters, delimiter=delimiter, encoding=encoding, header=header, names=names, dtype=dtype,
-                         low_memory=low_memory, nrows=nrows, skiprows=skiprows, usecols=usecols)
-        column_count_full = len(list(df.columns.values))
+    elif format == 'parquet' and _is_pyarrow_available():
+        return _load_parquet_arrow(path=path, columns_to_keep=columns_to_keep, nrows=nrows, filters=filters,
+                                   dictionary_as_category=dictionary_as_category)
+    elif format == 'parquet' or format == 'csv':
+        predicate_filters, callable_filters = _split_filters(filters)
+        columns_to_read = columns_to_keep
+        if columns_to_keep is not None and predicate_filters:
+            # Predicates may reference columns that are not kept, these are dropped once the predicates are applied
+            columns_to_read = list(columns_to_keep) + list(
+                dict.fromkeys(column for conjunction in predicate_filters for column, _, _ in conjunction if column not in columns_to_keep))
+        if format == 'parquet':
+            try:
+                # TODO: Deal with extremely strange issue resulting from torch being present in package,
+                #  will cause read_parquet to either freeze or Segmentation Fault when performing multiprocessing
+                df = pd.read_parquet(path, columns=columns_to_read, engine='fastparquet')
+            except:
+                df = pd.read_parquet(path, columns=columns_to_read, engine='pyarrow')
+            column_count_full = len(df.columns)
+        else:
+            column_names = []
+            if usecols is None and columns_to_read is not None:
+                # Only parse the columns to read, recording every column name seen to log the full column count
+                columns_to_read_set = set(columns_to_read)
+
+                def usecols(column) -> bool:
+                    column_names.append(column)
+                    return column in columns_to_read_set
+            df = pd.read_csv(path, converters=converters, delimiter=delimiter, encoding=encoding, header=header, names=names, dtype=dtype,
+                             low_memory=low_memory, nrows=nrows, skiprows=skiprows, usecols=usecols)
+            column_count_full = len(column_names) if column_names else len(df.columns)
+        row_count = df.shape[0]
+        if predicate_filters:
+            df = _apply_predicate_filters(df=df, predicate_filters=predicate_filters)
         if columns_to_keep is not None:
             df = df[columns_to_keep]
     else:
         raise Exception('file format ' + format + ' not supported!')
 
-    row_count = df.shape[0]
-
     column_count_trimmed = len(list(df.columns.values))
 
-    if filters is not None:
-        if isinstance(filters, list):
-            for filter in filters:
-                df = filter(df)
-        else:
-            df = filters(df)
+    for filter in callable_filters:
+        df = filter(df)
 
     logger.log(20, "Loaded data from: " + str(path) + " | Columns = " + str(column_count_trimmed) + " / " +
                str(column_count_full) + " | Rows = " + str(row_count) + " -> " + str(len(df)))
@@ -140,7 +186,7 @@ def _load_multipart(paths, delimiter=',', encoding='utf-8', columns_to_keep=None
 
 
 def _load_multipart_s3(bucket, prefix, columns_to_keep=None, dtype=None, sample_count=None, filters=None,
-                      worker_count=None, multiprocessing_method='forkserver'):
+                       worker_count=None, multiprocessing_method='forkserver', dictionary_as_category=False):
     if prefix[-1] == '/':
         prefix = prefix[:-1]
     prefix_multipart = prefix + '/part-'
@@ -152,5 +198,130 @@ def _load_multipart_s3(bucket, prefix, columns_to_keep=None, dtype=None, sample_
         paths_full = paths_full[:sample_count]
 
     df = load(path=paths_full, columns_to_keep=columns_to_keep, dtype=dtype, filters=filters,
-              worker_count=worker_count, multiprocessing_method=multiprocessing_method)
+              worker_count=worker_count, multiprocessing_method=multiprocessing_method,
+              dictionary_as_category=dictionary_as_category)
+    return df
+
+
+def _is_parquet_path(paths: List[str]) -> bool:
+    return len(paths) > 0 and all('.parquet' in path or '.pq' in path for path in paths)
+
+
+def _is_pyarrow_available() -> bool:
+    try:
+        try_import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def _load_parquet_arrow(path, columns_to_keep=None, nrows=None, filters=None, dictionary_as_category=False) -> DataFrame:
+    """
+    Loads parquet data through an Arrow dataset.
+    Only the columns in `columns_to_keep` are decoded, row groups whose statistics do not satisfy the predicate filters are skipped,
+    and files are decoded by Arrow's thread pool before a single conversion to pandas.
+    """
+    pa = try_import_pyarrow()
+    import pyarrow.dataset as ds
+
+    # Directories may be hive partitioned (`.../key=value/part-0.parquet`), lists of files are read as is
+    partitioning = None if isinstance(path, list) else 'hive'
+    dataset = ds.dataset(path, format='parquet', partitioning=partitioning)
+    column_count_full = len(dataset.schema.names)
+    if dictionary_as_category:
+        dictionary_columns = [field.name for field in dataset.schema
+                              if pa.types.is_string(field.type) or pa.types.is_large_string(field.type)]
+        if dictionary_columns:
+            # Decode string columns as dictionaries, which convert to pandas categoricals without creating an object per value
+            parquet_format = ds.ParquetFileFormat(read_options=ds.ParquetReadOptions(dictionary_columns=dictionary_columns))
+            dataset = ds.dataset(path, format=parquet_format, partitioning=partitioning)
+
+    predicate_filters, callable_filters = _split_filters(filters)
+    filter_expression = _predicate_filters_to_expression(predicate_filters) if predicate_filters else None
+    if columns_to_keep is not None:
+        # The columns storing the pandas index are read as well so that the index is restored, as in `pd.read_parquet`
+        columns_to_keep = list(columns_to_keep) + [column for column in _get_parquet_index_columns(dataset.schema) if column not in columns_to_keep]
+    if nrows is not None:
+        table = dataset.head(nrows, columns=columns_to_keep, filter=filter_expression)
+    else:
+        table = dataset.to_table(columns=columns_to_keep, filter=filter_expression, use_threads=True)
+    # Release each Arrow column once converted so that the peak memory stays close to the size of the final DataFrame
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+
+    row_count = df.shape[0]
+    column_count_trimmed = len(df.columns)
+    for filter in callable_filters:
+        df = filter(df)
+
+    logger.log(20, "Loaded data from: " + str(path) + " | Columns = " + str(column_count_trimmed) + " / " +
+               str(column_count_full) + " | Rows = " + str(row_count) + " -> " + str(len(df)))
     return df
+
+
+def _get_parquet_index_columns(schema) -> List[str]:
+    """Returns the names of the columns storing the pandas index of data written by pandas, based on the pandas metadata of the Arrow `schema`."""
+    pandas_metadata = schema.pandas_metadata
+    if not pandas_metadata:
+        return []
+    # A RangeIndex is stored in the metadata as a dictionary rather than as a column
+    return [column for column in pandas_metadata.get('index_columns', []) if isinstance(column, str)]
+
+
+_PREDICATE_OPERATORS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, value: series.isin(value),
+    'not in': lambda series, value: ~series.isin(value),
+}
+
+
+def _split_filters(filters) -> Tuple[List[List[tuple]], list]:
+    """
+    Splits `filters` into predicate filters in disjunctive normal form (a list of conjunctions of `(column, op, value)` tuples)
+    and callable filters.
+    """
+    if filters is None:
+        return [], []
+    if callable(filters) or isinstance(filters, tuple):
+        filters = [filters]
+    callable_filters = [f for f in filters if callable(f)]
+    conjunction = [f for f in filters if isinstance(f, tuple)]
+    disjunction = [list(f) for f in filters if isinstance(f, list)]
+    if len(callable_filters) + len(conjunction) + len(disjunction) != len(filters):
+        raise ValueError(f'Invalid filters, expected callables, (column, op, value) tuples or lists of tuples: {filters}')
+    if conjunction and disjunction:
+        raise ValueError(f'Invalid filters, cannot mix (column, op, value) tuples with lists of tuples: {filters}')
+    predicate_filters = [conjunction] if conjunction else disjunction
+    for predicate in [p for c in predicate_filters for p in c]:
+        if not isinstance(predicate, tuple) or len(predicate) != 3 or predicate[1] not in _PREDICATE_OPERATORS:
+            raise ValueError(f'Invalid filter predicate {predicate}, expected (column, op, value) with op in {list(_PREDICATE_OPERATORS)}')
+    return predicate_filters, callable_filters
+
+
+def _predicate_filters_to_expression(predicate_filters: List[List[tuple]]):
+    import pyarrow.parquet as pq
+    filters_to_expression = getattr(pq, 'filters_to_expression', None)
+    if filters_to_expression is None:  # pyarrow < 10
+        filters_to_expression = pq._filters_to_expression
+    return filters_to_expression(predicate_filters)
+
+
+def _apply_predicate_filters(df: DataFrame, predicate_filters: List[List[tuple]]) -> DataFrame:
+    """Keeps the rows of `df` satisfying the predicate filters, for data that was not loaded with filter pushdown."""
+    mask = None
+    for conjunction in predicate_filters:
+        mask_conjunction = None
+        for column, op, value in conjunction:
+            mask_predicate = _PREDICATE_OPERATORS[op](df[column], value)
+            mask_conjunction = mask_predicate if mask_conjunction is None else mask_conjunction & mask_predicate
+        if mask_conjunction is not None:
+            mask = mask_conjunction if mask is None else mask | mask_conjunction
+    if mask is None:
+        return df
+    return df[mask.to_numpy()]
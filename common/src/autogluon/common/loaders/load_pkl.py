@@ -22,12 +22,9 @@ def load(path, format=None, verbose=True, **kwargs):
             raise RecursionError('content_path == path! : ' + str(path))
         return load(path=content_path)
     elif format == 's3':
-        import boto3
         if verbose:
             logger.log(15, 'Loading: %s' % path)
-        s3_bucket, s3_prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
-        s3 = boto3.resource('s3')
-        return pickle.loads(s3.Bucket(s3_bucket).Object(s3_prefix).get()['Body'].read())
+        return pickle.load(_download_s3_to_buffer(path))
 
     if verbose:
         logger.log(15, 'Loading: %s' % path)
@@ -38,7 +35,10 @@ def load(path, format=None, verbose=True, **kwargs):
     if compression_fn_kwargs is None:
         compression_fn_kwargs = {}
 
-    if compression_fn in compression_fn_map:
+    if compression_fn in compression_fn_map and compression_utils.is_framed(compression_fn):
+        with open(validated_path, 'rb', buffering=1024 * 1024) as fin:
+            object = compression_utils.load_pickle_framed(fin, compression_fn=compression_fn)
+    elif compression_fn in compression_fn_map:
         with compression_fn_map[compression_fn]['open'](validated_path, 'rb', **compression_fn_kwargs) as fin:
             object = pickle.load(fin)
     else:
@@ -60,17 +60,22 @@ def load_with_fn(path, pickle_fn, format=None, verbose=True):
             raise RecursionError('content_path == path! : ' + str(path))
         return load_with_fn(content_path, pickle_fn)
     elif format == 's3':
-        import boto3
         if verbose:
             logger.log(15, 'Loading: %s' % path)
-        s3_bucket, s3_prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
-        s3 = boto3.resource('s3')
         # Has to be wrapped in IO buffer since s3 stream does not implement seek()
-        buff = io.BytesIO(s3.Bucket(s3_bucket).Object(s3_prefix).get()['Body'].read())
-        return pickle_fn(buff)
+        return pickle_fn(_download_s3_to_buffer(path))
 
     if verbose:
         logger.log(15, 'Loading: %s' % path)
     with open(path, 'rb') as fin:
         object = pickle_fn(fin)
     return object
+
+
+def _download_s3_to_buffer(path: str) -> io.BytesIO:
+    """Downloads the S3 object into memory, large objects are downloaded in concurrent ranged parts."""
+    s3_bucket, s3_prefix = s3_utils.s3_path_to_bucket_prefix(s3_path=path)
+    buff = io.BytesIO()
+    s3_utils._get_s3_client().download_fileobj(s3_bucket, s3_prefix, buff, Config=s3_utils._get_s3_transfer_config())
+    buff.seek(0)
+    return buff
@@ -44,12 +44,16 @@ def save_with_fn(path, object, pickle_fn, format=None, verbose=True, compression
         if compression_fn_kwargs is None:
             compression_fn_kwargs = {}
 
-        with compression_fn_map[compression_fn]['open'](path, 'wb', **compression_fn_kwargs) as fout:
-            pickle_fn(object, fout)
+        if compression_utils.is_framed(compression_fn):
+            # Buffered writes of the compressed frames, the object is pickled with protocol 5 regardless of `pickle_fn`
+            with open(path, 'wb', buffering=1024 * 1024) as fout:
+                compression_utils.dump_pickle_framed(object, fout, compression_fn=compression_fn, compression_fn_kwargs=compression_fn_kwargs)
+        else:
+            with compression_fn_map[compression_fn]['open'](path, 'wb', **compression_fn_kwargs) as fout:
+                pickle_fn(object, fout)
 
 
 def save_s3(path: str, obj, pickle_fn, verbose=True):
-    import boto3
     if verbose:
         logger.info(f'save object to {path}')
     with tempfile.TemporaryFile() as f:
@@ -58,10 +62,10 @@ def save_s3(path: str, obj, pickle_fn, verbose=True):
         f.seek(0)
 
         bucket, key = s3_utils.s3_path_to_bucket_prefix(path)
-        s3_client = boto3.client('s3')
+        s3_client = s3_utils._get_s3_client()
         try:
-            config = boto3.s3.transfer.TransferConfig()  # enable multipart uploading for files larger than 8MB
-            s3_client.upload_fileobj(f, bucket, key, Config=config)
+            # Multipart upload of concurrent parts for files larger than `s3_utils.S3_MULTIPART_CHUNKSIZE`, with retries
+            s3_client.upload_fileobj(f, bucket, key, Config=s3_utils._get_s3_transfer_config())
         except:
             logger.error('Failed to save object to s3')
             raise
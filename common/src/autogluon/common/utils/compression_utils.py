@@ -1,3 +1,10 @@
+import os
+import pickle
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .try_import import try_import_lz4, try_import_zstandard
 
 
 def _gzip_open(*args, **kwargs):
@@ -17,6 +24,28 @@ def _lzma_open(*args, **kwargs):
     return lzma.open(*args, **kwargs)
 
 
+def _zstd_compress(data, level: int = 3) -> bytes:
+    zstandard = try_import_zstandard()
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _zstd_decompress(data) -> bytes:
+    zstandard = try_import_zstandard()
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _lz4_compress(data, level: int = 0) -> bytes:
+    lz4 = try_import_lz4()
+    return lz4.frame.compress(data, compression_level=level)
+
+
+def _lz4_decompress(data) -> bytes:
+    lz4 = try_import_lz4()
+    return lz4.frame.decompress(data)
+
+
+# Compression functions with 'compress' and 'decompress' are framed: objects are pickled with `dump_pickle_framed`,
+# compressing independent frames in parallel, instead of being pickled into a file object returned by 'open'.
 compression_fn_map = {
     None: {
         'open': open,
@@ -34,6 +63,16 @@ compression_fn_map = {
         'open': _lzma_open,
         'extension': 'lzma',
     },
+    'zstd': {
+        'compress': _zstd_compress,
+        'decompress': _zstd_decompress,
+        'extension': 'zst',
+    },
+    'lz4': {
+        'compress': _lz4_compress,
+        'decompress': _lz4_decompress,
+        'extension': 'lz4',
+    },
 }
 
 
@@ -47,3 +86,102 @@ def get_validated_path(filename, compression_fn=None):
 
 def get_compression_map():
     return compression_fn_map
+
+
+def is_framed(compression_fn) -> bool:
+    """Returns True if objects compressed with `compression_fn` are saved with `dump_pickle_framed`."""
+    return 'compress' in compression_fn_map[compression_fn]
+
+
+_FRAMED_PICKLE_MAGIC = b'AGPKLF01'
+# Size of the independently compressed frames out-of-band buffers are split into, the unit of parallelism
+_FRAME_SIZE = 16 * 1024 * 1024
+_UINT64 = struct.Struct('<Q')
+
+
+def dump_pickle_framed(obj, fout, compression_fn: str, compression_fn_kwargs: dict = None, max_workers: int = None):
+    """
+    Pickles `obj` into the binary file object `fout`, compressed with the framed `compression_fn`.
+
+    The object is pickled with protocol 5: the buffers of contiguous numpy arrays (including the blocks of pandas DataFrames) are
+    kept out-of-band and compressed straight from the arrays' memory, without first copying them into a pickle byte string.
+    Buffers are split into frames of `_FRAME_SIZE` bytes compressed in parallel by up to `max_workers` threads
+    (zstd and lz4 release the GIL), and written in order as they complete, so memory overhead is bounded by the frames in flight.
+
+    File layout (integers are little-endian uint64):
+        magic, payload size, compressed payload size, compressed payload (the in-band pickle), number of buffers,
+        then for each buffer: buffer size, number of frames, then for each frame: compressed frame size, compressed frame.
+    """
+    if compression_fn_kwargs is None:
+        compression_fn_kwargs = {}
+    compress = compression_fn_map[compression_fn]['compress']
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    payload_compressed = compress(payload, **compression_fn_kwargs)
+    fout.write(_FRAMED_PICKLE_MAGIC)
+    fout.write(_UINT64.pack(len(payload)))
+    fout.write(_UINT64.pack(len(payload_compressed)))
+    fout.write(payload_compressed)
+    del payload, payload_compressed
+    fout.write(_UINT64.pack(len(buffers)))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for buffer in buffers:
+            buffer = buffer.raw()
+            num_frames = (buffer.nbytes + _FRAME_SIZE - 1) // _FRAME_SIZE
+            fout.write(_UINT64.pack(buffer.nbytes))
+            fout.write(_UINT64.pack(num_frames))
+            futures = deque()
+            for offset in range(0, buffer.nbytes, _FRAME_SIZE):
+                if len(futures) >= 2 * max_workers:
+                    _write_frame(fout, futures.popleft().result())
+                futures.append(executor.submit(compress, buffer[offset:offset + _FRAME_SIZE], **compression_fn_kwargs))
+            while futures:
+                _write_frame(fout, futures.popleft().result())
+
+
+def load_pickle_framed(fin, compression_fn: str, max_workers: int = None):
+    """
+    Loads an object saved with `dump_pickle_framed` from the binary file object `fin`.
+    Frames are decompressed by up to `max_workers` threads while the following frames are read,
+    directly into the preallocated out-of-band buffers the loaded arrays are backed by.
+    """
+    decompress = compression_fn_map[compression_fn]['decompress']
+    magic = fin.read(len(_FRAMED_PICKLE_MAGIC))
+    if magic != _FRAMED_PICKLE_MAGIC:
+        raise ValueError(f'File is not a pickle saved with compression_fn={compression_fn}')
+    _read_uint64(fin)  # payload size
+    payload = decompress(fin.read(_read_uint64(fin)))
+    num_buffers = _read_uint64(fin)
+    buffers = []
+    futures = deque()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    def _decompress_into(frame, out):
+        out[:] = decompress(frame)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in range(num_buffers):
+            buffer = bytearray(_read_uint64(fin))
+            buffer_view = memoryview(buffer)
+            num_frames = _read_uint64(fin)
+            for i in range(num_frames):
+                if len(futures) >= 2 * max_workers:
+                    futures.popleft().result()
+                frame = fin.read(_read_uint64(fin))
+                futures.append(executor.submit(_decompress_into, frame, buffer_view[i * _FRAME_SIZE:(i + 1) * _FRAME_SIZE]))
+            buffers.append(buffer)
+        while futures:
+            futures.popleft().result()
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _write_frame(fout, frame: bytes):
+    fout.write(_UINT64.pack(len(frame)))
+    fout.write(frame)
+
+
+def _read_uint64(fin) -> int:
+    return _UINT64.unpack(fin.read(_UINT64.size))[0]
@@ -1,7 +1,10 @@
 import logging
 import math
+import weakref
 from functools import wraps
+from typing import Dict, Tuple
 
+import pandas as pd
 from pandas import DataFrame
 
 from ..features.infer_types import get_type_map_raw
@@ -29,9 +32,35 @@ def _suspend_logging_for_package(package_name):
     return _suspend_logging
 
 
+def get_approximate_df_mem_usage(df: DataFrame, sample_ratio=0.2, memory_profile: 'DataFrameMemoryProfile' = None) -> pd.Series:
+    """
+    Returns the approximate memory usage in bytes of the index and each column of `df`, in the same format as `df.memory_usage(deep=True)`.
+
+    If `sample_ratio < 1`, the memory usage of columns is estimated from a `DataFrameMemoryProfile`.
+    The profile of `df` is computed once and cached for as long as `df` is alive, so repeated calls on the same DataFrame do not scan its data again.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame to compute the memory usage of.
+    sample_ratio : float, default = 0.2
+        The ratio of rows sampled to estimate the memory usage of object columns.
+        If >= 1, the exact memory usage is computed and nothing is cached.
+    memory_profile : DataFrameMemoryProfile, default = None
+        If specified, used to estimate the memory usage instead of the cached profile of `df`.
+        Only the columns of `df` missing from `memory_profile` are scanned, and are added to `memory_profile`.
+        Useful to estimate the memory usage of DataFrames derived from the profiled data, such as row subsets or DataFrames with additional columns.
+    """
+    if (sample_ratio >= 1 and memory_profile is None) or not df.columns.is_unique:
+        return _get_approximate_df_mem_usage(df, sample_ratio=sample_ratio)
+    if memory_profile is None:
+        memory_profile = DataFrameMemoryProfile.from_df(df, sample_ratio=sample_ratio)
+    return memory_profile.get_mem_usage(df)
+
+
 # suspend_logging to hide the Pandas log of NumExpr initialization
 @_suspend_logging_for_package('pandas')
-def get_approximate_df_mem_usage(df: DataFrame, sample_ratio=0.2):
+def _get_approximate_df_mem_usage(df: DataFrame, sample_ratio=0.2) -> pd.Series:
     if sample_ratio >= 1:
         return df.memory_usage(deep=True)
     else:
@@ -57,3 +86,75 @@ def get_approximate_df_mem_usage(df: DataFrame, sample_ratio=0.2):
             memory_usage_inexact = df[columns_inexact].head(num_rows_sample).memory_usage(deep=True)[columns_inexact] / sample_ratio
             memory_usage = memory_usage_inexact.combine_first(memory_usage)
         return memory_usage
+
+
+class DataFrameMemoryProfile:
+    """
+    Approximate memory usage per row of the columns of a DataFrame.
+
+    Each column is scanned once, with the sampling of `get_approximate_df_mem_usage`.
+    The memory usage of any DataFrame with the profiled columns, such as a row subset of the profiled data, is then estimated without scanning its data.
+    Columns which are not yet profiled, or whose dtype changed, are scanned and added to the profile when encountered,
+    which keeps the profile up to date as features are added or removed.
+
+    Parameters
+    ----------
+    sample_ratio : float, default = 0.2
+        The ratio of rows sampled to estimate the memory usage of object columns.
+    """
+    def __init__(self, sample_ratio: float = 0.2):
+        self.sample_ratio = sample_ratio
+        # column -> (dtype, memory usage per row, memory usage independent of the number of rows such as the categories of a category column)
+        self._column_profiles: Dict[str, tuple] = dict()
+
+    @classmethod
+    def from_df(cls, df: DataFrame, sample_ratio: float = 0.2) -> 'DataFrameMemoryProfile':
+        """
+        Returns the memory profile of `df`.
+        The profile is cached for as long as `df` is alive, repeated calls with the same DataFrame return the same profile.
+        """
+        key = (id(df), sample_ratio)
+        cached = _df_memory_profile_cache.get(key, None)
+        if cached is not None and cached[0]() is df:
+            memory_profile = cached[1]
+        else:
+            memory_profile = cls(sample_ratio=sample_ratio)
+            df_ref = weakref.ref(df, lambda _, key=key: _df_memory_profile_cache.pop(key, None))
+            _df_memory_profile_cache[key] = (df_ref, memory_profile)
+        return memory_profile.update(df)
+
+    def update(self, df: DataFrame) -> 'DataFrameMemoryProfile':
+        """Profiles the columns of `df` which are not yet profiled or whose dtype changed. Returns self."""
+        column_profiles = self._column_profiles
+        dtypes = df.dtypes
+        columns_new = [column for column in df.columns if column not in column_profiles or column_profiles[column][0] != dtypes[column]]
+        if not columns_new:
+            return self
+        df_new = df if len(columns_new) == len(df.columns) else df[columns_new]
+        memory_usage = _get_approximate_df_mem_usage(df_new, sample_ratio=self.sample_ratio)
+        num_rows = len(df)
+        for column in columns_new:
+            dtype = dtypes[column]
+            column_memory_usage = memory_usage[column]
+            if isinstance(dtype, pd.CategoricalDtype):
+                memory_usage_per_row = df[column].cat.codes.dtype.itemsize
+            elif num_rows > 0:
+                memory_usage_per_row = column_memory_usage / num_rows
+            else:
+                memory_usage_per_row = 0
+            column_profiles[column] = (dtype, memory_usage_per_row, column_memory_usage - memory_usage_per_row * num_rows)
+        return self
+
+    def get_mem_usage(self, df: DataFrame) -> pd.Series:
+        """Returns the approximate memory usage in bytes of the index and each column of `df`, profiling any columns missing from the profile."""
+        self.update(df)
+        num_rows = len(df)
+        memory_usage = {'Index': df.index.memory_usage(deep=True)}
+        for column in df.columns:
+            _, memory_usage_per_row, memory_usage_fixed = self._column_profiles[column]
+            memory_usage[column] = memory_usage_per_row * num_rows + memory_usage_fixed
+        return pd.Series(memory_usage, dtype='float64')
+
+
+# (id, sample_ratio) -> (weak reference to DataFrame, memory profile of DataFrame)
+_df_memory_profile_cache: Dict[Tuple[int, float], Tuple[weakref.ref, DataFrameMemoryProfile]] = dict()
@@ -1,8 +1,10 @@
+import hashlib
 import logging
 import os
 import pathlib
 import shutil
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Union
 
 from ..loaders.load_s3 import list_bucket_prefix_suffix_contains_s3
@@ -10,6 +12,15 @@ from ..loaders.load_s3 import list_bucket_prefix_suffix_contains_s3
 
 logger = logging.getLogger(__name__)
 
+# Objects larger than this are transferred in parts of this size with concurrent ranged GET / multipart PUT requests
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+# Number of concurrent requests used to transfer the parts of a single object
+S3_MAX_CONCURRENCY_PER_OBJECT = 10
+# Default number of objects transferred concurrently when transferring multiple objects
+S3_MAX_WORKERS = 16
+# Maximum number of attempts of each S3 request, retried with exponential backoff on throttling and transient errors
+S3_MAX_ATTEMPTS = 10
+
 
 def is_s3_url(path: str) -> bool:
     if (path[:2] == 's3') and ('://' in path[:6]):
@@ -42,7 +53,7 @@ def delete_s3_prefix(bucket: str, prefix: str):
         s3.meta.client.delete_objects(Bucket=bucket, Delete=delete_keys)
         
 
-def upload_file(*, file_name: str, bucket: str, prefix: Optional[str] = None):
+def upload_file(*, file_name: str, bucket: str, prefix: Optional[str] = None, skip_if_matching: bool = False):
     """
     Upload a file to a S3 bucket
 
@@ -54,19 +65,17 @@ def upload_file(*, file_name: str, bucket: str, prefix: Optional[str] = None):
         Bucket to upload to
     prefix: Optional[str], default = None
         S3 prefix. If not specified then will upload to the root of the bucket
+    skip_if_matching: bool, default = False
+        If True, the upload is skipped if the S3 object already exists with the same size and checksum (ETag) as the file.
     """
-    import boto3
-
     object_name = os.path.basename(file_name)
-    if len(prefix) == 0:
+    if prefix is not None and len(prefix) == 0:
         prefix = None
     if prefix is not None:
         object_name = prefix + "/" + object_name
 
-    # Upload the file
-    s3_client = boto3.client("s3")
-    s3_client.upload_file(file_name, bucket, object_name)
-    
+    _upload_file(s3_client=_get_s3_client(), local_path=file_name, bucket=bucket, key=object_name, skip_if_matching=skip_if_matching)
+
     
 def upload_s3_folder(
     *,
@@ -74,7 +83,9 @@ def upload_s3_folder(
     prefix: str,
     folder_to_upload: str,
     dry_run: bool = False,
-    verbose: bool = True
+    verbose: bool = True,
+    max_workers: int = S3_MAX_WORKERS,
+    skip_if_matching: bool = False,
 ):
     """
     Upload a folder to a S3 bucket and maintain its inner structure
@@ -106,23 +117,35 @@ def upload_s3_folder(
         If True, will isntead log every file that will be uploaded and the s3 path to be uploaded to
     verbose: bool, default = True
         Whether to log detailed loggings
+    max_workers: int, default = S3_MAX_WORKERS
+        The maximum number of files uploaded concurrently.
+    skip_if_matching: bool, default = False
+        If True, files whose S3 object already exists with the same size and checksum (ETag) are not uploaded again.
     """
     if prefix.endswith("/"):
         prefix = prefix[:-1]
     files_to_upload = _get_local_objs_to_upload_and_s3_prefix(folder_to_upload=folder_to_upload)
     if verbose:
         logger.log(20, f"Will upload {len(files_to_upload)} objects from {folder_to_upload} to s3://{bucket}/{prefix}")
+    local_to_s3_key_list = []
     for file_local_path, file_s3_path in files_to_upload:
+        # S3 keys always use "/" as the separator
+        file_s3_path = pathlib.Path(file_s3_path).as_posix()
         file_prefix = prefix + "/" + file_s3_path if len(prefix) > 0 else file_s3_path
         if dry_run:
             logger.log(20, f"Will upload {file_local_path} to s3://{bucket}/{file_prefix}")
         else:
-            file_prefix = os.path.dirname(file_prefix)
-            upload_file(
-                file_name=file_local_path,
-                bucket=bucket,
-                prefix=file_prefix if len(file_prefix) > 0 else None
-            )
+            local_to_s3_key_list.append((file_local_path, file_prefix))
+    if local_to_s3_key_list:
+        s3_client = _get_s3_client(max_pool_connections=max_workers * S3_MAX_CONCURRENCY_PER_OBJECT)
+        num_uploaded = sum(_execute_in_threads(
+            fn=lambda local_path, key: _upload_file(s3_client=s3_client, local_path=local_path, bucket=bucket, key=key,
+                                                    skip_if_matching=skip_if_matching),
+            args_list=local_to_s3_key_list,
+            max_workers=max_workers,
+        ))
+        if verbose and skip_if_matching:
+            logger.log(20, f"Uploaded {num_uploaded} objects, skipped {len(local_to_s3_key_list) - num_uploaded} objects already matching in S3")
 
 
 # TODO: v1.0: Consider changing all instances of `local_path` to `local_prefix`.
@@ -140,6 +163,8 @@ def download_s3_folder(
     delete_if_exists: bool = False,
     dry_run: bool = False,
     verbose: bool = True,
+    max_workers: int = S3_MAX_WORKERS,
+    skip_if_matching: bool = False,
     **kwargs
 ):
     """
@@ -182,6 +207,11 @@ def download_s3_folder(
         If True, will isntead log every file that will be downloaded and every directory that will be created
     verbose: bool, default = True
         Whether to log detailed loggings
+    max_workers: int, default = S3_MAX_WORKERS
+        The maximum number of files downloaded concurrently.
+    skip_if_matching: bool, default = False
+        If True, objects whose local file already exists with the same size and checksum (ETag) are not downloaded again.
+        Only relevant if `error_if_exists=False` and `delete_if_exists=False`.
     **kwargs
         Optional arguments to `list_bucket_prefix_suffix_contains_s3` that allow
         more control of which objects are considered.
@@ -199,7 +229,7 @@ def download_s3_folder(
         if delete_if_exists:
             logger.warning(f"Will delete {local_path} and all its content within because this folder already exists and `delete_if_exists` = `True`")
             shutil.rmtree(local_path)
-    download_s3_files(s3_to_local_tuple_list=s3_to_local_tuple_list, dry_run=dry_run)
+    download_s3_files(s3_to_local_tuple_list=s3_to_local_tuple_list, dry_run=dry_run, max_workers=max_workers, skip_if_matching=skip_if_matching)
 
 
 def get_s3_to_local_tuple_list_from_s3_folder(*,
@@ -288,7 +318,8 @@ def download_s3_file(*,
                      s3_bucket: Optional[str] = None,
                      s3_prefix: Optional[str] = None,
                      mkdir: bool = True,
-                     dry_run: bool = False):
+                     dry_run: bool = False,
+                     skip_if_matching: bool = False):
     """
     Download a file from s3 to local.
 
@@ -318,6 +349,8 @@ def download_s3_file(*,
     dry_run : bool, default = False
         If True, will not make directories and download the file but instead log what would have occurred.
         This is useful for testing the function before committing to the download.
+    skip_if_matching : bool, default = False
+        If True, the download is skipped if `local_path` already exists with the same size and checksum (ETag) as the S3 object.
     """
     if s3_path is not None:
         if s3_bucket is not None or s3_prefix is not None:
@@ -331,23 +364,126 @@ def download_s3_file(*,
     if dry_run:
         logger.log(20, f'Dry Run: Would download S3 file "{s3_path}" to "{local_path}"')
     else:
-        import boto3
         if mkdir:
             directory = os.path.dirname(local_path)
             if directory not in ['', '.']:
                 pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
-        s3 = boto3.resource('s3')
-        s3.Bucket(s3_bucket).download_file(s3_prefix, local_path)
+        _download_file(s3_client=_get_s3_client(), bucket=s3_bucket, key=s3_prefix, local_path=local_path, skip_if_matching=skip_if_matching)
 
 
-def download_s3_files(*, s3_to_local_tuple_list: List[Tuple[str, str]], dry_run: bool = False):
+def download_s3_files(*,
+                      s3_to_local_tuple_list: List[Tuple[str, str]],
+                      dry_run: bool = False,
+                      max_workers: int = S3_MAX_WORKERS,
+                      skip_if_matching: bool = False):
     """
-    For (s3_path, local_path) in `s3_to_local_tuple_list`, call `download_s3_file`.
+    For (s3_path, local_path) in `s3_to_local_tuple_list`, download the file as in `download_s3_file`.
+    Files are downloaded concurrently by up to `max_workers` threads, large files are downloaded in concurrent ranged parts.
+    If `skip_if_matching`, files whose `local_path` already matches the S3 object in size and checksum (ETag) are not downloaded.
     """
     for s3_path, _ in s3_to_local_tuple_list:
         assert is_s3_url(path=s3_path), f'S3 path is not a valid S3 URL: "{s3_path}"'
-    for s3_path, local_path in s3_to_local_tuple_list:
-        download_s3_file(s3_path=s3_path, local_path=local_path, mkdir=True, dry_run=dry_run)
+    if dry_run:
+        for s3_path, local_path in s3_to_local_tuple_list:
+            download_s3_file(s3_path=s3_path, local_path=local_path, mkdir=True, dry_run=dry_run)
+        return
+    if not s3_to_local_tuple_list:
+        return
+    for directory in {os.path.dirname(local_path) for _, local_path in s3_to_local_tuple_list}:
+        if directory not in ['', '.']:
+            pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+    s3_client = _get_s3_client(max_pool_connections=max_workers * S3_MAX_CONCURRENCY_PER_OBJECT)
+
+    def _download(s3_path: str, local_path: str) -> bool:
+        bucket, key = s3_path_to_bucket_prefix(s3_path=s3_path)
+        return _download_file(s3_client=s3_client, bucket=bucket, key=key, local_path=local_path, skip_if_matching=skip_if_matching)
+
+    num_downloaded = sum(_execute_in_threads(fn=_download, args_list=s3_to_local_tuple_list, max_workers=max_workers))
+    if skip_if_matching:
+        logger.log(15, f"Downloaded {num_downloaded} objects, skipped {len(s3_to_local_tuple_list) - num_downloaded} objects already matching locally")
+
+
+def _get_s3_client(max_pool_connections: int = S3_MAX_CONCURRENCY_PER_OBJECT):
+    """
+    Returns a S3 client retrying failed requests up to `S3_MAX_ATTEMPTS` times with exponential backoff.
+    The client is thread-safe and can be shared by concurrent transfers,
+    `max_pool_connections` should be at least the number of concurrent requests.
+    """
+    import boto3
+    from botocore.config import Config
+    config = Config(
+        retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': 'standard'},
+        max_pool_connections=max_pool_connections,
+    )
+    return boto3.client('s3', config=config)
+
+
+def _get_s3_transfer_config():
+    """Returns the config of managed transfers, splitting objects larger than `S3_MULTIPART_CHUNKSIZE` into concurrent parts."""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_CHUNKSIZE,
+        multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=S3_MAX_CONCURRENCY_PER_OBJECT,
+    )
+
+
+def _download_file(s3_client, bucket: str, key: str, local_path: str, skip_if_matching: bool = False) -> bool:
+    """Downloads the S3 object to `local_path`, returns False if the download was skipped as the local file already matches."""
+    if skip_if_matching and os.path.isfile(local_path):
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+        if _is_local_file_matching_s3_object(local_path=local_path, size=head['ContentLength'], etag=head['ETag']):
+            return False
+    s3_client.download_file(bucket, key, local_path, Config=_get_s3_transfer_config())
+    return True
+
+
+def _upload_file(s3_client, local_path: str, bucket: str, key: str, skip_if_matching: bool = False) -> bool:
+    """Uploads `local_path` to the S3 object, returns False if the upload was skipped as the S3 object already matches."""
+    if skip_if_matching:
+        from botocore.exceptions import ClientError
+        try:
+            head = s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ['404', 'NoSuchKey', 'NotFound']:
+                raise
+        else:
+            if _is_local_file_matching_s3_object(local_path=local_path, size=head['ContentLength'], etag=head['ETag']):
+                return False
+    s3_client.upload_file(local_path, bucket, key, Config=_get_s3_transfer_config())
+    return True
+
+
+def _is_local_file_matching_s3_object(local_path: str, size: int, etag: str) -> bool:
+    """
+    Returns True if the local file has the size and the ETag of the S3 object.
+    The ETag of an object uploaded in a single part is the MD5 of its content, the ETag of an object uploaded in N parts
+    is the MD5 of the concatenated MD5s of its parts followed by "-N". Multipart ETags can only be matched
+    if the object was uploaded with parts of `S3_MULTIPART_CHUNKSIZE` bytes, as done by the functions of this module.
+    ETags of objects encrypted with SSE-KMS are not MD5s and never match, in which case the object is transferred.
+    """
+    if os.path.getsize(local_path) != size:
+        return False
+    etag = etag.strip('"')
+    md5 = hashlib.md5()
+    part_md5s = []
+    with open(local_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(S3_MULTIPART_CHUNKSIZE), b''):
+            md5.update(chunk)
+            part_md5s.append(hashlib.md5(chunk).digest())
+    if '-' in etag:
+        return f'{hashlib.md5(b"".join(part_md5s)).hexdigest()}-{len(part_md5s)}' == etag
+    return md5.hexdigest() == etag
+
+
+def _execute_in_threads(fn, args_list: List[tuple], max_workers: int) -> list:
+    """Returns `[fn(*args) for args in args_list]`, computed by up to `max_workers` threads. Raises the first exception raised by `fn`."""
+    max_workers = max(1, min(max_workers, len(args_list)))
+    if max_workers == 1:
+        return [fn(*args) for args in args_list]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fn, *args) for args in args_list]
+        return [future.result() for future in futures]
 
 
 def _get_local_objs_to_upload_and_s3_prefix(folder_to_upload: str) -> List[Tuple[str, str]]:
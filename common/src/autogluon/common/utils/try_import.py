@@ -19,6 +19,9 @@ __all__ = [
     'try_import_rapids_cuml',
     'try_import_imodels',
     'try_import_fasttext',
+    'try_import_pyarrow',
+    'try_import_zstandard',
+    'try_import_lz4',
 ]
 
 logger = logging.getLogger(__name__)
@@ -264,3 +267,33 @@ def try_import_fasttext():
         _ = fasttext.__file__
     except Exception:
         raise ImportError('Import fasttext failed. Please run "pip install fasttext"')
+
+
+def try_import_pyarrow() -> ModuleType:
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError(
+            "Unable to import dependency pyarrow. "
+            "A quick tip is to install via `pip install pyarrow`. ")
+
+
+def try_import_zstandard() -> ModuleType:
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ImportError(
+            "Unable to import dependency zstandard, required for `compression_fn='zstd'`. "
+            "A quick tip is to install via `pip install zstandard`. ")
+
+
+def try_import_lz4() -> ModuleType:
+    try:
+        import lz4.frame
+        return lz4
+    except ImportError:
+        raise ImportError(
+            "Unable to import dependency lz4, required for `compression_fn='lz4'`. "
+            "A quick tip is to install via `pip install lz4`. ")
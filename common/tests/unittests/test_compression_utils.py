@@ -1,3 +1,7 @@
+import os
+
+import pytest
+
 from autogluon.common.utils import compression_utils
 
 
@@ -70,5 +74,66 @@ def test_get_compression_map():
             'open': compression_utils._lzma_open,
             'extension': 'lzma',
         },
+        'zstd': {
+            'compress': compression_utils._zstd_compress,
+            'decompress': compression_utils._zstd_decompress,
+            'extension': 'zst',
+        },
+        'lz4': {
+            'compress': compression_utils._lz4_compress,
+            'decompress': compression_utils._lz4_decompress,
+            'extension': 'lz4',
+        },
     }
     assert compression_utils.get_compression_map() == expected_compression_fn_map
+
+
+def _get_framed_test_object():
+    import numpy as np
+    import pandas as pd
+    df = pd.DataFrame({'a': np.arange(100000), 'b': np.random.rand(100000), 'c': ['x', 'y'] * 50000})
+    return dict(df=df, array=np.random.rand(1000, 30), non_contiguous=np.random.rand(100, 100)[:, ::2], empty=np.array([]), name='model')
+
+
+def _assert_framed_test_object_equal(obj, obj_loaded):
+    import numpy as np
+    import pandas as pd
+    pd.testing.assert_frame_equal(obj['df'], obj_loaded['df'])
+    for key in ['array', 'non_contiguous', 'empty']:
+        np.testing.assert_array_equal(obj[key], obj_loaded[key])
+    assert obj_loaded['name'] == obj['name']
+    # Arrays loaded from out-of-band buffers are writable
+    obj_loaded['array'][0, 0] = 1
+
+
+def test_pickle_framed(monkeypatch):
+    import io
+    import zlib
+    # Exercise the frame layout with a standard library codec and frames smaller than the arrays
+    monkeypatch.setitem(compression_utils.compression_fn_map, 'zlib_test', {
+        'compress': lambda data, level=1: zlib.compress(data, level),
+        'decompress': zlib.decompress,
+        'extension': 'zz',
+    })
+    monkeypatch.setattr(compression_utils, '_FRAME_SIZE', 100000)
+    obj = _get_framed_test_object()
+    fout = io.BytesIO()
+    compression_utils.dump_pickle_framed(obj, fout, compression_fn='zlib_test', max_workers=2)
+    obj_loaded = compression_utils.load_pickle_framed(io.BytesIO(fout.getvalue()), compression_fn='zlib_test', max_workers=2)
+    _assert_framed_test_object_equal(obj, obj_loaded)
+
+    with pytest.raises(ValueError):
+        compression_utils.load_pickle_framed(io.BytesIO(b'not a framed pickle'), compression_fn='zlib_test')
+
+
+@pytest.mark.parametrize('compression_fn,module', [('zstd', 'zstandard'), ('lz4', 'lz4')])
+def test_save_load_pkl_framed(compression_fn, module, tmp_path):
+    pytest.importorskip(module)
+    from autogluon.common.loaders import load_pkl
+    from autogluon.common.savers import save_pkl
+    obj = _get_framed_test_object()
+    path = str(tmp_path / 'obj.pkl')
+    save_pkl.save(path=path, object=obj, compression_fn=compression_fn)
+    assert os.path.exists(compression_utils.get_validated_path(path, compression_fn))
+    obj_loaded = load_pkl.load(path=path, compression_fn=compression_fn)
+    _assert_framed_test_object_equal(obj, obj_loaded)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.common.features.infer_types import get_type_map_special, get_types_special, infer_datetime_format
+
+
+def _get_special_types_data(num_rows: int = 6000) -> pd.DataFrame:
+    rng = np.random.RandomState(0)
+    dates = pd.date_range('2020-01-01', periods=num_rows, freq='h')
+    data = {
+        'datetime_iso': dates.strftime('%Y-%m-%d %H:%M:%S'),
+        'datetime_month_name': dates.strftime('%d %B %Y'),
+        'datetime_mixed_formats': np.where(np.arange(num_rows) % 2 == 0, dates.strftime('%Y-%m-%d'), dates.strftime('%b %d, %Y')),
+        'datetime_mostly_nan': np.where(np.arange(num_rows) % 10 == 0, dates.strftime('%Y-%m-%d'), None),
+        'numeric_str': rng.randint(0, 1000, num_rows).astype(str),
+        'ids': np.char.add('id_', np.arange(num_rows).astype(str)),
+        'text': [' '.join(rng.choice(['a', 'bb', 'ccc', 'dddd'], 5)) for _ in range(num_rows)],
+        'category': rng.choice(['x', 'y', 'z'], num_rows),
+        'all_nan': [None] * num_rows,
+        'int': np.arange(num_rows),
+    }
+    return pd.DataFrame({column: pd.Series(values, dtype=None if column == 'int' else object) for column, values in data.items()})
+
+
+@pytest.mark.parametrize('num_workers', [1, 2])
+def test_get_type_map_special(num_workers):
+    X = _get_special_types_data()
+    expected_type_map_special = {
+        'datetime_iso': ['datetime_as_object'],
+        'datetime_month_name': ['datetime_as_object'],
+        'datetime_mixed_formats': ['datetime_as_object'],
+        'text': ['text'],
+    }
+    assert get_type_map_special(X, num_workers=num_workers) == expected_type_map_special
+    # The single column checks are consistent with the checks of the DataFrame sample
+    for column in X:
+        assert get_types_special(X[column]) == expected_type_map_special.get(column, [])
+
+
+def test_infer_datetime_format():
+    X = _get_special_types_data(num_rows=1000)
+    assert infer_datetime_format(X['datetime_iso']) == '%Y-%m-%d %H:%M:%S'
+    assert infer_datetime_format(X['datetime_month_name']) == '%d %B %Y'
+    assert infer_datetime_format(X['datetime_mostly_nan']) == '%Y-%m-%d'
+    assert infer_datetime_format(X['datetime_mixed_formats']) is None
+    assert infer_datetime_format(X['ids']) is None
+    assert infer_datetime_format(X['all_nan']) is None
+
+
+def test_get_type_map_special_sorted_data():
+    # Mid-size columns whose first rows are not representative of the column are still checked on a random sample of rows
+    num_rows = 2000
+    dates = pd.Series(pd.date_range('2020-01-01', periods=num_rows, freq='h').strftime('%Y-%m-%d %H:%M:%S'), dtype=object)
+    rng = np.random.RandomState(0)
+    text = pd.Series([' '.join(rng.choice(['a', 'bb', 'ccc', 'dddd'], 5)) for _ in range(num_rows)], dtype=object)
+    X = pd.DataFrame({
+        'datetime_leading_nan': dates.where(np.arange(num_rows) >= 700, None),
+        'datetime_leading_text': text.where(np.arange(num_rows) < 1000, dates),
+    })
+    expected_type_map_special = {
+        'datetime_leading_nan': ['datetime_as_object'],
+        'datetime_leading_text': ['datetime_as_object'],
+    }
+    assert get_type_map_special(X) == expected_type_map_special
+    for column in X:
+        assert get_types_special(X[column]) == expected_type_map_special[column]
+
+
+def test_infer_datetime_format_matches_parsing_without_format():
+    num_rows = 1000
+    # The first sampled value is AM, values are in the AM and PM hours
+    dates = pd.Series(pd.date_range('1990-03-14 10:00', periods=num_rows, freq='7h'))
+    # AM/PM is parsed with a 12-hour clock
+    X_am_pm = pd.Series(dates.dt.strftime('%Y/%m/%d %I:%M %p'), dtype=object)
+    assert infer_datetime_format(X_am_pm) == '%Y/%m/%d %I:%M %p'
+    assert (pd.to_datetime(X_am_pm, format='%Y/%m/%d %I:%M %p') == dates).all()
+    # Ambiguous day-first values are parsed month-first without a format
+    assert infer_datetime_format(pd.Series(dates.dt.strftime('%d/%m/%Y'), dtype=object)) is None
+    assert infer_datetime_format(pd.Series(dates.dt.strftime('%d.%m.%Y %H:%M'), dtype=object)) is None
+    # Formats matching too few values are not used
+    X_mixed = pd.Series(np.where(np.arange(num_rows) % 2 == 0, dates.dt.strftime('%Y-%m-%d'), dates.dt.strftime('%b %d, %Y')), dtype=object)
+    assert infer_datetime_format(X_mixed) is None
+
+
+def test_get_types_special_datetime_with_unknown_values():
+    num_rows = 1000
+    dates = pd.Series(pd.date_range('2017-01-01', periods=num_rows, freq='D').strftime('%Y%m%d'), dtype=object)
+    X = dates.where(np.arange(num_rows) % 2 == 0, 'unknown')
+    assert get_types_special(X) == ['datetime_as_object']
+    assert get_type_map_special(pd.DataFrame({'datetime': X})) == {'datetime': ['datetime_as_object']}
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.common.loaders import load_pd
+
+
+def _get_data():
+    return pd.DataFrame({
+        'a': np.arange(10),
+        'b': list('xyzxyzxyzx'),
+        'c': np.linspace(0, 1, 10),
+    })
+
+
+def test_load_csv_columns_to_keep_and_predicate_filters(tmp_path):
+    df = _get_data()
+    path = str(tmp_path / 'data.csv')
+    df.to_csv(path, index=False)
+
+    # Predicates can reference columns that are not kept
+    df_loaded = load_pd.load(path, columns_to_keep=['c', 'a'], filters=[('a', '>=', 3), ('b', 'in', ['x', 'y'])])
+    df_expected = df[(df['a'] >= 3) & df['b'].isin(['x', 'y'])][['c', 'a']]
+    pd.testing.assert_frame_equal(df_loaded, df_expected)
+
+    # A list of lists of predicates is a disjunction of conjunctions
+    df_loaded = load_pd.load(path, filters=[[('a', '<', 2)], [('b', '==', 'z'), ('a', '!=', 5)]])
+    assert df_loaded['a'].tolist() == [0, 1, 2, 8]
+
+    # Callable filters are applied after the predicates
+    df_loaded = load_pd.load(path, filters=[lambda d: d[d['a'] > 5], ('b', 'not in', ['x'])])
+    assert df_loaded['a'].tolist() == [7, 8]
+
+
+def test_load_invalid_filters(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    _get_data().to_csv(path, index=False)
+    with pytest.raises(ValueError):
+        load_pd.load(path, filters=[('a', '~', 1)])
+    with pytest.raises(ValueError):
+        load_pd.load(path, filters=[('a', '>', 1), [('a', '<', 5)]])
+
+
+def test_load_parquet_arrow(tmp_path):
+    pytest.importorskip('pyarrow')
+    df = _get_data()
+    paths = [str(tmp_path / 'part-0.parquet'), str(tmp_path / 'part-1.parquet')]
+    df.iloc[:5].to_parquet(paths[0], index=False)
+    df.iloc[5:].to_parquet(paths[1], index=False)
+
+    df_loaded = load_pd.load(paths, columns_to_keep=['a', 'b'], filters=[('c', '>', 0.3)], dictionary_as_category=True)
+    assert df_loaded.columns.tolist() == ['a', 'b']
+    assert df_loaded['a'].tolist() == [3, 4, 5, 6, 7, 8, 9]
+    assert df_loaded['b'].dtype.name == 'category'
+
+
+def test_load_parquet_arrow_columns_to_keep_index(tmp_path):
+    pytest.importorskip('pyarrow')
+    df = _get_data()
+    df.index = pd.Index([f'row_{i}' for i in range(len(df))], name='row')
+    path = str(tmp_path / 'data.parquet')
+    df.to_parquet(path, engine='pyarrow')
+
+    # The stored index is restored when only some columns are loaded
+    df_loaded = load_pd.load(path, columns_to_keep=['c', 'a'])
+    df_expected = pd.read_parquet(path, columns=['c', 'a'], engine='pyarrow')
+    pd.testing.assert_frame_equal(df_loaded, df_expected)
+    assert df_loaded.index.tolist() == df.index.tolist()
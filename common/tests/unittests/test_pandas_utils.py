@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from autogluon.common.utils import pandas_utils
+from autogluon.common.utils.pandas_utils import DataFrameMemoryProfile, get_approximate_df_mem_usage
+
+
+def _get_data(num_rows: int = 1000) -> pd.DataFrame:
+    rng = np.random.RandomState(0)
+    return pd.DataFrame({
+        'int': np.arange(num_rows),
+        'float': rng.rand(num_rows),
+        'object': rng.choice(['a', 'bb', 'ccc'], num_rows).astype(object),
+        'category': pd.Series(rng.choice(['x', 'y', 'z'], num_rows), dtype='category'),
+    })
+
+
+def test_get_approximate_df_mem_usage_cached():
+    X = _get_data()
+    memory_usage_uncached = pandas_utils._get_approximate_df_mem_usage(X)
+    memory_usage = get_approximate_df_mem_usage(X)
+    assert list(memory_usage.index) == ['Index'] + list(X.columns)
+    for column in memory_usage.index:
+        assert np.isclose(memory_usage[column], memory_usage_uncached[column])
+    assert DataFrameMemoryProfile.from_df(X) is DataFrameMemoryProfile.from_df(X)
+    pd.testing.assert_series_equal(get_approximate_df_mem_usage(X), memory_usage)
+
+
+def test_data_memory_profile_incremental(monkeypatch):
+    X = _get_data()
+    memory_profile = DataFrameMemoryProfile()
+    memory_usage = get_approximate_df_mem_usage(X, memory_profile=memory_profile)
+
+    columns_scanned = []
+    _get_approximate_df_mem_usage = pandas_utils._get_approximate_df_mem_usage
+
+    def _get_approximate_df_mem_usage_tracked(df, **kwargs):
+        columns_scanned.extend(df.columns)
+        return _get_approximate_df_mem_usage(df, **kwargs)
+    monkeypatch.setattr(pandas_utils, '_get_approximate_df_mem_usage', _get_approximate_df_mem_usage_tracked)
+
+    # Row subsets are estimated from the profile without scanning the data
+    X_subset = X.iloc[:500]
+    memory_usage_subset = get_approximate_df_mem_usage(X_subset, memory_profile=memory_profile)
+    assert columns_scanned == []
+    assert memory_usage_subset['float'] == X_subset['float'].memory_usage(index=False)
+    assert memory_usage_subset['object'] == memory_usage['object'] / 2
+
+    # Only added columns and columns whose dtype changed are scanned
+    X_new = X.drop(columns=['int'])
+    X_new['new'] = X['float'] * 2
+    X_new['object'] = X_new['object'].astype('category')
+    memory_usage_new = get_approximate_df_mem_usage(X_new, memory_profile=memory_profile)
+    assert columns_scanned == ['object', 'new']
+    assert list(memory_usage_new.index) == ['Index'] + list(X_new.columns)
+
+
+def test_get_approximate_df_mem_usage_object_index():
+    X = _get_data()
+    X.index = X.index.astype(str)
+    # Strings of an object index are counted, as in `DataFrame.memory_usage(deep=True)`
+    assert get_approximate_df_mem_usage(X)['Index'] == X.index.memory_usage(deep=True)
+    assert get_approximate_df_mem_usage(X)['Index'] > X.index.memory_usage()
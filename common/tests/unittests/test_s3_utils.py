@@ -1,8 +1,10 @@
+from autogluon.common.utils import s3_utils
 from autogluon.common.utils.s3_utils import get_s3_to_local_tuple_list, _get_local_path_to_download_objs, _get_local_objs_to_upload_and_s3_prefix
 
 import pytest
 import tempfile
 import os
+import pathlib
 
 
 @pytest.mark.parametrize(
@@ -85,3 +87,55 @@ def test_get_local_objs_to_upload_and_s3_prefix_empty():
     with tempfile.TemporaryDirectory() as temp_dir:
         result = _get_local_objs_to_upload_and_s3_prefix(folder_to_upload=temp_dir)
         assert len(result) == 0
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    moto = pytest.importorskip('moto')
+    import boto3
+    for key, value in dict(AWS_ACCESS_KEY_ID='testing', AWS_SECRET_ACCESS_KEY='testing', AWS_SESSION_TOKEN='testing',
+                           AWS_DEFAULT_REGION='us-east-1').items():
+        monkeypatch.setenv(key, value)
+    # Transfer the large test file in multiple parts (S3 requires parts of at least 5 MB)
+    monkeypatch.setattr(s3_utils, 'S3_MULTIPART_CHUNKSIZE', 5 * 1024 * 1024)
+    with moto.mock_aws():
+        bucket = 'test-bucket'
+        boto3.client('s3').create_bucket(Bucket=bucket)
+        yield bucket
+
+
+def test_upload_and_download_s3_folder(s3_bucket, tmp_path):
+    import boto3
+    folder = tmp_path / 'upload'
+    os.makedirs(folder / 'dir1')
+    contents = {
+        'small.txt': b'abc',
+        'empty.txt': b'',
+        os.path.join('dir1', 'large.bin'): os.urandom(11 * 1024 * 1024),
+    }
+    for file, content in contents.items():
+        with open(folder / file, 'wb') as f:
+            f.write(content)
+
+    s3_utils.upload_s3_folder(bucket=s3_bucket, prefix='foo/', folder_to_upload=str(folder), max_workers=4)
+    # The multipart ETag of the large file and the MD5 ETags of the other files match the local files
+    s3_client = boto3.client('s3')
+    for file in contents:
+        head = s3_client.head_object(Bucket=s3_bucket, Key='foo/' + pathlib.Path(file).as_posix())
+        assert s3_utils._is_local_file_matching_s3_object(local_path=str(folder / file), size=head['ContentLength'], etag=head['ETag'])
+    assert '-' in s3_client.head_object(Bucket=s3_bucket, Key='foo/dir1/large.bin')['ETag']
+
+    local_path = tmp_path / 'download'
+    s3_utils.download_s3_folder(bucket=s3_bucket, prefix='foo/', local_path=str(local_path), max_workers=4)
+    for file, content in contents.items():
+        with open(local_path / file, 'rb') as f:
+            assert f.read() == content
+
+    # Files matching the S3 objects are not downloaded again, modified files are
+    with open(local_path / 'small.txt', 'wb') as f:
+        f.write(b'abd')
+    mtime_large = os.path.getmtime(local_path / 'dir1' / 'large.bin')
+    s3_utils.download_s3_folder(bucket=s3_bucket, prefix='foo/', local_path=str(local_path), error_if_exists=False, skip_if_matching=True)
+    with open(local_path / 'small.txt', 'rb') as f:
+        assert f.read() == b'abc'
+    assert os.path.getmtime(local_path / 'dir1' / 'large.bin') == mtime_large
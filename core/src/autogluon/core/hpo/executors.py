@@ -19,6 +19,7 @@ from .exceptions import EmptySearchSpace
 from ..ray.resources_calculator import ResourceCalculator
 from ..scheduler.scheduler_factory import scheduler_factory
 from ..utils.savers import save_pkl
+from ..utils.shared_memory import SharedMemoryObject
 
 from typing import TYPE_CHECKING
 
@@ -53,6 +54,11 @@ class HpoExecutor(ABC):
     def time_limit(self, value):
         self._time_limit = value
 
+    @property
+    def runs_trials_in_parallel(self) -> bool:
+        """Whether the executor can run multiple trials at once, in which case resources per trial are a fraction of the total resources"""
+        return True
+
     @abstractmethod
     def initialize(
             self,
@@ -209,15 +215,13 @@ class HpoExecutor(ABC):
                     num_trials_in_parallel = 1
                 else:
                     num_trials_in_parallel = num_jobs_in_parallel // k_fold
-                if self.executor_type == 'custom':
-                    # custom backend runs sequentially
+                if not self.runs_trials_in_parallel:
                     num_trials_in_parallel = 1
                 cpu_per_trial = int(num_cpus // num_trials_in_parallel)
                 gpu_per_trial = num_gpus // num_trials_in_parallel
             else:
                 num_trials = self.hyperparameter_tune_kwargs.get('num_trials', math.inf)
-                if self.executor_type == 'custom':
-                    # custom backend runs sequentially
+                if not self.runs_trials_in_parallel:
                     num_jobs_in_parallel = 1
                 cpu_per_trial = int(num_cpus // min(num_jobs_in_parallel, num_trials))
                 gpu_per_trial = num_gpus / min(num_jobs_in_parallel, num_trials)
@@ -340,6 +344,8 @@ class RayHpoExecutor(HpoExecutor):
     }
     custom_to_ray_scheduler_preset_map = {
         'local': 'FIFO',
+        'local_parallel': 'FIFO',
+        'local_asha': 'ASHA',
     }
     custom_to_ray_searcher_preset_map = {
         'local_random': 'random',
@@ -487,10 +493,17 @@ class CustomHpoExecutor(HpoExecutor):
         super().__init__()
         self.scheduler_options = None
         self.scheduler = None
+        self._shared_data = None
         
     @property
     def executor_type(self):
         return CUSTOM_BACKEND
+
+    @property
+    def runs_trials_in_parallel(self):
+        if self.scheduler_options is None:
+            return False
+        return getattr(self.scheduler_options[0], 'runs_trials_in_parallel', False)
     
     @property
     def time_limit(self):
@@ -524,10 +537,21 @@ class CustomHpoExecutor(HpoExecutor):
         assert self.scheduler_options is not None, 'Call `initialize()` before register resources'
         super().register_resources(initialized_model, **kwargs)
         if self.hyperparameter_tune_kwargs.get('resources_per_trial', None) is not None:
-            # Custom backend only run trials sequentially
             self.scheduler_options[1]['resource'] = self.hyperparameter_tune_kwargs['resources_per_trial']
+        if self.runs_trials_in_parallel:
+            self.scheduler_options[1]['total_resource'] = self.resources.copy()
         logger.debug(f'custom backend resource: {self.resources}, per trial resource: {self.hyperparameter_tune_kwargs}')
         
+    def prepare_data(self, X, y, X_val, y_val, path_prefix):
+        train_path, val_path = super().prepare_data(X=X, y=y, X_val=X_val, y_val=y_val, path_prefix=path_prefix)
+        if self.runs_trials_in_parallel and not is_s3_url(path_prefix):
+            # Parallel trials load the data from shared memory instead of each unpickling a copy from disk
+            self._shared_data = {
+                train_path: SharedMemoryObject((X, y)),
+                val_path: SharedMemoryObject((X_val, y_val)),
+            }
+        return train_path, val_path
+
     def validate_search_space(self, search_space, model_name):
         if not any(isinstance(search_space[hyperparam], space.Space) for hyperparam in search_space):
             logger.warning(f"\tNo hyperparameter search space specified for {model_name}. Skipping HPO. "
@@ -545,11 +569,19 @@ class CustomHpoExecutor(HpoExecutor):
         if scheduler_cls is None or scheduler_params is None:
             raise ValueError("scheduler_cls and scheduler_params cannot be None for hyperparameter tuning")
         train_fn_kwargs['fit_kwargs'].update(scheduler_params['resource'].copy())
+        if self._shared_data is not None:
+            train_fn_kwargs['shared_data'] = self._shared_data
         scheduler = scheduler_cls(model_trial, search_space=self.search_space, train_fn_kwargs=train_fn_kwargs, **scheduler_params)
         self.scheduler = scheduler
         
-        scheduler.run()
-        scheduler.join_jobs()
+        try:
+            scheduler.run()
+            scheduler.join_jobs()
+        finally:
+            if self._shared_data is not None:
+                for shared_object in self._shared_data.values():
+                    shared_object.unlink()
+                self._shared_data = None
     
     def report(self, reporter, **kwargs):
         assert reporter is not None
@@ -45,13 +45,17 @@ class Scorer(object, metaclass=ABCMeta):
     kwargs : dict, optional
         kwargs to pass to score_func when called.
         For example, kwargs = {"beta": 2} when using sklearn.metrics.fbeta_score where beta is a required argument.
+    score_func_multi : callable, optional
+        Vectorized version of score_func scoring the predictions of multiple models at once, used by `score_multi`.
+        Called with y_true and the predictions of the models stacked along the first axis, returns an array of the metric value of each model.
     """
-    def __init__(self, name: str, score_func: callable, optimum: float, sign: int, kwargs: dict = None):
+    def __init__(self, name: str, score_func: callable, optimum: float, sign: int, kwargs: dict = None, score_func_multi: callable = None):
         self.name = name
         if kwargs is None:
             kwargs = dict()
         self._kwargs = kwargs
         self._score_func = score_func
+        self._score_func_multi = score_func_multi
         self._optimum = optimum
         if sign != 1 and sign != -1:
             raise ValueError(f'sign must be one of [1, -1], but was instead {sign}')
@@ -93,6 +97,33 @@ class Scorer(object, metaclass=ABCMeta):
 
         return self._score(y_true=y_true, y_pred=y_pred, **k)
 
+    def score_multi(self, y_true, y_pred, sample_weight=None, **kwargs) -> np.ndarray:
+        """
+        Evaluate the predictions of multiple models relative to y_true.
+        If the metric has a vectorized implementation, all models are scored in a single call, otherwise each model is scored in turn.
+
+        Parameters
+        ----------
+        y_true : array-like
+            Gold standard target values for X.
+        y_pred : np.ndarray, [n_models x n_samples] or [n_models x n_samples x n_classes]
+            Model predictions stacked along the first axis, each in the format expected by `__call__`.
+        sample_weight : array-like, optional (default=None)
+            Sample weights.
+        **kwargs :
+            Keyword arguments passed to the inner metric __call__ method.
+
+        Returns
+        -------
+        scores : np.ndarray
+            Score of each model.
+        """
+        # Scorers pickled prior to the addition of score_func_multi lack the attribute
+        score_func_multi = getattr(self, '_score_func_multi', None)
+        if score_func_multi is not None and sample_weight is None and not kwargs and not self._kwargs:
+            return self._sign * score_func_multi(np.asarray(y_true), np.asarray(y_pred))
+        return np.array([self(y_true, y_pred_model, sample_weight=sample_weight, **kwargs) for y_pred_model in y_pred])
+
     def error(self, *args, **kwargs) -> float:
         """
         Returns error in lower_is_better format.
@@ -342,6 +373,7 @@ def make_scorer(name,
                 needs_threshold=False,
                 needs_quantile=False,
                 metric_kwargs: dict = None,
+                score_func_multi=None,
                 **kwargs) -> Scorer:
     """Make a scorer from a performance metric or loss function.
 
@@ -379,6 +411,11 @@ def make_scorer(name,
         Additional parameters to be passed to score_func, merged with kwargs if both are present.
         metric_kwargs keys will override kwargs keys if keys are shared between them.
 
+    score_func_multi : callable, default=None
+        Vectorized version of score_func with signature ``score_func_multi(y, y_pred_multi)``,
+        where y_pred_multi stacks the predictions of multiple models along the first axis.
+        Returns an array of the metric value of each model. Used by `Scorer.score_multi` to score many models at once.
+
     **kwargs : additional arguments
         Additional parameters to be passed to score_func.
 
@@ -404,22 +441,52 @@ def make_scorer(name,
         optimum=optimum,
         sign=sign,
         kwargs=kwargs,
+        score_func_multi=score_func_multi,
     )
 
 
+# Vectorized metric functions, scoring the predictions of multiple models stacked along the first axis of y_pred
+def _r2_multi(y_true, y_pred):
+    numerator = ((y_pred - y_true) ** 2).sum(axis=1)
+    denominator = ((y_true - y_true.mean()) ** 2).sum()
+    if denominator == 0:
+        # Consistent with sklearn for constant y_true
+        return np.where(numerator == 0, 1.0, 0.0)
+    return 1 - numerator / denominator
+
+
+def _mse_multi(y_true, y_pred):
+    return ((y_pred - y_true) ** 2).mean(axis=1)
+
+
+def _rmse_multi(y_true, y_pred):
+    return np.sqrt(_mse_multi(y_true, y_pred))
+
+
+def _mae_multi(y_true, y_pred):
+    return np.abs(y_pred - y_true).mean(axis=1)
+
+
+def _accuracy_multi(y_true, y_pred):
+    return (y_pred == y_true).mean(axis=1)
+
+
 # Standard regression scores
 r2 = make_scorer('r2',
-                 sklearn.metrics.r2_score)
+                 sklearn.metrics.r2_score,
+                 score_func_multi=_r2_multi)
 mean_squared_error = make_scorer('mean_squared_error',
                                  sklearn.metrics.mean_squared_error,
                                  optimum=0,
-                                 greater_is_better=False)
+                                 greater_is_better=False,
+                                 score_func_multi=_mse_multi)
 mean_squared_error.add_alias('mse')
 
 mean_absolute_error = make_scorer('mean_absolute_error',
                                   sklearn.metrics.mean_absolute_error,
                                   optimum=0,
-                                  greater_is_better=False)
+                                  greater_is_better=False,
+                                  score_func_multi=_mae_multi)
 mean_absolute_error.add_alias('mae')
 
 median_absolute_error = make_scorer('median_absolute_error',
@@ -464,7 +531,8 @@ def rmse_func(y_true, y_pred, **kwargs):
 root_mean_squared_error = make_scorer('root_mean_squared_error',
                                       rmse_func,
                                       optimum=0,
-                                      greater_is_better=False)
+                                      greater_is_better=False,
+                                      score_func_multi=_rmse_multi)
 root_mean_squared_error.add_alias('rmse')
 
 # Quantile pinball loss
@@ -477,7 +545,7 @@ pinball_loss.add_alias('pinball')
 
 
 # Standard Classification Scores
-accuracy = make_scorer('accuracy', sklearn.metrics.accuracy_score)
+accuracy = make_scorer('accuracy', sklearn.metrics.accuracy_score, score_func_multi=_accuracy_multi)
 accuracy.add_alias('acc')
 
 balanced_accuracy = make_scorer('balanced_accuracy', classification_metrics.balanced_accuracy)
@@ -544,12 +612,42 @@ def customized_log_loss(y_true, y_pred, eps=1e-15):
                                         eps=eps)
 
 
+def customized_log_loss_multi(y_true, y_pred, eps=1e-15):
+    """
+    Vectorized version of `customized_log_loss`, returning the negative log-likelihood of each model.
+
+    Parameters
+    ----------
+    y_true : array-like
+        Ground truth (correct) labels for n_samples samples.
+
+    y_pred : array-like of float
+        The predictions of each model. shape = (n_models, n_samples, n_classes) or (n_models, n_samples)
+
+    eps : float
+        The epsilon
+    """
+    assert y_true.ndim == 1
+    y_pred = np.clip(y_pred.astype(float), eps, 1 - eps)
+    if y_pred.ndim == 2:
+        return - (y_true * np.log(y_pred) + (1 - y_true) * np.log(1 - y_pred)).mean(axis=1)
+    else:
+        assert y_pred.ndim == 3, 'Only ndim=3 is supported'
+        # As in sklearn, the clipped probabilities are normalized to sum to 1 before taking the probability of the true class,
+        # and rows whose label is unknown to the models (encoded as -1) contribute zero loss while still counting towards the mean.
+        y_true = y_true.astype(np.int64)
+        is_known = y_true >= 0
+        y_pred_true = y_pred[:, np.arange(len(y_true)), np.where(is_known, y_true, 0)] / y_pred.sum(axis=2)
+        return - np.where(is_known, np.log(y_pred_true), 0).mean(axis=1)
+
+
 # Score function for probabilistic classification
 log_loss = make_scorer('log_loss',
                        customized_log_loss,
                        optimum=0,
                        greater_is_better=False,
-                       needs_proba=True)
+                       needs_proba=True,
+                       score_func_multi=customized_log_loss_multi)
 log_loss.add_alias('nll')
 
 pac = make_scorer('pac',
@@ -21,6 +21,10 @@ _DEFAULT_TAGS = {
     #  This can get very complex to implement correctly for refit_full.
     #  It is recommended in these scenarios to set `can_refit_full` to False until a correct implementation is added.
     'can_refit_full': False,
+    # Whether the model can construct its internal dataset once from the full bagged training data and select the rows of each fold from it.
+    #  If True, fold models fit sequentially in a bagged ensemble receive the `fold_dataset_cache` and `fold` (train and val row indices) fit kwargs.
+    #  Refer to `autogluon.core.models.ensemble.fold_dataset_cache.FoldDatasetCache` for details.
+    'can_use_fold_dataset_cache': False,
 }
 
 
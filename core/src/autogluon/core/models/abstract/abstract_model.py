@@ -1,11 +1,8 @@
 import copy
-import gc
 import inspect
 import logging
 import math
 import os
-import pickle
-import sys
 import time
 from typing import Any, Dict, Optional, Union
 
@@ -38,6 +35,7 @@ from ...utils import get_pred_from_proba, normalize_pred_probas, infer_eval_metr
     compute_permutation_feature_importance, compute_weighted_metric
 from ...utils.exceptions import TimeLimitExceeded, NoValidFeatures, NotEnoughMemoryError
 from ...utils.loaders import load_pkl
+from ...utils.memory_utils import get_memory_size
 from ...utils.savers import save_json, save_pkl
 from ...utils.time import sample_df_for_time_func, time_func
 
@@ -149,6 +147,7 @@ class AbstractModel:
         self._fit_metadata = dict()
 
         self._compiler = None
+        self._memory_size = None  # Cached output of self.get_memory_size(), reset when the model changes
 
     @classmethod
     def _init_user_params(cls, params: Optional[Dict[str, Any]] = None, ag_args_fit: str = AG_ARGS_FIT, ag_arg_prefix: str = AG_ARG_PREFIX) -> (Dict[str, Any], Dict[str, Any]):
@@ -783,6 +782,12 @@ class AbstractModel:
         feature_metadata : :class:`autogluon.common.features.feature_metadata.FeatureMetadata`, default = None
             Contains feature type information that can be used to identify special features such as text ngrams and datetime as well as which features are numerical vs categorical.
             If None, feature_metadata is inferred during fit.
+        data_memory_profile : :class:`autogluon.common.utils.pandas_utils.DataFrameMemoryProfile`, default = None
+            Memory usage per row of the features, used to estimate the memory usage of the training data without scanning it.
+            If None, the memory usage is estimated from the training data.
+        available_mem_ratio : float, default = 1
+            The share of the available memory the model can use, checked before fitting the model.
+            Lower than 1 when other models are fit at the same time.
         verbosity : int, default = 2
             Verbosity levels range from 0 to 4 and control how much information is printed.
             Higher levels correspond to more detailed print statements (you can set verbosity = 0 to suppress warnings).
@@ -794,6 +799,7 @@ class AbstractModel:
         **kwargs :
             Any additional fit arguments a model supports.
         """
+        self._memory_size = None
         kwargs = self.initialize(**kwargs)  # FIXME: This might have to go before self._preprocess_fit_args, but then time_limit might be incorrect in **kwargs init to initialize
         kwargs = self._preprocess_fit_args(**kwargs)
         if 'time_limit' in kwargs and kwargs['time_limit'] is not None and kwargs['time_limit'] <= 0:
@@ -807,6 +813,7 @@ class AbstractModel:
         if out is None:
             out = self
         out = out._post_fit(**kwargs)
+        out._memory_size = None
         return out
 
     def _post_fit(self, **kwargs):
@@ -1124,7 +1131,7 @@ class AbstractModel:
                 return False
         return True
 
-    def compile(self, compiler_configs=None):
+    def compile(self, compiler_configs=None, X_val=None, y_val=None):
         """
         Compile the trained model for faster inference.
 
@@ -1138,8 +1145,14 @@ class AbstractModel:
             Model specific compiler options.
             This can be useful to specify the compiler backend for a specific model,
             e.g. {"RandomForest": {"compiler": "onnx"}}
+        X_val : DataFrame, default=None
+            Validation data used by lossy compilers (such as quantization) to verify that the score does not regress.
+            Ignored by compilers that do not alter the model predictions.
+        y_val : Series, default=None
+            Validation labels corresponding to `X_val`.
         """
         assert self.is_fit(), "The model must be fit before calling the compile method."
+        self._memory_size = None
         if compiler_configs is None:
             compiler_configs = {}
         compiler = compiler_configs.get("compiler", "native")
@@ -1150,7 +1163,7 @@ class AbstractModel:
                                             compiler_fallback_to_native=compiler_fallback_to_native)
         if self._compiler is not None:
             input_types = self._get_input_types(batch_size=batch_size)
-            self._compile(input_types=input_types)
+            self._compile(input_types=input_types, compiler_configs=compiler_configs, X_val=X_val, y_val=y_val)
 
     def _compile(self, **kwargs):
         """Take the compiler to perform actual compilation."""
@@ -1303,6 +1316,9 @@ class AbstractModel:
                 'scheduler': Scheduler used by hpo experiment.
                     Valid values:
                         'local': Local FIFO scheduler. Sequential if Custom backend and parallel if Ray Tune backend.
+                        'local_parallel': Local FIFO scheduler running trials in parallel in a local process pool. Does not require Ray.
+                        'local_asha': Local asynchronous successive halving scheduler running trials in sequence.
+                            Stops unpromising trials early for models reporting intermediate results (e.g. LightGBM boosting rounds, NN updates).
                 'searcher': Search algorithm used by hpo experiment.
                     Valid values:
                         'auto': Random search.
@@ -1481,13 +1497,18 @@ class AbstractModel:
         model_disk_size = sum(f.stat().st_size for f in model_path.glob('**/*') if f.is_file())
         return model_disk_size
 
-    # TODO: This results in a doubling of memory usage of the model to calculate its size.
-    #  If the model takes ~40%+ of memory, this may result in an OOM error.
-    #  This is generally not an issue because the model already needed to do this when being saved to disk, so the error would have been triggered earlier.
-    #  Consider using Pympler package for memory efficiency: https://pympler.readthedocs.io/en/latest/asizeof.html#asizeof
     def get_memory_size(self) -> int:
-        gc.collect()  # Try to avoid OOM error
-        return sys.getsizeof(pickle.dumps(self, protocol=4))
+        """
+        Returns the memory size of the model in bytes.
+        Computed by traversing the model's attributes and summing the size of their buffers instead of pickling the model,
+        which would temporarily double the memory usage of the model. Refer to `autogluon.core.utils.memory_utils.get_memory_size` for details.
+        The result is cached until the model is fit, compiled or reduced in size.
+        """
+        memory_size = getattr(self, '_memory_size', None)
+        if memory_size is None:
+            memory_size = get_memory_size(self)
+            self._memory_size = memory_size
+        return memory_size
 
     def estimate_memory_usage(self, **kwargs) -> int:
         """
@@ -1556,7 +1577,7 @@ class AbstractModel:
         -------
         The estimated peak memory usage in bytes during model fit.
         """
-        return 4 * get_approximate_df_mem_usage(X).sum()
+        return 4 * get_approximate_df_mem_usage(X, memory_profile=kwargs.get('data_memory_profile', None)).sum()
 
     @disable_if_lite_mode()
     def _validate_fit_memory_usage(self, mem_error_threshold: float = 0.9, mem_warning_threshold: float = 0.75, mem_size_threshold: int = None, **kwargs):
@@ -1590,7 +1611,7 @@ class AbstractModel:
         if mem_size_threshold is not None and approx_mem_size_req < (mem_size_threshold * min(max_memory_usage_ratio, 1)):
             return  # Model is smaller than the min threshold to check available mem
 
-        available_mem = ResourceManager.get_available_virtual_mem()
+        available_mem = ResourceManager.get_available_virtual_mem() * kwargs.get('available_mem_ratio', 1)
         ratio = approx_mem_size_req / available_mem
         min_error_memory_ratio = ratio / mem_error_threshold
         min_warning_memory_ratio = ratio / mem_warning_threshold
@@ -1630,7 +1651,7 @@ class AbstractModel:
 
         It is not necessary for models to implement this.
         """
-        pass
+        self._memory_size = None
 
     def delete_from_disk(self, silent=False):
         """
@@ -3,6 +3,7 @@ import time
 import logging
 
 from ...hpo.constants import RAY_BACKEND, CUSTOM_BACKEND, VALID_BACKEND
+from ...scheduler.successive_halving_scheduler import LocalSuccessiveHalvingReporter
 from ...utils.loaders import load_pkl
 from ...utils.exceptions import TimeLimitExceeded
 
@@ -21,8 +22,12 @@ def model_trial(
     reporter=None,  # reporter only used by custom strategy, hence optional
     time_limit=None,
     fit_kwargs=None,
+    shared_data=None,
 ):
-    """ Training script for hyperparameter evaluation of an arbitrary model that subclasses AbstractModel."""
+    """
+    Training script for hyperparameter evaluation of an arbitrary model that subclasses AbstractModel.
+    If `shared_data` maps `train_path` and `val_path` to :class:`SharedMemoryObject`, the data is loaded from shared memory instead of from disk.
+    """
     try:
         if fit_kwargs is None:
             fit_kwargs = dict()
@@ -35,10 +40,13 @@ def model_trial(
             is_bagged_model=is_bagged_model
         )
 
-        X, y = load_pkl.load(train_path)
-        X_val, y_val = load_pkl.load(val_path)
+        X, y = load_data(train_path, shared_data=shared_data)
+        X_val, y_val = load_data(val_path, shared_data=shared_data)
 
         fit_model_args = dict(X=X, y=y, X_val=X_val, y_val=y_val, **fit_kwargs)
+        if isinstance(reporter, LocalSuccessiveHalvingReporter) and not is_bagged_model:
+            # Let the model report intermediate results so that the scheduler can stop the trial early
+            fit_model_args['reporter'] = reporter
         predict_proba_args = dict(X=X_val)
         model = fit_and_save_model(
             model=model,
@@ -59,6 +67,12 @@ def model_trial(
         hpo_executor.report(reporter=reporter, epoch=1, validation_performance=model.val_score)
 
 
+def load_data(path, shared_data=None):
+    if shared_data is not None and path in shared_data:
+        return shared_data[path].load()
+    return load_pkl.load(path)
+
+
 def init_model(args, model_cls, init_params, backend, is_bagged_model=False):
     args = args.copy()
 
@@ -23,7 +23,7 @@ from ...hpo.exceptions import EmptySearchSpace
 from ...utils.exceptions import TimeLimitExceeded
 from ...utils.loaders import load_pkl
 from ...utils.savers import save_pkl
-from ...utils.utils import CVSplitter, _compute_fi_with_stddev
+from ...utils.utils import CVSplitter, _compute_fi_with_stddev, map_prefetched
 
 
 logger = logging.getLogger(__name__)
@@ -325,11 +325,13 @@ class BaggedEnsembleModel(AbstractModel):
             raise ValueError(f'k_fold must equal previously fit k_fold value for the current n_repeat, values: (({k_fold}, {self._k})')
 
     def predict_proba(self, X, normalize=None, **kwargs):
-        model = self.load_child(self.models[0])
+        # Children which are not persisted are loaded ahead of their turn in background threads, overlapping their loading with the prediction of prior children
+        num_load_workers = 2 if any(isinstance(model, str) for model in self.models) else 1
+        models = map_prefetched(self.load_child, self.models, num_workers=num_load_workers)
+        model = next(models)
         X = self.preprocess(X, model=model, **kwargs)
         pred_proba = model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
-        for model in self.models[1:]:
-            model = self.load_child(model)
+        for model in models:
             pred_proba += model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
         pred_proba = pred_proba / len(self.models)
 
@@ -750,12 +752,12 @@ class BaggedEnsembleModel(AbstractModel):
             return False
         return self.load_child(self.models[0]).can_compile(compiler_configs=compiler_configs)
 
-    def compile(self, compiler_configs=None):
+    def compile(self, compiler_configs=None, X_val=None, y_val=None):
         """Compile all child models"""
         assert self.is_fit(), "The model must be fit before calling the compile method."
         for child in self.models:
             child = self.load_child(child)
-            child.compile(compiler_configs=compiler_configs)
+            child.compile(compiler_configs=compiler_configs, X_val=X_val, y_val=y_val)
             self.save_child(child)
 
     def get_compiler_name(self) -> str:
@@ -932,11 +934,15 @@ class BaggedEnsembleModel(AbstractModel):
             self._oof_pred_model_repeats = oof['_oof_pred_model_repeats']
 
     def persist_child_models(self, reset_paths=True):
-        for i, model_name in enumerate(self.models):
-            if isinstance(model_name, str):
-                child_path = self.create_contexts(self.path + model_name + os.path.sep)
-                child_model = self._child_type.load(path=child_path, reset_paths=reset_paths, verbose=True)
-                self.models[i] = child_model
+        def _load_child(model_name: str) -> AbstractModel:
+            child_path = self.create_contexts(self.path + model_name + os.path.sep)
+            return self._child_type.load(path=child_path, reset_paths=reset_paths, verbose=True)
+
+        # Children are loaded in parallel threads to overlap the I/O and decompression of the model files
+        child_indices = [i for i, model_name in enumerate(self.models) if isinstance(model_name, str)]
+        child_models = map_prefetched(_load_child, [self.models[i] for i in child_indices])
+        for i, child_model in zip(child_indices, child_models):
+            self.models[i] = child_model
 
     def unpersist_child_models(self):
         self.models = self._get_child_model_names(models=self.models)
@@ -0,0 +1,46 @@
+from typing import Any, Callable, Hashable
+
+from numpy import ndarray
+from pandas import DataFrame, Series
+
+
+class FoldDatasetCache:
+    """
+    Shares model-specific datasets between the fold models of a bagged ensemble.
+
+    Models such as LightGBM and CatBoost spend a large portion of their fit time constructing their internal dataset
+    (feature binning, categorical hashing, conversion from pandas).
+    Instead of constructing a dataset from the rows of each fold, fold models can construct the dataset once
+    from the full bagged training data via `get`, and then select the rows of their fold from it
+    (for example via LightGBM `Dataset.subset` or CatBoost `Pool.slice`).
+
+    Only models with the `can_use_fold_dataset_cache` tag receive the cache,
+    as `fold_dataset_cache` fit kwarg alongside `fold`, the train and validation row indices of the fold.
+
+    Parameters
+    ----------
+    X : DataFrame
+        The full training data of the bagged ensemble.
+    y : Series
+        The full training labels of the bagged ensemble.
+    sample_weight : ndarray, default = None
+        The full training sample weights of the bagged ensemble.
+    """
+    def __init__(self, X: DataFrame, y: Series, sample_weight: ndarray = None):
+        self.X = X
+        self.y = y
+        self.sample_weight = sample_weight
+        self._datasets = dict()
+
+    def get(self, key: Hashable, construct_fn: Callable[[DataFrame, Series, ndarray], Any]):
+        """
+        Returns the dataset stored under `key`, constructing it via `construct_fn(X, y, sample_weight)` if not present.
+        The key must identify everything the dataset depends on apart from the data itself, such as the features used by the model.
+        """
+        if key not in self._datasets:
+            self._datasets[key] = construct_fn(self.X, self.y, self.sample_weight)
+        return self._datasets[key]
+
+    def clear(self):
+        """Releases all stored datasets."""
+        self._datasets = dict()
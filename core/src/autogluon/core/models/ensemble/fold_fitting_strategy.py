@@ -2,7 +2,9 @@ import copy
 import logging
 import math
 import os
+import threading
 import time
+import numpy as np
 import pandas as pd
 import pickle
 from abc import abstractmethod
@@ -18,8 +20,10 @@ from autogluon.common.utils.try_import import try_import_ray
 from autogluon.common.utils.s3_utils import download_s3_folder, upload_s3_folder, s3_path_to_bucket_prefix
 
 from ..abstract.abstract_model import AbstractModel
+from .fold_dataset_cache import FoldDatasetCache
 from ...ray.resources_calculator import ResourceCalculatorFactory
 from ...utils.exceptions import TimeLimitExceeded, NotEnoughMemoryError, NotEnoughCudaMemoryError
+from ...utils.shared_memory import SharedMemoryObject
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,9 @@ IMAGE_MODEL = 'ImagePredictorModel'
 TABULAR_MXNET_MODEL = 'TabularNeuralNetModel'
 TABULAR_FASTAI_MODEL = 'NNFastAiTabularModel'
 
+# Bagged models may be fit concurrently by the trainer, ensures Ray is only initialized once
+_ray_init_lock = threading.Lock()
+
 
 class AbstractFoldFittingStrategy():
 
@@ -282,13 +289,22 @@ class SequentialLocalFoldFittingStrategy(FoldFittingStrategy):
                 self.num_cpus = self.user_resources_per_job.get('num_cpus', self.num_cpus)
                 self.num_gpus = self.user_resources_per_job.get('num_gpus', self.num_gpus)
         self.resources = {'num_cpus': self.num_cpus, 'num_gpus': self.num_gpus}
+        is_pseudo = self.X_pseudo is not None and self.y_pseudo is not None
+        if not is_pseudo and self._initialized_model_base._get_tags().get('can_use_fold_dataset_cache', False):
+            self.fold_dataset_cache = FoldDatasetCache(X=self.X, y=self.y, sample_weight=self.sample_weight)
+        else:
+            self.fold_dataset_cache = None
         
     def schedule_fold_model_fit(self, fold_ctx):
         self.jobs.append(fold_ctx)
 
     def after_all_folds_scheduled(self):
-        for job in self.jobs:
-            self._fit_fold_model(job)
+        try:
+            for job in self.jobs:
+                self._fit_fold_model(job)
+        finally:
+            if self.fold_dataset_cache is not None:
+                self.fold_dataset_cache.clear()
 
     def _fit_fold_model(self, fold_ctx):
         time_start_fold = time.time()
@@ -317,6 +333,9 @@ class SequentialLocalFoldFittingStrategy(FoldFittingStrategy):
             else:
                 kwargs_fold['sample_weight'] = self.sample_weight[train_index]
                 kwargs_fold['sample_weight_val'] = self.sample_weight[val_index]
+        if self.fold_dataset_cache is not None:
+            kwargs_fold['fold_dataset_cache'] = self.fold_dataset_cache
+            kwargs_fold['fold'] = fold
 
         if is_pseudo:
             logger.log(15, f'{len(self.X_pseudo)} extra rows of pseudolabeled data added to training set for {fold_model.name}')
@@ -356,7 +375,8 @@ def _ray_fit(
     resources: Dict[str, Any],
     kwargs_fold: Dict[str, Any],
     head_node_id: str,
-    model_sync_path: Optional[str] = None
+    model_sync_path: Optional[str] = None,
+    time_end: Optional[float] = None,
 ):
     import ray  # ray must be present
     node_id = ray.get_runtime_context().get_node_id()
@@ -365,6 +385,12 @@ def _ray_fit(
     logger.debug(f"executing fold on node {node_id}")
     logger.log(10, 'ray worker training')
     time_start_fold = time.time()
+    if time_end is not None:
+        # The fold may have been queued behind the folds of other models, it must still finish within the time limit of its model
+        time_left = time_end - time_start_fold
+        if time_left <= 0:
+            raise TimeLimitExceeded
+        time_limit_fold = time_left if time_limit_fold is None else min(time_limit_fold, time_left)
     fold, folds_finished, folds_left, \
         folds_to_fit, is_last_fold, \
         model_name_suffix = FoldFittingStrategy._get_fold_properties(fold_ctx)
@@ -373,20 +399,18 @@ def _ray_fit(
     fold_model.name = f'{fold_model.name}{model_name_suffix}'
     fold_model_local_save_path = bagged_ensemble_model_path + fold_model.name + os.path.sep
     fold_model.set_contexts(fold_model_local_save_path)
-    if type(X) == str and type(y) == str:
-        with open(X, 'rb') as X_f, open(y, 'rb') as y_f:
-            X = pickle.load(X_f)
-            y = pickle.load(y_f)
+    X = _load_fold_data(X)
+    y = _load_fold_data(y)
     is_pseudo = False
     if X_pseudo is not None and y_pseudo is not None:
-        if type(X_pseudo) == str and type(y_pseudo) == str:
-            with open(X_pseudo, 'rb') as X_pseudo_f, open(y_pseudo, 'rb') as y_pseudo_f:
-                X_pseudo = pickle.load(X_pseudo_f)
-                y_pseudo = pickle.load(y_pseudo_f)
+        X_pseudo = _load_fold_data(X_pseudo)
+        y_pseudo = _load_fold_data(y_pseudo)
         is_pseudo = True
 
     X_fold, X_val_fold = X.iloc[train_index, :], X.iloc[val_index, :]
     y_fold, y_val_fold = y.iloc[train_index], y.iloc[val_index]
+    # Release the loaded data, only the fold subsets are needed to fit
+    del X, y
     if is_pseudo:
             logger.log(15, f'{len(X_pseudo)} extra rows of pseudolabeled data added to training set for {fold_model.name}')
             X_fold = pd.concat([X_fold, X_pseudo], axis=0, ignore_index=True)
@@ -411,6 +435,19 @@ def _ray_fit(
         time_train_end_fold, fold_model.predict_time, fold_model.predict_1_time
 
 
+def _load_fold_data(data):
+    """
+    Loads data prepared by `ParallelFoldFittingStrategy._prepare_data` in the fold worker.
+    Data shared in memory is loaded as read-only views of the shared segment, the fold subsets taken from it are copies.
+    """
+    if isinstance(data, SharedMemoryObject):
+        return data.load()
+    if type(data) == str:
+        with open(data, 'rb') as f:
+            return pickle.load(f)
+    return data
+
+
 def _ray_predict_oof(fold_model, X_val_fold, y_val_fold, time_train_end_fold,
                      num_cpus=-1, save_bag_folds=True):
     pred_proba = fold_model.predict_proba(X_val_fold, num_cpus=num_cpus)
@@ -461,7 +498,12 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
             The amount of time used to fit all folds.
         predict_time: float
             The amount of time used to do out of folds predictions for all folds.
+        is_data_shared: bool
+            Whether all jobs read the training data from a single copy in shared memory
+            instead of each job deserializing its own copy.
     """
+    is_data_shared = False
+
     def __init__(
         self,
         *,
@@ -491,17 +533,37 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
     @disable_if_lite_mode(ret=True)
     def is_mem_sufficient(self):
         '''Check if the memory is sufficient to do parallel training'''
-        model_mem_est = self._initialized_model_base.estimate_memory_usage(X=self.X)
+        data_memory_profile = self.model_base_kwargs.get('data_memory_profile', None)
+        model_mem_est = self._initialized_model_base.estimate_memory_usage(X=self.X, data_memory_profile=data_memory_profile)
         total_model_mem_est = self.num_parallel_jobs * model_mem_est
-        data_mem_est = self._estimate_data_memory_usage()
-        total_data_mem_est = self.num_parallel_jobs * data_mem_est
-        mem_available = ResourceManager.get_available_virtual_mem()
+        total_data_mem_est = self._estimate_data_memory_usage(
+            X=self.X,
+            y=self.y,
+            num_parallel_jobs=self.num_parallel_jobs,
+            data_memory_profile=data_memory_profile,
+        )
+        mem_available = ResourceManager.get_available_virtual_mem() * self.model_base_kwargs.get('available_mem_ratio', 1)
         return (mem_available * self.max_memory_usage_ratio) > (total_model_mem_est + total_data_mem_est)
 
-    def _estimate_data_memory_usage(self):
-        X_mem = get_approximate_df_mem_usage(self.X).sum()
-        y_mem = get_approximate_df_mem_usage(self.y.to_frame()).sum()
-        return X_mem + y_mem
+    @classmethod
+    def _estimate_data_memory_usage(cls, X: pd.DataFrame, y: pd.Series, num_parallel_jobs: int, data_memory_profile=None) -> int:
+        """
+        Estimates the memory usage of the training data loaded by `num_parallel_jobs` jobs.
+        The fold subsets each job takes from the data are the training input of its model, and are not included.
+        """
+        X_mem = get_approximate_df_mem_usage(X, memory_profile=data_memory_profile)
+        y_mem = get_approximate_df_mem_usage(y.to_frame())
+        data_mem_est = X_mem.sum() + y_mem.sum()
+        if not cls.is_data_shared:
+            # Each job deserializes its own copy of the data
+            return num_parallel_jobs * data_mem_est
+        # Only the arrays of the data are shared, each job deserializes its own copy of the object columns and the index.
+        # Each job also holds the training and validation row indices of its fold.
+        X_mem_job = X_mem['Index'] + X_mem[X.columns[X.dtypes == object]].sum()
+        y_mem_job = y_mem.sum() if y.dtype == object else y_mem['Index']
+        data_mem_job = X_mem_job + y_mem_job
+        fold_index_mem = len(X) * np.dtype(np.int64).itemsize
+        return (data_mem_est - data_mem_job) + num_parallel_jobs * (data_mem_job + fold_index_mem)
 
     def schedule_fold_model_fit(self, fold_ctx):
         self.jobs.append(fold_ctx)
@@ -518,15 +580,26 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
         )
 
     def after_all_folds_scheduled(self):
-        if not self.ray.is_initialized():
-            ray_init_args = self._get_ray_init_args()
-            self.ray.init(**ray_init_args)
+        with _ray_init_lock:
+            if not self.ray.is_initialized():
+                ray_init_args = self._get_ray_init_args()
+                self.ray.init(**ray_init_args)
         head_node_id = self.ray.get_runtime_context().get_node_id()
         logger.debug(f"Dispatching folds on node {head_node_id}")
-        job_refs = []
-        job_fold_map = {}
         # prepare shared data
         X, y, X_pseudo, y_pseudo = self._prepare_data()
+        try:
+            self._fit_all_folds(X=X, y=y, X_pseudo=X_pseudo, y_pseudo=y_pseudo, head_node_id=head_node_id)
+        finally:
+            self._release_data(X, y, X_pseudo, y_pseudo)
+        self.fit_time = 0
+        if self.time_start_fit and self.time_end_fit:
+            self.fit_time = self.time_end_fit - self.time_start_fit
+        self.bagged_ensemble_model._add_parallel_child_times(fit_time=self.fit_time, predict_time=self.predict_time, predict_1_time=self.predict_1_time)
+
+    def _fit_all_folds(self, X, y, X_pseudo, y_pseudo, head_node_id):
+        job_refs = []
+        job_fold_map = {}
         model_base_ref = self.ray.put(self.model_base)
         time_limit_fold = self._get_fold_time_limit()
         # spread the task
@@ -596,10 +669,6 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
                 # Terminate all ray tasks because a fold failed
                 self.terminate_all_unfinished_tasks(unfinished)
                 raise processed_exception
-        self.fit_time = 0
-        if self.time_start_fit and self.time_end_fit:
-            self.fit_time = self.time_end_fit - self.time_start_fit
-        self.bagged_ensemble_model._add_parallel_child_times(fit_time=self.fit_time, predict_time=self.predict_time, predict_1_time=self.predict_1_time)
 
     def terminate_all_unfinished_tasks(self, unfinished_tasks):
         for task in unfinished_tasks:
@@ -653,7 +722,8 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
                 resources=resources,
                 kwargs_fold=kwargs_fold,
                 head_node_id=head_node_id,
-                model_sync_path=self.model_sync_path
+                model_sync_path=self.model_sync_path,
+                time_end=None if self.time_limit is None else self.time_start + self.time_limit,
             )
 
     def _update_bagged_ensemble(self, fold_model, pred_proba, time_start_fit,
@@ -765,6 +835,13 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
                 y_pseudo = os.path.join(self.bagged_ensemble_model.path, utils, y_pseudo)
         return X, y, X_pseudo, y_pseudo
 
+    @staticmethod
+    def _release_data(*data):
+        """Releases the data returned by `_prepare_data` once all folds are finished."""
+        for d in data:
+            if isinstance(d, SharedMemoryObject):
+                d.unlink()
+
     def _parse_ray_error(self, e):
         error = str(e).lower()
         if 'cuda' in error and ('out of memory' in error or 'alloc' in error):
@@ -818,7 +895,27 @@ class ParallelFoldFittingStrategy(FoldFittingStrategy):
     
     
 class ParallelLocalFoldFittingStrategy(ParallelFoldFittingStrategy):
-    
+    """
+    ParallelFoldFittingStrategy running all folds on the local machine.
+
+    The training data is written once to shared memory, fold workers load it as zero-copy read-only views
+    and only copy the rows of their fold. The arrays of the data are therefore accounted for once when checking if memory is sufficient,
+    rather than once per parallel job.
+    """
+    is_data_shared = True
+
+    def _prepare_data(self, in_mem=True):
+        if not in_mem:
+            return super()._prepare_data(in_mem=in_mem)
+        X = SharedMemoryObject(self.X)
+        y = SharedMemoryObject(self.y)
+        X_pseudo = None
+        y_pseudo = None
+        if self.X_pseudo is not None and self.y_pseudo is not None:
+            X_pseudo = SharedMemoryObject(self.X_pseudo)
+            y_pseudo = SharedMemoryObject(self.y_pseudo)
+        return X, y, X_pseudo, y_pseudo
+
     def _get_ray_init_args(self):
         ray_init_args = dict(
             log_to_driver=False,
@@ -844,5 +941,6 @@ class ParallelDistributedFoldFittingStrategy(ParallelFoldFittingStrategy):
             prefix=path,
             local_path=local_path,
             error_if_exists=False,
-            verbose=False
+            verbose=False,
+            skip_if_matching=True,
         )
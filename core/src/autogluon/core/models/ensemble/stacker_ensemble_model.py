@@ -6,7 +6,6 @@ from typing import Dict
 
 from collections import defaultdict
 
-import numpy as np
 import pandas as pd
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
@@ -15,6 +14,7 @@ from autogluon.common.features.types import R_FLOAT, S_STACK
 from .bagged_ensemble_model import BaggedEnsembleModel
 from ..abstract.abstract_model import AbstractModel
 from ...constants import MULTICLASS, SOFTCLASS, QUANTILE
+from ...utils.utils import convert_pred_probas_to_df
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +122,8 @@ class StackerEnsembleModel(BaggedEnsembleModel):
                     X_stacker.append(y_pred_proba)  # TODO: This could get very large on a high class count problem. Consider capping to top N most frequent classes and merging least frequent
                 X_stacker = self.pred_probas_to_df(X_stacker, index=X.index)
                 if self.params['use_orig_features']:
-                    X = pd.concat([X_stacker, X], axis=1)
+                    # The blocks of X are not copied, X must be treated as read-only as for any model input
+                    X = pd.concat([X_stacker, X], axis=1, copy=False)
                 else:
                     X = X_stacker
             elif not self.params['use_orig_features']:
@@ -131,14 +132,7 @@ class StackerEnsembleModel(BaggedEnsembleModel):
         return X
 
     def pred_probas_to_df(self, pred_proba: list, index=None) -> pd.DataFrame:
-        if self.problem_type in [MULTICLASS, SOFTCLASS, QUANTILE]:
-            pred_proba = np.concatenate(pred_proba, axis=1)
-            pred_proba = pd.DataFrame(pred_proba, columns=self.stack_columns)
-        else:
-            pred_proba = pd.DataFrame(data=np.asarray(pred_proba).T, columns=self.stack_columns)
-        if index is not None:
-            pred_proba.set_index(index, inplace=True)
-        return pred_proba
+        return convert_pred_probas_to_df(pred_proba_list=pred_proba, columns=self.stack_columns, problem_type=self.problem_type, index=index)
 
     def _fit(self,
              X,
@@ -1,2 +1,4 @@
 # schedulers
 from .seq_scheduler import LocalSequentialScheduler
+from .parallel_scheduler import LocalParallelScheduler
+from .successive_halving_scheduler import LocalSuccessiveHalvingScheduler
@@ -0,0 +1,233 @@
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from copy import deepcopy
+
+from autogluon.common.utils.resource_utils import ResourceManager
+
+from .seq_scheduler import LocalReporter, LocalSequentialScheduler
+from ..searcher.exceptions import ExhaustedSearchSpaceError
+
+logger = logging.getLogger(__name__)
+
+# State of the worker process, set once by `_init_worker` to avoid sending the train_fn kwargs with every trial
+_worker_state = dict()
+
+
+def _init_worker(cpu_queue, train_fn, train_fn_kwargs):
+    cpus = cpu_queue.get()
+    if cpus is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, cpus)
+        except OSError as e:
+            logger.log(15, f'\tUnable to pin HPO worker to cpus {cpus}: {e}')
+    _worker_state['train_fn'] = train_fn
+    _worker_state['train_fn_kwargs'] = train_fn_kwargs
+
+
+def _run_trial(task_id, searcher_config):
+    """Runs a single trial in the worker process, returning everything the scheduler needs to record it."""
+    training_history = dict()
+    config_history = dict()
+    reporter = LocalReporter(task_id, searcher_config, training_history, config_history)
+    train_fn_kwargs = _worker_state['train_fn_kwargs']
+    train_fn_kwargs = deepcopy(train_fn_kwargs) if train_fn_kwargs is not None else dict()
+    args = dict()
+    args.update(searcher_config)
+    args['task_id'] = task_id
+    exception = None
+    try:
+        _worker_state['train_fn'](args, reporter=reporter, **train_fn_kwargs)
+    except Exception as e:
+        exception = str(e)
+        reporter(traceback=exception)
+    return training_history[task_id], config_history.get(task_id, None), reporter.last_result, exception
+
+
+class LocalParallelScheduler(LocalSequentialScheduler):
+    """ Scheduler which runs HPO trials in parallel in a local process pool, without requiring Ray.
+
+    The number of trials running at once is the number of cpus (and gpus) in `total_resource` divided by the resources per trial in `resource`.
+    Each worker process is pinned to its own set of cpus (on platforms supporting cpu affinity) so that concurrent trials do not compete for cores.
+    Trials that are still running when `time_out` is reached are cancelled and their workers are terminated.
+
+    Configurations are sampled and results are recorded by the searcher in the main process, in the order the trials complete.
+    `train_fn` and `train_fn_kwargs` must be picklable, as they are sent once to each worker process.
+    Large read-only data shared by all trials should be passed as a :class:`autogluon.core.utils.shared_memory.SharedMemoryObject`
+    in `train_fn_kwargs` so that it is not copied into every worker.
+
+    Parameters
+    ----------
+    total_resource : dict, default = None
+        Total computation resources to split across trials. For example, `{'num_cpus': 16, 'num_gpus': 0}`.
+        If None, all cpus and gpus of the machine are used.
+    mp_context : str, default = 'spawn'
+        The multiprocessing start method of the worker processes.
+    **kwargs :
+        Refer to :class:`LocalSequentialScheduler` documentation for details on the remaining arguments.
+    """
+    runs_trials_in_parallel = True
+
+    def __init__(self, train_fn, search_space, train_fn_kwargs=None, searcher='auto', reward_attr='reward', resource=None,
+                 total_resource=None, mp_context='spawn', **kwargs):
+        super().__init__(train_fn, search_space, train_fn_kwargs=train_fn_kwargs, searcher=searcher, reward_attr=reward_attr, resource=resource, **kwargs)
+        if total_resource is None:
+            total_resource = dict(num_cpus=ResourceManager.get_cpu_count(), num_gpus=ResourceManager.get_gpu_count_all())
+        self.total_resource = total_resource
+        self.mp_context = mp_context
+        self.num_workers = self._get_num_workers()
+        self.metadata['num_parallel_trials'] = self.num_workers
+
+    def _get_num_workers(self) -> int:
+        resource = self.resource if self.resource is not None else dict()
+        num_cpus_per_trial = resource.get('num_cpus', 1)
+        num_gpus_per_trial = resource.get('num_gpus', 0)
+        if not isinstance(num_cpus_per_trial, int) or num_cpus_per_trial < 1:
+            num_cpus_per_trial = 1
+        num_workers = max(self.total_resource.get('num_cpus', 1) // num_cpus_per_trial, 1)
+        if isinstance(num_gpus_per_trial, (int, float)) and num_gpus_per_trial > 0:
+            num_workers = min(num_workers, max(int(self.total_resource.get('num_gpus', 0) // num_gpus_per_trial), 1))
+        return min(num_workers, self.num_trials)
+
+    def _get_cpu_sets(self) -> list:
+        """Returns the set of cpus to pin each worker to, or None for each worker if cpu affinity is not supported."""
+        if not hasattr(os, 'sched_getaffinity'):
+            return [None] * self.num_workers
+        available_cpus = sorted(os.sched_getaffinity(0))
+        num_cpus_per_worker = max(len(available_cpus) // self.num_workers, 1)
+        cpu_sets = []
+        for i in range(self.num_workers):
+            cpus = available_cpus[i * num_cpus_per_worker:(i + 1) * num_cpus_per_worker]
+            cpu_sets.append(set(cpus) if cpus else None)
+        return cpu_sets
+
+    def run(self, **kwargs):
+        """Run multiple trials in parallel given specific time and trial numbers limits.
+        """
+        self.searcher.configure_scheduler(self)
+
+        self.training_history = OrderedDict()
+        self.config_history = OrderedDict()
+
+        failure_count = 0
+        trial_count = 0
+        trials_total_time = 0
+        min_failure_threshold = 5
+        failure_rate_threshold = 0.8
+        time_start = time.time()
+
+        logger.log(15, f'\tRunning up to {self.num_workers} HPO trials in parallel')
+        ctx = multiprocessing.get_context(self.mp_context)
+        cpu_queue = ctx.Queue()
+        for cpus in self._get_cpu_sets():
+            cpu_queue.put(cpus)
+        executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(cpu_queue, self.train_fn, self.train_fn_kwargs),
+        )
+        running = dict()  # future -> (task_id, searcher_config, trial_start_time)
+        next_task_id = 0
+        stop = False
+        is_timeout = False
+        try:
+            while True:
+                while not stop and len(running) < self.num_workers and next_task_id < self.num_trials:
+                    if self.time_out is not None:
+                        num_success = trial_count - failure_count
+                        avg_trial_run_time = 0 if num_success == 0 else trials_total_time / num_success
+                        if not self.has_enough_time_for_trial_(self.time_out, time_start, time_start, time.time(), avg_trial_run_time):
+                            logger.log(20, '\tStopping HPO to satisfy time limit...')
+                            stop = True
+                            break
+                    try:
+                        searcher_config = self._get_searcher_config()
+                    except ExhaustedSearchSpaceError:
+                        stop = True
+                        break
+                    self.searcher.register_pending(searcher_config)
+                    future = executor.submit(_run_trial, next_task_id, searcher_config)
+                    running[future] = (next_task_id, searcher_config, time.time())
+                    next_task_id += 1
+                if not running:
+                    break
+
+                timeout = None
+                if self.time_out is not None:
+                    timeout = max(time_start + self.time_out - time.time(), 0)
+                done, _ = wait(list(running.keys()), timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.log(20, f'\tStopping HPO to satisfy time limit, cancelling {len(running)} running trials...')
+                    is_timeout = True
+                    break
+                for future in done:
+                    task_id, searcher_config, trial_start_time = running.pop(future)
+                    try:
+                        is_failed = self._record_trial(task_id, searcher_config, future.result())
+                    except BrokenProcessPool:
+                        logger.log(30, f'\tWARNING: An HPO worker process terminated abruptly during trial {task_id}, stopping HPO early. '
+                                       f'If running a script with the "{self.mp_context}" start method, '
+                                       f'make sure its entry point is guarded by `if __name__ == "__main__":`.')
+                        self.searcher.evaluation_failed(config=searcher_config)
+                        is_failed = True
+                        stop = True
+                    except Exception:
+                        logger.log(30, f'\tWARNING: Encountered unexpected exception during trial {task_id}, stopping HPO early.')
+                        logger.exception('Detailed Traceback:')
+                        self.searcher.evaluation_failed(config=searcher_config)
+                        is_failed = True
+                        stop = True
+                    trial_count += 1
+                    if is_failed:
+                        failure_count += 1
+                    else:
+                        trials_total_time += time.time() - trial_start_time
+
+                if stop:
+                    continue
+                if self.max_reward and self.get_best_reward() >= self.max_reward:
+                    logger.log(20, '\tStopping HPO: Max reward reached')
+                    stop = True
+                elif failure_count >= min_failure_threshold and (failure_count / trial_count) >= failure_rate_threshold:
+                    logger.warning(f'Warning: Detected a large trial failure rate: '
+                                   f'{failure_count}/{trial_count} attempted trials failed ({round((failure_count / trial_count) * 100, 1)}%)! '
+                                   f'Stopping HPO early due to reaching failure threshold ({round(failure_rate_threshold*100, 1)}%).\n'
+                                   f'\tFailures may be caused by invalid configurations within the provided search space.')
+                    stop = True
+        finally:
+            if is_timeout:
+                for task_id, searcher_config, _ in running.values():
+                    self.searcher.evaluation_failed(config=searcher_config)
+                # ProcessPoolExecutor has no public API to stop running tasks, terminate the workers directly.
+                for process in list((getattr(executor, '_processes', None) or dict()).values()):
+                    process.terminate()
+            # Cancel trials which have not started, `shutdown(cancel_futures=True)` requires Python 3.9
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=not is_timeout)
+
+    def _get_searcher_config(self) -> dict:
+        new_searcher_config = self.searcher.get_config()
+        searcher_config = deepcopy(self.metadata['search_space'])
+        searcher_config.update(new_searcher_config)
+        return searcher_config
+
+    def _record_trial(self, task_id, searcher_config, trial_output) -> bool:
+        """Records the output of a finished trial in the training history and searcher. Returns True if the trial failed."""
+        training_history, config, last_result, exception = trial_output
+        self.training_history[task_id] = training_history
+        if config is not None:
+            self.config_history[task_id] = config
+        if exception is not None:
+            logger.error(f'Exception during a trial: {exception}')
+            self.searcher.evaluation_failed(config=searcher_config)
+            return True
+        if not last_result:
+            return True
+        self.searcher.update(config=searcher_config, **last_result)
+        return False
@@ -255,9 +255,12 @@ class LocalSequentialScheduler(object):
         new_searcher_config = self.searcher.get_config()
         searcher_config = deepcopy(self.metadata['search_space'])
         searcher_config.update(new_searcher_config)
-        reporter = LocalReporter(task_id, searcher_config, self.training_history, self.config_history)
+        reporter = self.get_reporter_(task_id, searcher_config)
         return self.run_job_(task_id, searcher_config, reporter)
 
+    def get_reporter_(self, task_id, searcher_config) -> LocalReporter:
+        return LocalReporter(task_id, searcher_config, self.training_history, self.config_history)
+
     def run_job_(self, task_id, searcher_config, reporter):
         args = dict()
         if self.train_fn_kwargs is not None:
@@ -0,0 +1,107 @@
+import logging
+import math
+
+import numpy as np
+
+from .seq_scheduler import LocalReporter, LocalSequentialScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class LocalSuccessiveHalvingReporter(LocalReporter):
+    """
+    Reporter implementation for LocalSuccessiveHalvingScheduler.
+
+    After each report, `should_stop` is True if the scheduler decided to stop the trial early.
+    Training loops that support early stopping by the scheduler check it after reporting and stop training gracefully.
+    """
+
+    def __init__(self, trial, searcher_config, training_history: dict, config_history: dict, scheduler):
+        super().__init__(trial, searcher_config, training_history, config_history)
+        self.scheduler = scheduler
+        self.should_stop = False
+
+    def __call__(self, *args, **kwargs):
+        super().__call__(*args, **kwargs)
+        if self.should_stop or 'done' in kwargs or 'traceback' in kwargs:
+            return
+        if self.scheduler.time_attr in kwargs and self.scheduler._reward_attr in kwargs:
+            self.should_stop = self.scheduler.on_trial_result(
+                trial=self.trial,
+                fidelity=kwargs[self.scheduler.time_attr],
+                reward=kwargs[self.scheduler._reward_attr],
+            )
+
+
+class LocalSuccessiveHalvingScheduler(LocalSequentialScheduler):
+    """ Asynchronous successive halving (ASHA) scheduler running trials in sequence.
+
+    Trials report their validation performance at increasing fidelity levels (for example boosting rounds for GBMs or updates for neural networks)
+    via the `time_attr` of their reports. The fidelity levels `grace_period * reduction_factor ** k` (up to `max_t`) are rungs:
+    when a trial reaches a rung, it is stopped early unless its reward is within the top `1 / reduction_factor` fraction
+    of the rewards previously recorded at that rung. This allows evaluating more configurations within the same time budget.
+
+    Stopping is cooperative: the trial's reporter sets `should_stop`, which the training loop checks after reporting.
+    Models that do not report intermediate results are trained to completion, as with LocalSequentialScheduler.
+
+    Parameters
+    ----------
+    grace_period : int, default = 10
+        The fidelity of the first rung. Trials are never stopped before reaching it.
+    reduction_factor : float, default = 3
+        Only the top `1 / reduction_factor` fraction of trials continue past each rung.
+    max_t : int, default = 10000
+        The maximum fidelity of a rung.
+    **kwargs :
+        Refer to :class:`LocalSequentialScheduler` documentation for details on the remaining arguments.
+    """
+    def __init__(self, train_fn, search_space, train_fn_kwargs=None, searcher='auto', reward_attr='reward', resource=None,
+                 grace_period=10, reduction_factor=3, max_t=10000, **kwargs):
+        super().__init__(train_fn, search_space, train_fn_kwargs=train_fn_kwargs, searcher=searcher, reward_attr=reward_attr, resource=resource, **kwargs)
+        if self.time_attr is None:
+            raise ValueError('time_attr must be specified for LocalSuccessiveHalvingScheduler')
+        if grace_period < 1 or reduction_factor <= 1 or max_t < grace_period:
+            raise ValueError(f'Invalid successive halving arguments: grace_period={grace_period}, reduction_factor={reduction_factor}, max_t={max_t}')
+        self.grace_period = grace_period
+        self.reduction_factor = reduction_factor
+        self.max_t = max_t
+        num_rungs = int(math.floor(math.log(max_t / grace_period, reduction_factor) + 1e-9)) + 1
+        self.milestones = [grace_period * reduction_factor ** k for k in range(num_rungs)]
+        self._rungs = {milestone: dict() for milestone in self.milestones}  # milestone -> {trial: reward}
+        self.num_stopped_trials = 0
+
+    def run(self, **kwargs):
+        self._rungs = {milestone: dict() for milestone in self.milestones}
+        self.num_stopped_trials = 0
+        super().run(**kwargs)
+        if self.num_stopped_trials:
+            logger.log(15, f'\t{self.num_stopped_trials} HPO trials were stopped early by successive halving')
+
+    def get_reporter_(self, task_id, searcher_config) -> LocalSuccessiveHalvingReporter:
+        return LocalSuccessiveHalvingReporter(task_id, searcher_config, self.training_history, self.config_history, scheduler=self)
+
+    def on_trial_result(self, trial, fidelity, reward) -> bool:
+        """
+        Records the reward of a trial at the highest rung it reached and has not yet been recorded at.
+        Returns True if the trial should be stopped, i.e. its reward is below the cutoff of that rung.
+        """
+        if reward is None or np.isnan(reward):
+            return False
+        for milestone in reversed(self.milestones):
+            recorded = self._rungs[milestone]
+            if fidelity < milestone or trial in recorded:
+                continue
+            cutoff = self._get_cutoff(recorded)
+            recorded[trial] = reward
+            if cutoff is not None and reward < cutoff:
+                logger.log(15, f'\tStopping trial {trial} at {self.time_attr}={fidelity}: '
+                               f'{self._reward_attr}={reward} is below the rung cutoff {cutoff}')
+                self.num_stopped_trials += 1
+                return True
+            break
+        return False
+
+    def _get_cutoff(self, recorded: dict):
+        if not recorded:
+            return None
+        return np.nanpercentile(list(recorded.values()), (1 - 1 / self.reduction_factor) * 100)
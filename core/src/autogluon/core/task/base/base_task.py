@@ -3,7 +3,9 @@ import logging
 import time
 from abc import abstractmethod
 
+from ...scheduler.parallel_scheduler import LocalParallelScheduler
 from ...scheduler.seq_scheduler import LocalSequentialScheduler
+from ...scheduler.successive_halving_scheduler import LocalSuccessiveHalvingScheduler
 from ...utils import in_ipynb
 from ...utils.utils import setup_compute
 
@@ -14,6 +16,8 @@ __all__ = [
 
 schedulers = {
     'local': LocalSequentialScheduler,
+    'local_parallel': LocalParallelScheduler,
+    'local_asha': LocalSuccessiveHalvingScheduler,
 }
 
 logger = logging.getLogger(__name__)
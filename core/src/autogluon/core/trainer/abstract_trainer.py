@@ -1,8 +1,10 @@
 import copy
 import logging
 import os
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Union, Tuple, Optional
 
 import networkx as nx
@@ -14,6 +16,7 @@ from pathlib import Path
 from autogluon.common.features.feature_metadata import FeatureMetadata
 from autogluon.common.utils.lite import disable_if_lite_mode
 from autogluon.common.utils.log_utils import convert_time_in_s_to_log_friendly
+from autogluon.common.utils.pandas_utils import DataFrameMemoryProfile
 from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.common.utils.try_import import try_import_torch
 
@@ -24,8 +27,9 @@ from ..calibrate.temperature_scaling import tune_temperature_scaling
 from ..constants import AG_ARGS, BINARY, MULTICLASS, REGRESSION, QUANTILE, SOFTCLASS, REFIT_FULL_NAME, REFIT_FULL_SUFFIX
 from ..data.label_cleaner import LabelCleanerMulticlassToBinary
 from ..models import AbstractModel, BaggedEnsembleModel, StackerEnsembleModel, WeightedEnsembleModel, GreedyWeightedEnsembleModel, SimpleWeightedEnsembleModel
+from ..models.ensemble.fold_fitting_strategy import ParallelLocalFoldFittingStrategy
 from ..utils import default_holdout_frac, get_pred_from_proba, generate_train_test_split, infer_eval_metric, compute_permutation_feature_importance, \
-    extract_column, compute_weighted_metric, convert_pred_probas_to_df
+    extract_column, compute_weighted_metric, convert_pred_probas_to_df, get_leaderboard_pareto_frontier, map_prefetched
 from ..utils.exceptions import TimeLimitExceeded, NotEnoughMemoryError, NoValidFeatures, NoGPUError, NotEnoughCudaMemoryError
 from ..utils.loaders import load_pkl
 from ..utils.savers import save_json, save_pkl
@@ -33,6 +37,10 @@ from ..utils.feature_selection import FeatureSelector
 
 logger = logging.getLogger(__name__)
 
+# Serializes updates to the trainer state when bagged models are fit concurrently (refer to `num_bag_models_parallel`).
+# Kept at module level instead of as a trainer attribute because the trainer is pickled when saved.
+_trainer_state_lock = threading.RLock()
+
 
 # FIXME: Below is major defect!
 #  Weird interaction for metrics like AUC during bagging.
@@ -105,6 +113,8 @@ class AbstractTrainer:
         self._y_val_saved = False
 
         self._groups = None  # custom split indices
+        # Memory usage per row of the training features, passed to models to estimate memory usage without scanning the data
+        self._data_memory_profile: DataFrameMemoryProfile = None
 
         self._regress_preds_asprobas = False  # whether to treat regression predictions as class-probabilities (during distillation)
 
@@ -112,6 +122,13 @@ class AbstractTrainer:
         
         self._models_failed_to_train = []  # List of models which failed to train
 
+        # Arguments and time spent of an in-progress `_train_multi_and_ensemble` call,
+        # saved with each checkpoint of the trainer so that the call can be resumed via `resume_fit` if interrupted.
+        self._fit_checkpoint = None
+        # If True, models which were already fit before `_train_multi_and_ensemble` was interrupted are reused instead of being fit again.
+        self._is_resuming_fit = False
+        self._cascades = dict()  # Cascade name -> cascade plan fit by `fit_cascade`
+
         # self._exceptions_list = []  # TODO: Keep exceptions list for debugging during benchmarking.
 
     # path_root is the directory containing learner.pkl
@@ -573,6 +590,8 @@ class AbstractTrainer:
             return self.get_model_best()
 
     def get_pred_proba_from_model(self, model, X, model_pred_proba_dict=None, cascade=False):
+        if isinstance(model, str) and model in self._get_cascades():
+            return self.get_cascade_pred_proba(X=X, name=model)
         if isinstance(model, list):
             models = model
             model = models[-1]
@@ -622,7 +641,6 @@ class AbstractTrainer:
         return compute_weighted_metric(y, y_pred, self.eval_metric, weights, weight_evaluation=self.weight_evaluation,
                                        quantile_levels=self.quantile_levels)
 
-    # TODO: Slow if large ensemble with many models, could cache output result to speed up cascades during inference
     def _construct_model_pred_order(self, models: List[str]) -> List[str]:
         """
         Constructs a list of model names in order of inference calls required to infer on all the models.
@@ -708,7 +726,8 @@ class AbstractTrainer:
                                   record_pred_time: bool = False,
                                   use_val_cache: bool = False,
                                   cascade: bool = False,
-                                  cascade_threshold: float = 0.9):
+                                  cascade_threshold: Union[float, List[float]] = 0.9,
+                                  model_pred_order: List[str] = None):
         """
         Optimally computes pred_probas (or predictions if regression) for each model in `models`.
         Will compute each necessary model only once and store predictions in a `model_pred_proba_dict` dictionary.
@@ -738,7 +757,7 @@ class AbstractTrainer:
             Whether to fetch cached val prediction probabilities for models instead of predicting on the data.
             Only set to True if X is equal to the validation data and you want to skip live predictions.
         cascade : bool, default = False
-            [Experimental] Whether to perform an ensemble cascade.
+            Whether to perform an ensemble cascade.
             If True, the cascade is performed from left to right on the models specified in `models`.
             For each row of input data in X:
                 After a model in `models` predicts on it:
@@ -747,11 +766,15 @@ class AbstractTrainer:
             This process should speed up prediction compared to predicting on the last model for all rows, assuming earlier models are part of the dependency graph of the final model.
             Only valid for binary and multiclass classification.
             Note: When True, only the output of the final model in `models` in `model_pred_proba_dict` should be used.
-        cascade_threshold : float, default = 0.9
-            # TODO: Placeholder logic, replace with more complex option
+        cascade_threshold : float or List[float], default = 0.9
             Threshold to use for determining if a row should exit the cascaded prediction early.
-            If any one class has pred_proba>=cascade_threshold, then it exits early.
+            If the highest class pred_proba of a row is >= the threshold, then it exits early.
+            If a list, contains the threshold of each model in `models` except the final model.
+            Thresholds fit to a target score by `fit_cascade` are used when predicting with a cascade name, refer to `get_cascade_pred_proba`.
             Ignored if `cascade=False`.
+        model_pred_order : List[str], optional
+            The precomputed output of `self._construct_model_pred_order(models)`, to avoid computing it on every call.
+            Ignored if `model_pred_proba_dict` or `use_val_cache` is specified.
 
         Returns
         -------
@@ -770,12 +793,20 @@ class AbstractTrainer:
             raise AssertionError(f'Ensemble Cascade not implemented for problem_type=={self.problem_type}')
         if cascade and use_val_cache:
             raise AssertionError('cascade and use_val_cache cannot both be True.')
+        if cascade:
+            if isinstance(cascade_threshold, (list, tuple)):
+                if len(cascade_threshold) < len(models) - 1:
+                    raise AssertionError(f'cascade_threshold must contain a threshold for each model except the final model '
+                                         f'(len(models)={len(models)}, len(cascade_threshold)={len(cascade_threshold)})')
+                cascade_threshold_dict = dict(zip(models[:-1], cascade_threshold))
+            else:
+                cascade_threshold_dict = {model: cascade_threshold for model in models[:-1]}
 
         if use_val_cache:
             _, model_pred_proba_dict = self._update_pred_proba_dict_with_val_cache(model_set=set(models), model_pred_proba_dict=model_pred_proba_dict)
         if not model_pred_proba_dict:
-            # TODO: Pre-construct order if cascade, otherwise this will slow down prediction having to recompute each inference call.
-            model_pred_order = self._construct_model_pred_order(models)
+            if model_pred_order is None:
+                model_pred_order = self._construct_model_pred_order(models)
         else:
             model_pred_order = self._construct_model_pred_order_with_pred_dict(models, models_to_ignore=list(model_pred_proba_dict.keys()))
         if use_val_cache:
@@ -788,15 +819,21 @@ class AbstractTrainer:
         if cascade:
             num_rows = len(X)
             # used to keep track of which rows remain unconfident and what their original index was.
-            unconfident_idx = np.array([i for i in range(num_rows)])
+            unconfident_idx = np.arange(num_rows)
         else:
             num_rows = None
             unconfident_idx = None
         # The order in which models predict in the cascade. Only used when `cascade=True`
         cascade_order: List[str] = []
 
+        # Models which are not persisted are loaded from disk ahead of their turn in background threads,
+        # overlapping their loading with the prediction of prior models.
+        # Loading ahead is limited to a couple models to bound the memory usage of unpersisted models.
+        num_load_workers = 1 if all(model_name in self.models for model_name in model_pred_order) else 2
+        models_loaded = map_prefetched(self.load_model, model_pred_order, num_workers=num_load_workers)
+
         # Compute model predictions in topological order
-        for model_name in model_pred_order:
+        for model_name, model in zip(model_pred_order, models_loaded):
             if record_pred_time:
                 time_start = time.time()
 
@@ -804,7 +841,6 @@ class AbstractTrainer:
                 # Keep track of the iloc index of the current model for the rows that are predicted on.
                 #  iloc is used because it is a very compute efficient way to track the location of rows.
                 iloc_model_dict[model_name] = unconfident_idx
-            model = self.load_model(model_name=model_name)
             if isinstance(model, StackerEnsembleModel):
                 if cascade:
                     # Need to predict only on the unconfident rows that remain.
@@ -837,16 +873,8 @@ class AbstractTrainer:
                 model_pred_proba_dict_cascade[model_name] = tmp
                 # If model is part of cascade, keep the predictions that are confident and don't predict on these rows with further models.
                 if model_name in models and model_name != models[-1]:
-                    pred_proba = model_pred_proba_dict[model_name]
-                    # Calculate confident predictions based on cascade threshold
-                    # TODO: Support more sophisticated methods of calculating whether to keep a prediction
-                    # TODO: Support per-model confidence specification
-                    if self.problem_type == BINARY:
-                        confident = (pred_proba >= cascade_threshold) | (pred_proba <= (1-cascade_threshold))
-                    elif self.problem_type == MULTICLASS:
-                        confident = (pred_proba >= cascade_threshold).any(axis=1)
-                    else:
-                        raise AssertionError(f'Invalid cascade problem_type: {self.problem_type}')
+                    # Calculate confident predictions based on the cascade threshold of the model
+                    confident = self._get_cascade_confidence(model_pred_proba_dict[model_name]) >= cascade_threshold_dict[model_name]
                     unconfident_cur = ~confident
                     # Shrink X to only contain the remaining unconfident rows
                     X = X.iloc[unconfident_cur]
@@ -866,7 +894,7 @@ class AbstractTrainer:
             #  This will result in the final pred_proba of the cascade at the end of the for-loop.
             for m in cascade_order:
                 cascade_pred_proba[iloc_model_dict[m]] = model_pred_proba_dict[m]
-            # FIXME: Temp overwrite, unsure how we want to vend cascade results? In future maybe under its own model name.
+            # The cascade output is stored under the final model. Cascades fit by `fit_cascade` are predicted with via `get_cascade_pred_proba`.
             model_pred_proba_dict[models[-1]] = cascade_pred_proba
 
         if record_pred_time:
@@ -874,6 +902,264 @@ class AbstractTrainer:
         else:
             return model_pred_proba_dict
 
+    def profile_inference(self, X: pd.DataFrame, models: List[str]) -> pd.DataFrame:
+        """
+        Predicts on X with each model in `models` and the models they depend on, measuring the time spent in each stage of the inference of each model.
+        Stage times are measured separately from a regular prediction, the sum of the stage times may slightly differ from the time of a regular prediction.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Input data to predict on, already transformed by the global feature preprocessing.
+        models : List[str]
+            The list of models to profile. Models they depend on are also profiled.
+
+        Returns
+        -------
+        pd.DataFrame indexed by model name, in the order of prediction, with the following columns (all in seconds, for all rows of X):
+            'load_time': Time to load the model (and the child models of bagged ensembles) from disk. 0 if the model is persisted in memory.
+            'stack_time': Time to construct the stacker input of the model from the predictions of its base models. 0 if the model is not a stacker.
+            'preprocess_time': Time of the model specific preprocessing of the input (`model.preprocess`).
+            'predict_time': Time of the core prediction of the model, excluding the stacker input construction and preprocessing.
+            'pred_time_marginal': Sum of the above, the time needed to predict with the model given the predictions of the models it depends on.
+        """
+        model_pred_order = self._construct_model_pred_order(models)
+        model_pred_proba_dict = dict()
+        profile = dict()
+        for model_name in model_pred_order:
+            time_start = time.time()
+            is_persisted = model_name in self.models
+            model = self.load_model(model_name=model_name)
+            if not is_persisted and isinstance(model, BaggedEnsembleModel):
+                model.persist_child_models()
+            time_load = time.time() - time_start if not is_persisted else 0
+
+            if isinstance(model, StackerEnsembleModel):
+                predict_kwargs = dict(infer=False, model_pred_proba_dict=model_pred_proba_dict)
+                time_start = time.time()
+                X_model = model.preprocess(X, preprocess_nonadaptive=False, **predict_kwargs)
+                time_stack = time.time() - time_start
+            else:
+                predict_kwargs = dict()
+                X_model = X
+                time_stack = 0
+            time_preprocess = self._get_model_preprocess_time(model=model, X=X_model)
+
+            time_start = time.time()
+            model_pred_proba_dict[model_name] = model.predict_proba(X, **predict_kwargs)
+            time_predict = max(time.time() - time_start - time_stack - time_preprocess, 0)
+            profile[model_name] = dict(
+                load_time=time_load,
+                stack_time=time_stack,
+                preprocess_time=time_preprocess,
+                predict_time=time_predict,
+                pred_time_marginal=time_load + time_stack + time_preprocess + time_predict,
+            )
+        return pd.DataFrame.from_dict(profile, orient='index')
+
+    @staticmethod
+    def _get_model_preprocess_time(model: AbstractModel, X: pd.DataFrame) -> float:
+        """Returns the time `model` spends on preprocessing X during prediction, excluding stacker input construction."""
+        time_start = time.time()
+        if isinstance(model, BaggedEnsembleModel):
+            # Bagged ensembles apply the nonadaptive preprocessing once, and the stateful preprocessing of each child
+            X = model.load_child(model.models[0]).preprocess(X, preprocess_stateful=False)
+            for child in model.models:
+                model.load_child(child).preprocess(X, preprocess_nonadaptive=False)
+        else:
+            model.preprocess(X)
+        return time.time() - time_start
+
+    def fit_cascade(self, models: List[str] = None, max_score_loss: float = 0.01, name: str = None, num_thresholds: int = 100) -> Optional[str]:
+        """
+        Fits an early-exit cascade of `models` and registers it under `name`, making it selectable as a model in `predict`, `predict_proba` and `leaderboard`.
+
+        Rows are predicted by the models of the cascade from first to last. A row exits the cascade at the first model
+        whose highest class prediction probability is at least the confidence threshold of that model, the final model predicting on all remaining rows.
+        The threshold of each model is fit in order on the validation prediction probabilities (out-of-fold in bagged mode),
+        as the lowest threshold such that the validation score of the cascade stays within `max_score_loss` of the validation score of the final model.
+        Models for which no threshold satisfies the constraint are removed from the cascade.
+        If only the final model remains, no cascade is registered.
+        The inference order of the cascade is computed once here, so predicting with the cascade has no planning overhead.
+
+        Parameters
+        ----------
+        models : List[str], default = None
+            The models of the cascade, ordered from first to predict to last. Models should be ordered by increasing inference time.
+            If None, uses the models on the pareto frontier of validation score and inference time, ordered by increasing inference time.
+            Must contain at least two models.
+        max_score_loss : float, default = 0.01
+            The maximum decrease in validation score (in terms of `eval_metric`) of the cascade compared to the final model.
+        name : str, default = None
+            The name of the cascade. If None, the name is 'Cascade_' followed by the name of the final model.
+        num_thresholds : int, default = 100
+            The number of candidate thresholds considered for each model, taken from the quantiles of the confidence of its predictions.
+
+        Returns
+        -------
+        The name of the cascade, or None if no model exits rows early and the cascade is therefore not registered.
+        """
+        if self.problem_type not in [BINARY, MULTICLASS]:
+            raise AssertionError(f'Ensemble Cascade not implemented for problem_type=={self.problem_type}')
+        if models is None:
+            models = self._get_cascade_models_default()
+            if len(models) < 2:
+                logger.warning(f'Warning: Skipping fit_cascade, the pareto frontier of validation score and inference time '
+                               f'contains fewer than two models: {models}')
+                return None
+        models = list(models)
+        if len(models) < 2:
+            raise ValueError(f'Cascade must contain at least two models: {models}')
+        model_names = self.get_model_names(can_infer=True)
+        invalid_models = [model for model in models if model not in model_names]
+        if invalid_models:
+            raise ValueError(f'Cascade models must be trained models which can infer, invalid models: {invalid_models}')
+        if len(models) != len(set(models)):
+            raise ValueError(f'Cascade models must be unique: {models}')
+        if name is None:
+            name = f'Cascade_{models[-1]}'
+        if name in self.model_graph:
+            raise ValueError(f'Cascade name must differ from the names of trained models: {name}')
+
+        if self.bagged_mode:
+            y = self.load_y()
+            model_pred_proba_dict = self.get_model_oof_dict(models=models)
+        else:
+            y = self.load_y_val()
+            model_pred_proba_dict = self.get_model_pred_proba_dict(X=self.load_X_val(), models=models, use_val_cache=True)
+        if y is None:
+            raise AssertionError('fit_cascade requires the training data to be cached, set `cache_data=True` during fit.')
+
+        # Rows exit at the earliest model whose threshold they reach, the final model predicts on the rows remaining after all the other models
+        y_pred_proba_final = model_pred_proba_dict[models[-1]]
+        score_final = self.score_with_y_pred_proba(y=y, y_pred_proba=y_pred_proba_final)
+        score_min = score_final - max_score_loss
+        num_rows = len(y)
+        exited = np.zeros(num_rows, dtype=bool)
+        y_pred_proba = np.array(y_pred_proba_final, copy=True)
+        models_cascade = []
+        thresholds = []
+        for model in models[:-1]:
+            y_pred_proba_model = model_pred_proba_dict[model]
+            confidence = self._get_cascade_confidence(y_pred_proba_model)
+            threshold = self._fit_cascade_threshold(y=y, y_pred_proba=y_pred_proba, y_pred_proba_model=y_pred_proba_model,
+                                                    confidence=confidence, exited=exited, score_min=score_min, num_thresholds=num_thresholds)
+            if threshold is None:
+                logger.log(20, f'\tRemoving {model} from cascade {name}: No threshold exits rows early within max_score_loss={max_score_loss}')
+                continue
+            exit_rows = ~exited & (confidence >= threshold)
+            y_pred_proba[exit_rows] = y_pred_proba_model[exit_rows]
+            exited |= exit_rows
+            models_cascade.append(model)
+            thresholds.append(threshold)
+        if not models_cascade:
+            logger.warning(f'Warning: Skipping cascade {name}, no model exits rows early within max_score_loss={max_score_loss}')
+            return None
+        models_cascade.append(models[-1])
+
+        # The expected inference time of the cascade weighs the inference time of each model by the fraction of rows predicted on by the model
+        model_pred_order = self._construct_model_pred_order(models_cascade)
+        exit_frac_dict = dict()
+        remaining = np.ones(num_rows, dtype=bool)
+        for model, threshold in zip(models_cascade[:-1], thresholds):
+            exit_rows = remaining & (self._get_cascade_confidence(model_pred_proba_dict[model]) >= threshold)
+            exit_frac_dict[model] = exit_rows.mean()
+            remaining &= ~exit_rows
+        exit_frac_dict[models_cascade[-1]] = remaining.mean()
+        pred_time_val = 0
+        frac_remaining = 1
+        for model in model_pred_order:
+            predict_time = self.get_model_attribute(model=model, attribute='predict_time')
+            if predict_time is not None:
+                pred_time_val += predict_time * frac_remaining
+            if model in exit_frac_dict:
+                frac_remaining -= exit_frac_dict[model]
+
+        score_val = self.score_with_y_pred_proba(y=y, y_pred_proba=y_pred_proba)
+        exit_frac = [exit_frac_dict[model] for model in models_cascade]
+        self._get_cascades()[name] = dict(
+            models=models_cascade,
+            thresholds=thresholds,
+            model_pred_order=model_pred_order,
+            exit_frac=exit_frac,
+            score_val=score_val,
+            pred_time_val=pred_time_val,
+        )
+        logger.log(20, f'Fit cascade {name}: score_val={round(score_val, 4)} (final model: {round(score_final, 4)}), '
+                       f'{round(pred_time_val, 3)}s expected pred_time_val')
+        for model, threshold, model_exit_frac in zip(models_cascade[:-1], thresholds, exit_frac[:-1]):
+            logger.log(20, f'\t{model}: threshold={round(threshold, 4)}, {round(model_exit_frac * 100, 1)}% of rows exit')
+        logger.log(20, f'\t{models_cascade[-1]}: {round(exit_frac[-1] * 100, 1)}% of rows remain')
+        self.save()
+        return name
+
+    def _fit_cascade_threshold(self, y, y_pred_proba: np.ndarray, y_pred_proba_model: np.ndarray, confidence: np.ndarray,
+                               exited: np.ndarray, score_min: float, num_thresholds: int) -> Optional[float]:
+        """
+        Returns the lowest candidate threshold of a cascade model for which the score of the cascade is at least `score_min`,
+        or None if no candidate threshold satisfies it while exiting rows early.
+        `y_pred_proba` is the cascade output without the model, `exited` marks the rows which already exited at prior models of the cascade.
+        """
+        confidence_remaining = confidence[~exited]
+        if len(confidence_remaining) == 0:
+            return None
+        thresholds = np.unique(np.quantile(confidence_remaining, np.linspace(0, 1, num_thresholds + 1)))
+        # Thresholds are checked from the most to the fewest rows exiting, returning the first satisfying the score constraint
+        for threshold in thresholds:
+            exit_rows = ~exited & (confidence >= threshold)
+            y_pred_proba_cascade = np.where(exit_rows if y_pred_proba.ndim == 1 else exit_rows[:, None], y_pred_proba_model, y_pred_proba)
+            if self.score_with_y_pred_proba(y=y, y_pred_proba=y_pred_proba_cascade) >= score_min:
+                return float(threshold)
+        return None
+
+    def _get_cascade_confidence(self, pred_proba: np.ndarray) -> np.ndarray:
+        """Returns the confidence of each row of `pred_proba` used by the early exit of cascades, the highest predicted class probability."""
+        if self.problem_type == BINARY:
+            return np.maximum(pred_proba, 1 - pred_proba)
+        elif self.problem_type == MULTICLASS:
+            return pred_proba.max(axis=1)
+        else:
+            raise AssertionError(f'Invalid cascade problem_type: {self.problem_type}')
+
+    def _get_cascade_models_default(self) -> List[str]:
+        leaderboard = self.leaderboard()
+        leaderboard = leaderboard[leaderboard['model'].isin(self.get_model_names(can_infer=True))]
+        leaderboard = get_leaderboard_pareto_frontier(leaderboard=leaderboard, score_col='score_val', inference_time_col='pred_time_val')
+        return list(reversed(leaderboard['model'].tolist()))
+
+    def _get_cascades(self) -> Dict[str, dict]:
+        # Trainers saved prior to the addition of cascades lack the attribute
+        if getattr(self, '_cascades', None) is None:
+            self._cascades = dict()
+        return self._cascades
+
+    def get_cascade_names(self) -> List[str]:
+        """Returns the names of the cascades fit by `fit_cascade`."""
+        return list(self._get_cascades().keys())
+
+    def get_cascade_info(self, name: str) -> dict:
+        """
+        Returns the plan of the cascade `name`: its models, their thresholds, the fraction of validation rows exiting at each model,
+        its score_val and its expected pred_time_val.
+        """
+        return copy.deepcopy(self._get_cascades()[name])
+
+    def get_cascade_pred_proba(self, X: pd.DataFrame, name: str, record_pred_time: bool = False):
+        """
+        Predicts on X with the cascade `name` fit by `fit_cascade`.
+
+        If `record_pred_time==True`, outputs tuple (pred_proba, pred_time), else output only pred_proba
+        """
+        cascade = self._get_cascades()[name]
+        time_start = time.time()
+        model_pred_proba_dict = self.get_model_pred_proba_dict(X=X, models=cascade['models'], cascade=True,
+                                                               cascade_threshold=cascade['thresholds'],
+                                                               model_pred_order=cascade['model_pred_order'])
+        pred_proba = model_pred_proba_dict[cascade['models'][-1]]
+        if record_pred_time:
+            return pred_proba, time.time() - time_start
+        return pred_proba
+
     def get_model_oof_dict(self, models: List[str]) -> dict:
         """
         Returns a dictionary of out-of-fold prediction probabilities, keyed by model name
@@ -1002,7 +1288,8 @@ class AbstractTrainer:
         stack_column_names, _ = self._get_stack_column_names(models=base_models)
         X_stacker = convert_pred_probas_to_df(pred_proba_list=pred_proba_list, problem_type=self.problem_type, columns=stack_column_names, index=X.index)
         if use_orig_features:
-            X = pd.concat([X_stacker, X], axis=1)
+            # The blocks of X are not copied, X must be treated as read-only as for any model input
+            X = pd.concat([X_stacker, X], axis=1, copy=False)
         else:
             X = X_stacker
         return X
@@ -1198,15 +1485,19 @@ class AbstractTrainer:
         if self.low_memory:
             model.save()
         else:
-            self.models[model.name] = model
+            with _trainer_state_lock:
+                self.models[model.name] = model
 
     def save(self):
-        models = self.models
-        if self.low_memory:
-            self.models = {}
-        save_pkl.save(path=self.path + self.trainer_file_name, object=self)
-        if self.low_memory:
-            self.models = models
+        with _trainer_state_lock:
+            if getattr(self, '_fit_checkpoint', None) is not None:
+                self._fit_checkpoint['time_saved'] = time.time()
+            models = self.models
+            if self.low_memory:
+                self.models = {}
+            save_pkl.save(path=self.path + self.trainer_file_name, object=self)
+            if self.low_memory:
+                self.models = models
 
     def compile_models(self, model_names='all', with_ancestors=False, compiler_configs=None) -> List[str]:
         """
@@ -1253,6 +1544,8 @@ class AbstractTrainer:
                 model_names_to_configs_dict[model_name] = config
             else:
                 logger.log(20, f'Skipping compilation for {model_name} ... (No config specified)')
+        X_compile_val = None
+        y_compile_val = None
         for model_name in model_names_to_compile:
             model = self.load_model(model_name)
             config = model_names_to_configs_dict[model_name]
@@ -1263,8 +1556,13 @@ class AbstractTrainer:
                 logger.log(20, f'Skipping compilation for {model_name} ... (Already compiled with "{model.get_compiler_name()}" backend)')
             elif model.can_compile(compiler_configs=config):
                 logger.log(20, f'Compiling model: {model.name} ... Config = {config}')
+                if X_compile_val is None:
+                    X_compile_val, y_compile_val = self._load_compile_val_data()
+                X_val_model = None
+                if X_compile_val is not None:
+                    X_val_model = self.get_inputs_to_model(model=model, X=X_compile_val)
                 compile_start_time = time.time()
-                model.compile(compiler_configs=config)
+                model.compile(compiler_configs=config, X_val=X_val_model, y_val=y_compile_val)
                 compile_end_time = time.time()
                 model.compile_time = compile_end_time - compile_start_time
                 compile_type = model.get_compiler_name()
@@ -1282,6 +1580,23 @@ class AbstractTrainer:
         self.save()
         return model_names
 
+    def _load_compile_val_data(self, max_rows: int = 10000) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Loads the data used by lossy compilers to verify that compiled models do not regress in score.
+        Uses the validation data if present, otherwise the training data. Sampled to at most `max_rows` rows.
+        Returns (None, None) if the data was not cached during fit.
+        """
+        if self.has_val:
+            X, y = self.load_X_val(), self.load_y_val()
+        else:
+            X, y = self.load_X(), self.load_y()
+        if X is None or y is None:
+            return None, None
+        if len(X) > max_rows:
+            X = X.sample(n=max_rows, random_state=0)
+            y = y.loc[X.index]
+        return X, y
+
     def persist_models(self, model_names='all', with_ancestors=False, max_memory=None) -> List[str]:
         if model_names == 'all':
             model_names = self.get_model_names()
@@ -1324,18 +1639,17 @@ class AbstractTrainer:
             if not _check_memory():
                 return []
 
-        models = []
-        for model_name in model_names:
-            model = self.load_model(model_name)
-            self.models[model.name] = model
-            models.append(model)
-
+        # Models and then their children are loaded in parallel threads to overlap the I/O and decompression of the model files
+        models = list(map_prefetched(self.load_model, model_names))
+        children = []
         for model in models:
-            # TODO: Move this to model code
             if isinstance(model, BaggedEnsembleModel):
-                for fold, fold_model in enumerate(model.models):
-                    if isinstance(fold_model, str):
-                        model.models[fold] = model.load_child(fold_model)
+                children += [(model, fold) for fold, fold_model in enumerate(model.models) if isinstance(fold_model, str)]
+        children_loaded = map_prefetched(lambda child: child[0].load_child(child[0].models[child[1]]), children)
+        for (model, fold), child_model in zip(children, children_loaded):
+            model.models[fold] = child_model
+        for model in models:
+            self.models[model.name] = model
         return model_names
 
     # TODO: model_name change to model in params
@@ -1605,6 +1919,14 @@ class AbstractTrainer:
         if model.val_score is not None and np.isnan(model.val_score):
             logger.warning(f'WARNING: {model.name} has a val_score of {model.val_score} (NaN)! This should never happen. The model will not be saved to avoid instability.')
             return False
+        with _trainer_state_lock:
+            self._add_model_to_graph(model=model, stack_name=stack_name, level=level, y_pred_proba_val=y_pred_proba_val)
+        self._log_model_stats(model)
+        if self.low_memory:
+            del model
+        return True
+
+    def _add_model_to_graph(self, model: AbstractModel, stack_name: str, level: int, y_pred_proba_val=None):
         # TODO: Add to HPO
         if isinstance(model, BaggedEnsembleModel):
             type_inner = model._child_type
@@ -1652,10 +1974,6 @@ class AbstractTrainer:
                 elif level <= self.model_graph.nodes[base_model_name]['level']:
                     raise AssertionError(f"Model '{model.name}' depends on model '{base_model_name}', but '{base_model_name}' is not in a lower stack level. ('{model.name}' level: {level}, '{base_model_name}' level: {self.model_graph.nodes[base_model_name]['level']})")
                 self.model_graph.add_edge(base_model_name, model.name)
-        self._log_model_stats(model)
-        if self.low_memory:
-            del model
-        return True
 
     def _path_attr_model(self, model: str):
         """Returns directory where attributes are cached"""
@@ -1832,7 +2150,8 @@ class AbstractTrainer:
     # TODO: Time allowance not accurate if running from fit_continue
     # TODO: Remove level and stack_name arguments, can get them automatically
     # TODO: Make sure that pretraining on X_unlabeled only happens 1 time rather than every fold of bagging. (Do during pretrain API work?)
-    def _train_multi_repeats(self, X, y, models: list, n_repeats, n_repeat_start=1, time_limit=None, time_limit_total_level=None, **kwargs) -> List[str]:
+    def _train_multi_repeats(self, X, y, models: list, n_repeats, n_repeat_start=1, time_limit=None, time_limit_total_level=None, num_bag_models_parallel=1,
+                             **kwargs) -> List[str]:
         """
         Fits bagged ensemble models with additional folds and/or bagged repeats.
         Models must have already been fit prior to entering this method.
@@ -1859,31 +2178,70 @@ class AbstractTrainer:
                     logger.log(15, 'Not enough time left to finish repeated k-fold bagging, stopping early ...')
                     break
             logger.log(20, f'Repeating k-fold bagging: {n+1}/{n_repeats}')
-            for i, model in enumerate(models_valid):
-                if not self.get_model_attribute(model=model, attribute='can_fit'):
+            if num_bag_models_parallel > 1:
+                time_left = None if time_limit is None else time_limit - (time.time() - time_start)
+                models_valid_next = self._train_multi_repeat_parallel(X=X, y=y, models=models_valid, n_repeat=n,
+                                                                      num_bag_models_parallel=num_bag_models_parallel, time_limit=time_left, **kwargs)
+            else:
+                for i, model in enumerate(models_valid):
+                    if not self.get_model_attribute(model=model, attribute='can_fit'):
+                        if isinstance(model, str):
+                            models_valid_next.append(model)
+                        else:
+                            models_valid_next.append(model.name)
+                        continue
+
                     if isinstance(model, str):
-                        models_valid_next.append(model)
-                    else:
+                        model = self.load_model(model)
+                    if not isinstance(model, BaggedEnsembleModel):
+                        raise AssertionError(f'{model.name} must inherit from BaggedEnsembleModel to perform repeated k-fold bagging. '
+                                             f'Model type: {type(model).__name__}')
+                    if model._n_repeats_finished > n:
+                        # Repeat was already fit, such as when resuming fit
                         models_valid_next.append(model.name)
-                    continue
-
-                if isinstance(model, str):
-                    model = self.load_model(model)
-                if not isinstance(model, BaggedEnsembleModel):
-                    raise AssertionError(f'{model.name} must inherit from BaggedEnsembleModel to perform repeated k-fold bagging. Model type: {type(model).__name__}')
-                if time_limit is None:
-                    time_left = None
-                else:
-                    time_start_model = time.time()
-                    time_left = time_limit - (time_start_model - time_start)
+                        continue
+                    if time_limit is None:
+                        time_left = None
+                    else:
+                        time_start_model = time.time()
+                        time_left = time_limit - (time_start_model - time_start)
 
-                models_valid_next += self._train_single_full(X=X, y=y, model=model, k_fold_start=0, k_fold_end=None, n_repeats=n + 1, n_repeat_start=n, time_limit=time_left, **kwargs)
+                    models_valid_next += self._train_single_full(X=X, y=y, model=model, k_fold_start=0, k_fold_end=None, n_repeats=n + 1, n_repeat_start=n,
+                                                                 time_limit=time_left, **kwargs)
             models_valid = copy.deepcopy(models_valid_next)
             models_valid_next = []
             repeats_completed += 1
         logger.log(20, f'Completed {n_repeat_start + repeats_completed}/{n_repeats} k-fold bagging repeats ...')
         return models_valid
 
+    def _train_multi_repeat_parallel(self, X, y, models: list, n_repeat: int, num_bag_models_parallel: int, time_limit=None, **kwargs) -> List[str]:
+        """
+        Fits bagged repeat `n_repeat` of models concurrently via self._train_single_full_parallel.
+        This method should only be called in self._train_multi_repeats
+        Returns a list of the model names to repeat again, in the order of `models`.
+        """
+        models_to_fit = []
+        for model in models:
+            if not self.get_model_attribute(model=model, attribute='can_fit'):
+                continue
+            if isinstance(model, str):
+                model = self.load_model(model)
+            if not isinstance(model, BaggedEnsembleModel):
+                raise AssertionError(f'{model.name} must inherit from BaggedEnsembleModel to perform repeated k-fold bagging. '
+                                     f'Model type: {type(model).__name__}')
+            if model._n_repeats_finished > n_repeat:
+                continue  # Repeat was already fit, such as when resuming fit
+            models_to_fit.append(model)
+        model_names_trained = self._train_single_full_parallel(X=X, y=y, models=models_to_fit, num_bag_models_parallel=num_bag_models_parallel,
+                                                               k_fold_start=0, k_fold_end=None, n_repeats=n_repeat + 1, n_repeat_start=n_repeat,
+                                                               time_limit=time_limit, **kwargs)
+        model_names_trained = {model.name: names for model, names in zip(models_to_fit, model_names_trained)}
+        models_valid_next = []
+        for model in models:
+            model_name = model if isinstance(model, str) else model.name
+            models_valid_next += model_names_trained.get(model_name, [model_name])
+        return models_valid_next
+
     def _train_multi_initial(self, X, y, models: List[AbstractModel], k_fold, n_repeats, hyperparameter_tune_kwargs=None, time_limit=None, feature_prune_kwargs=None, **kwargs):
         """
         Fits models that have not previously been fit.
@@ -1961,9 +2319,12 @@ class AbstractTrainer:
     # TODO: Robert dataset, LightGBM is super good but RF and KNN take all the time away from it on 1h despite being much worse
     # TODO: Add time_limit_per_model
     # TODO: Rename for v0.1
-    def _train_multi_fold(self, X, y, models: List[AbstractModel], time_limit=None, time_split=False, time_ratio=1, hyperparameter_tune_kwargs=None, **kwargs) -> List[str]:
+    def _train_multi_fold(self, X, y, models: List[AbstractModel], time_limit=None, time_split=False, time_ratio=1, hyperparameter_tune_kwargs=None,
+                          num_bag_models_parallel=1, **kwargs) -> List[str]:
         """
         Trains and saves a list of models sequentially.
+        If `num_bag_models_parallel > 1` and no model is hyperparameter tuned, bagged models are instead trained via self._train_single_full_parallel,
+        which trains the models whose folds are fit with Ray concurrently.
         This method should only be called in self._train_multi_initial
         Returns a list of trained model names.
         """
@@ -1971,6 +2332,15 @@ class AbstractTrainer:
         time_start = time.time()
         if time_limit is not None:
             time_limit = time_limit * time_ratio
+        if num_bag_models_parallel > 1 and self.bagged_mode and not time_split and not hyperparameter_tune_kwargs:
+            models = [self.load_model(model) if isinstance(model, str) else model for model in models]
+            if self.low_memory:
+                models = [copy.deepcopy(model) for model in models]
+            model_names_trained = self._train_single_full_parallel(X, y, models=models, num_bag_models_parallel=num_bag_models_parallel,
+                                                                   time_limit=time_limit, **kwargs)
+            for model_name_trained_lst in model_names_trained:
+                models_valid += model_name_trained_lst
+            return models_valid
         if time_limit is not None and len(models) > 0:
             time_limit_model_split = time_limit / len(models)
         else:
@@ -2001,6 +2371,70 @@ class AbstractTrainer:
 
         return models_valid
 
+    def _train_single_full_parallel(self, X, y, models: List[AbstractModel], num_bag_models_parallel: int, time_limit=None, **kwargs) -> List[List[str]]:
+        """
+        Trains and saves bagged models concurrently, with up to `num_bag_models_parallel` models being fit at the same time.
+        Only models whose folds are fit with Ray on the local machine (ParallelLocalFoldFittingStrategy) are fit concurrently:
+        the folds of all models being fit are queued together and Ray assigns them to workers as resources free up,
+        so workers are not left idle while the slowest fold of a model finishes.
+        Other fold fitting strategies size their fold jobs as if the model was alone on the machine,
+        so these models are fit one after another once the concurrent models are done.
+        The memory checks of concurrent models are given an equal share of the available memory (refer to the `available_mem_ratio` fit argument).
+        Models with the longest estimated fold duration are started first.
+        Each model is given the time remaining from `time_limit` when it starts, as when training sequentially.
+        Returns, for each model in `models`, the list of trained model names returned by self._train_single_full.
+        """
+        time_start = time.time()
+        order = self._get_models_order_by_fold_duration(models)
+        order_concurrent = [i for i in order if self._can_fit_bagged_model_concurrently(models[i])]
+        order_sequential = [i for i in order if i not in order_concurrent]
+        num_models_concurrent = min(num_bag_models_parallel, len(order_concurrent))
+
+        def _train(model, available_mem_ratio=1):
+            time_left = None if time_limit is None else time_limit - (time.time() - time_start)
+            fit_kwargs = kwargs.get('fit_kwargs', None)
+            if available_mem_ratio < 1:
+                fit_kwargs = dict(fit_kwargs or dict(), available_mem_ratio=available_mem_ratio)
+            return self._train_single_full(X, y, model, time_limit=time_left, **{**kwargs, 'fit_kwargs': fit_kwargs})
+
+        model_names_trained = [None] * len(models)
+        if order_concurrent:
+            logger.log(20, f'Fitting up to {num_models_concurrent} bagged models in parallel ...')
+            with ThreadPoolExecutor(max_workers=num_bag_models_parallel) as executor:
+                # Models fit at the same time share the available memory
+                futures = {i: executor.submit(_train, models[i], 1 / num_models_concurrent) for i in order_concurrent}
+                for i, future in futures.items():
+                    model_names_trained[i] = future.result()
+        for i in order_sequential:
+            model_names_trained[i] = _train(models[i])
+        return model_names_trained
+
+    @staticmethod
+    def _can_fit_bagged_model_concurrently(model: AbstractModel) -> bool:
+        """Returns True if the folds of `model` are fit with ParallelLocalFoldFittingStrategy, for both CPU and GPU fits."""
+        if not isinstance(model, BaggedEnsembleModel):
+            return False
+        return all(
+            model._get_fold_fitting_strategy(model_base=model.model_base, num_gpus=num_gpus) == ParallelLocalFoldFittingStrategy
+            for num_gpus in [0, 1]
+        )
+
+    def _get_models_order_by_fold_duration(self, models: List[AbstractModel]) -> List[int]:
+        """
+        Returns the indices of `models` sorted by decreasing estimated fold duration, which is the duration of the previously fit folds of a model.
+        Models without previously fit folds keep their relative order and are placed first, as their duration is unknown.
+        """
+        fold_durations = []
+        for model in models:
+            fold_duration = None
+            if model.name in self.model_graph:
+                fit_time = self.get_model_attribute(model=model.name, attribute='fit_time', default=None)
+                num_children = self.get_model_attribute(model=model.name, attribute='num_children', default=None)
+                if fit_time is not None and num_children:
+                    fold_duration = fit_time / num_children
+            fold_durations.append(np.inf if fold_duration is None else fold_duration)
+        return sorted(range(len(models)), key=lambda i: -fold_durations[i])
+
     def _train_multi(self, X, y, models: List[AbstractModel], hyperparameter_tune_kwargs=None, feature_prune_kwargs=None, k_fold=None, n_repeats=None, n_repeat_start=0, time_limit=None, **kwargs) -> List[str]:
         """
         Train a list of models using the same data.
@@ -2022,8 +2456,20 @@ class AbstractTrainer:
             n_repeats_initial = 1
         if n_repeat_start == 0:
             time_start = time.time()
-            model_names_trained = self._train_multi_initial(X=X, y=y, models=models, k_fold=k_fold, n_repeats=n_repeats_initial, hyperparameter_tune_kwargs=hyperparameter_tune_kwargs,
-                                                            feature_prune_kwargs=feature_prune_kwargs, time_limit=time_limit, **kwargs)
+            if getattr(self, '_is_resuming_fit', False):
+                model_names_resumed, models = self._resume_train_multi(X=X, y=y, models=models, k_fold=k_fold, time_limit=time_limit, **kwargs)
+            else:
+                model_names_resumed = dict()
+            if models:
+                time_left = None if time_limit is None else time_limit - (time.time() - time_start)
+                model_names_trained = self._train_multi_initial(X=X, y=y, models=models, k_fold=k_fold, n_repeats=n_repeats_initial,
+                                                                hyperparameter_tune_kwargs=hyperparameter_tune_kwargs,
+                                                                feature_prune_kwargs=feature_prune_kwargs, time_limit=time_left, **kwargs)
+            else:
+                model_names_trained = []
+            if model_names_resumed:
+                # Keep the order of the models to fit
+                model_names_trained = [name for model_names in model_names_resumed.values() for name in model_names] + model_names_trained
             n_repeat_start = n_repeats_initial
             if time_limit is not None:
                 time_limit = time_limit - (time.time() - time_start)
@@ -2034,6 +2480,43 @@ class AbstractTrainer:
                                                             k_fold=k_fold, n_repeats=n_repeats, n_repeat_start=n_repeat_start, time_limit=time_limit, time_limit_total_level=time_limit_total_level, **kwargs)
         return model_names_trained
 
+    def _resume_train_multi(self, X, y, models: List[AbstractModel], k_fold: int, time_limit=None,
+                            **kwargs) -> Tuple[Dict[str, List[str]], List[AbstractModel]]:
+        """
+        Finds the models which were already fit by the fit being resumed, among the models to fit in self._train_multi.
+        Bagged models whose fit was interrupted partway through a bagging repeat are fit on the remaining folds of the repeat.
+        Models which failed to train in the fit being resumed are not fit again.
+        This method should only be called in self._train_multi when resuming fit.
+        Returns a dict of model name to the names of its already fit models, and the list of models which remain to be fit.
+        """
+        model_names_fit = self.get_model_names()
+        model_names_resumed = dict()
+        models_remaining = []
+        for model in models:
+            model_name = model if isinstance(model, str) else model.name
+            if model_name in model_names_fit:
+                model_names_resumed[model_name] = [model_name]
+            elif model_name in self._extra_banned_names:
+                # Model was hyperparameter tuned, its fit models are the HPO trials of the model
+                model_names_resumed[model_name] = [name for name in model_names_fit if name.startswith(model_name + os.path.sep)]
+            elif model_name not in self._models_failed_to_train:
+                models_remaining.append(model)
+
+        time_start = time.time()
+        for model_name in model_names_resumed:
+            if len(model_names_resumed[model_name]) != 1 or model_name != model_names_resumed[model_name][0]:
+                continue
+            model = self.load_model(model_name)
+            if not isinstance(model, BaggedEnsembleModel) or model._k_fold_end == 0:
+                continue
+            logger.log(20, f'Resuming fit of {model_name}: {model._k_fold_end}/{k_fold} folds of bagging repeat {model._n_repeats} were fit ...')
+            self._train_single_full(X=X, y=y, model=model, k_fold=k_fold, k_fold_start=model._k_fold_end, k_fold_end=k_fold,
+                                    n_repeats=model._n_repeats, n_repeat_start=model._n_repeats_finished,
+                                    time_limit=None if time_limit is None else time_limit - (time.time() - time_start), **kwargs)
+        if model_names_resumed:
+            logger.log(20, f'Resumed {len(model_names_resumed)} models which were fit before fit was interrupted: {list(model_names_resumed.keys())}')
+        return model_names_resumed, models_remaining
+
     def _train_multi_and_ensemble(self, X, y, X_val, y_val, hyperparameters: dict = None, X_unlabeled=None, num_stack_levels=0, time_limit=None, groups=None, **kwargs) -> List[str]:
         """Identical to self.train_multi_levels, but also saves the data to disk. This should only ever be called once."""
         if time_limit is not None and time_limit <= 0:
@@ -2052,8 +2535,75 @@ class AbstractTrainer:
         if X_val is not None:
             self._num_rows_val = len(X_val)
         self._num_cols_train = len(list(X.columns))
+        time_start = time.time()
+        self._fit_checkpoint = dict(
+            fit_kwargs=dict(hyperparameters=hyperparameters, num_stack_levels=num_stack_levels, time_limit=time_limit, **kwargs),
+            has_X_unlabeled=X_unlabeled is not None,
+            time_elapsed=0,
+            time_start=time_start,
+            time_saved=time_start,
+        )
+        self.save()
         model_names_fit = self.train_multi_levels(X, y, hyperparameters=hyperparameters, X_val=X_val, y_val=y_val,
                                                   X_unlabeled=X_unlabeled, level_start=1, level_end=num_stack_levels+1, time_limit=time_limit, **kwargs)
+        self._fit_checkpoint = None
+        if len(self.get_model_names()) == 0:
+            raise ValueError('AutoGluon did not successfully train any models')
+        return model_names_fit
+
+    def can_resume_fit(self) -> bool:
+        """Returns True if the trainer was interrupted while fitting and can resume fitting via `resume_fit`."""
+        return getattr(self, '_fit_checkpoint', None) is not None and self.is_data_saved
+
+    def resume_fit(self, time_limit: float = None) -> List[str]:
+        """
+        Resumes a `_train_multi_and_ensemble` call which was interrupted, for example by running out of memory or by the machine being preempted.
+        The trainer must have been loaded from disk, where it is saved after each model is fit.
+
+        Models and bagging repeats which were completed before the interruption are reused, including bagged models with partially fit repeats.
+        The remaining models are fit with the same arguments as the interrupted call, on the training data saved by the trainer.
+        Models which were being fit at the time of the interruption are fit again from scratch.
+
+        Parameters
+        ----------
+        time_limit : float, default = None
+            Time limit in seconds of the resumed fit.
+            If None, the time remaining from the time limit of the interrupted call is used, not counting the time since the last checkpoint of the trainer.
+
+        Returns a list of the model names that were fit or reused, in order of fit.
+        """
+        if not self.can_resume_fit():
+            if getattr(self, '_fit_checkpoint', None) is not None:
+                raise AssertionError('Unable to resume fit because the training data was not saved. Training data is only saved if `cache_data=True`.')
+            raise AssertionError('Unable to resume fit because no fit was interrupted.')
+        fit_checkpoint = self._fit_checkpoint
+        if fit_checkpoint['has_X_unlabeled']:
+            logger.warning('Warning: Unlabeled data was specified in the interrupted fit, but is not saved by the trainer. '
+                           'Resuming fit without unlabeled data.')
+        fit_kwargs = fit_checkpoint['fit_kwargs'].copy()
+        time_elapsed = fit_checkpoint['time_elapsed'] + fit_checkpoint['time_saved'] - fit_checkpoint['time_start']
+        if time_limit is None and fit_kwargs['time_limit'] is not None:
+            time_limit = fit_kwargs['time_limit'] - time_elapsed
+            if time_limit <= 0:
+                raise AssertionError(f'Unable to resume fit, the time limit ({round(fit_kwargs["time_limit"], 2)}s) was reached before fit was interrupted. '
+                                     f'Specify `time_limit` to resume fit with additional time.')
+        fit_kwargs['time_limit'] = time_limit
+        num_stack_levels = fit_kwargs.pop('num_stack_levels')
+        logger.log(20, f'Resuming fit from the last checkpoint ({len(self.get_model_names())} models already fit, {round(time_elapsed, 2)}s elapsed) ...')
+
+        X = self.load_X()
+        y = self.load_y()
+        X_val = self.load_X_val() if self._X_val_saved else None
+        y_val = self.load_y_val() if self._y_val_saved else None
+        time_start = time.time()
+        fit_checkpoint.update(dict(time_elapsed=time_elapsed, time_start=time_start, time_saved=time_start))
+        self._is_resuming_fit = True
+        try:
+            model_names_fit = self.train_multi_levels(X, y, X_val=X_val, y_val=y_val, level_start=1, level_end=num_stack_levels+1, **fit_kwargs)
+        finally:
+            self._is_resuming_fit = False
+        self._fit_checkpoint = None
+        self.save()
         if len(self.get_model_names()) == 0:
             raise ValueError('AutoGluon did not successfully train any models')
         return model_names_fit
@@ -2360,6 +2910,9 @@ class AbstractTrainer:
 
     def _get_banned_model_names(self) -> list:
         """Gets all model names which would cause model files to be overwritten if a new model was trained with the name"""
+        if getattr(self, '_is_resuming_fit', False):
+            # Model templates must get the names they had in the interrupted fit to detect models which were already fit
+            return []
         return self.get_model_names() + list(self._extra_banned_names)
 
     def leaderboard(self, extra_info=False):
@@ -2449,6 +3002,17 @@ class AbstractTrainer:
             'fit_order': fit_order,
             **model_info_dict,
         })
+        cascades = self._get_cascades()
+        if cascades:
+            df_cascades = pd.DataFrame(data={
+                'model': list(cascades.keys()),
+                'score_val': [cascade['score_val'] for cascade in cascades.values()],
+                'pred_time_val': [cascade['pred_time_val'] for cascade in cascades.values()],
+                'fit_time': [self.get_model_attribute_full(model=cascade['models'], attribute='fit_time') for cascade in cascades.values()],
+                'stack_level': [self.get_model_level(cascade['models'][-1]) for cascade in cascades.values()],
+                'can_infer': True,
+            })
+            df = pd.concat([df, df_cascades], ignore_index=True)
         df_sorted = df.sort_values(by=['score_val', 'pred_time_val', 'model'], ascending=[False, True, False]).reset_index(drop=True)
 
         df_columns_lst = df_sorted.columns.tolist()
@@ -2636,6 +3200,11 @@ class AbstractTrainer:
 
         for model in models_to_remove:
             self._delete_model_from_graph(model=model)
+        cascades = self._get_cascades()
+        for name in list(cascades.keys()):
+            if any(model in models_to_remove for model in cascades[name]['model_pred_order']):
+                logger.log(20, f'Deleting cascade {name} as it contains deleted models.')
+                cascades.pop(name)
 
         models_kept = self.get_model_names()
 
@@ -2905,6 +3474,10 @@ class AbstractTrainer:
             feature_metadata = feature_metadata.join_metadata(feature_metadata_new).keep_features(list(X.columns))
         model_fit_kwargs['feature_metadata'] = feature_metadata
         #######################
+        # Only the features not yet profiled, such as stack features, are scanned
+        if getattr(self, '_data_memory_profile', None) is None:
+            self._data_memory_profile = DataFrameMemoryProfile()
+        model_fit_kwargs['data_memory_profile'] = self._data_memory_profile.update(X)
         return model_fit_kwargs
 
     def _get_bagged_model_fit_kwargs(self, k_fold: int, k_fold_start: int, k_fold_end: int, n_repeats: int, n_repeat_start: int) -> dict:
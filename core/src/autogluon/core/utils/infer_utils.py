@@ -1,5 +1,34 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import List
+
+import numpy as np
 import pandas as pd
 
+from .utils import get_leaderboard_pareto_frontier
+
+logger = logging.getLogger(__name__)
+
+
+def _get_data_batch(data: pd.DataFrame, batch_size: int) -> pd.DataFrame:
+    """Returns `data` with rows duplicated or sampled to have exactly `batch_size` rows."""
+    data_batch = data
+    len_data = len(data_batch)
+    if len_data < batch_size:
+        # add more rows
+        duplicate_count = int(np.ceil(batch_size / len_data))
+        data_batch = pd.concat([data_batch for _ in range(duplicate_count)])
+        len_data = len(data_batch)
+    if len_data > batch_size:
+        # sample rows
+        data_batch = data_batch.sample(n=batch_size, random_state=0)
+        len_data = len(data_batch)
+
+    if len_data != batch_size:
+        raise AssertionError(f'len(data_batch) must equal batch_size! ({len_data} != {batch_size})')
+    return data_batch
+
 
 def get_model_true_infer_speed_per_row_batch(
         data,
@@ -38,26 +67,7 @@ def get_model_true_infer_speed_per_row_batch(
             'pred_time_test_marginal' is the prediction time needed to predict for this particular model minus dependent model inference times and global preprocessing time.
         time_per_row_transform is the time in seconds per row to do the feature preprocessing.
     """
-    import copy
-    import time
-    import numpy as np
-    import pandas as pd
-    data_batch = copy.deepcopy(data)
-    len_data = len(data_batch)
-    if len_data == batch_size:
-        pass
-    elif len_data < batch_size:
-        # add more rows
-        duplicate_count = int(np.ceil(batch_size / len_data))
-        data_batch = pd.concat([data_batch for _ in range(duplicate_count)])
-        len_data = len(data_batch)
-    if len_data > batch_size:
-        # sample rows
-        data_batch = data_batch.sample(n=batch_size, random_state=0)
-        len_data = len(data_batch)
-
-    if len_data != batch_size:
-        raise AssertionError(f'len(data_batch) must equal batch_size! ({len_data} != {batch_size})')
+    data_batch = _get_data_batch(data=data, batch_size=batch_size)
 
     if persist_models:
         predictor.persist_models(models='all')
@@ -191,3 +201,152 @@ def get_model_true_infer_speed_per_row_batch_bulk(data: pd.DataFrame,
     infer_df_full = infer_df_full.reset_index(drop=True)
 
     return infer_df_full, infer_df_full_transform
+
+
+def benchmark_inference(data: pd.DataFrame,
+                        *,
+                        predictor,
+                        models: List[str] = None,
+                        batch_sizes: List[int] = None,
+                        num_threads: List[int] = None,
+                        repeats: int = 3,
+                        persist_models: bool = True,
+                        silent: bool = False) -> pd.DataFrame:
+    """
+    Benchmarks the inference latency of each model of a predictor, broken down into the stages of inference, for a sweep of batch sizes and thread counts.
+
+    Parameters
+    ----------
+    data : :class:`TabularDataset` or :class:`pd.DataFrame`
+        Table of the data, which is similar to a pandas DataFrame. Rows are duplicated or sampled to form each batch.
+        If it contains the label column, the models are scored on it to compute the Pareto frontier of score and latency,
+        otherwise their validation scores are used.
+    predictor : TabularPredictor
+        Fitted predictor to benchmark.
+    models : List[str], default = None
+        Models to benchmark. Models they depend on are always benchmarked as well. If None, all models that can infer are benchmarked.
+    batch_sizes : List[int], default = [1, 100, 10000]
+        Batch sizes to benchmark.
+    num_threads : List[int], default = None
+        Thread counts to benchmark. The thread pools of the native libraries used by models (OpenMP, BLAS) are limited to each thread count via `threadpoolctl`.
+        Models which explicitly set their own thread count for inference are not affected.
+        If None, the thread count is not limited, which is reported as a thread count of -1.
+    repeats : int, default = 3
+        Repeats of each measurement. The median time over the repeats is reported.
+    persist_models : bool, default = True
+        If True, attempts to persist models into memory before benchmarking, in which case 'load_time' is 0.
+        Models persisted by this call are unpersisted once the benchmark is done, models that were already persisted stay persisted.
+        If False, models are not persisted by this call: models that are not already persisted are loaded from disk for each prediction,
+        as they would be without persisting them, while models that are already persisted stay persisted and have a 'load_time' of 0.
+    silent : bool, default = False
+        If False, logs the end-to-end latency of each model for each configuration.
+
+    Returns
+    -------
+    pd.DataFrame with one row per model, batch size and thread count. It can be saved in a machine-readable format via `to_json` or `to_csv`. Columns:
+        'model': The model name.
+        'batch_size': The number of rows predicted on at once.
+        'num_threads': The thread count, -1 if not limited.
+        'transform_time': Time of the global feature preprocessing (`predictor.transform_features`), shared by all models.
+        'load_time', 'stack_time', 'preprocess_time', 'predict_time', 'pred_time_marginal':
+            Time of each stage of the inference of the model, as returned by the trainer's `profile_inference`.
+        'pred_time': End-to-end time of `predictor.predict(data, model=model)`:
+            `transform_time` plus `pred_time_marginal` of the model and all models it depends on.
+        'pred_time_per_row': `pred_time` divided by `batch_size`.
+        'score': The test score of the model if `data` contains the label column, otherwise its validation score.
+        'is_pareto_frontier': Whether the model is on the Pareto frontier of score and `pred_time` for this batch size and thread count,
+            meaning no other model has both a lower `pred_time` and a better or equal score.
+    All times are in seconds for the whole batch.
+    """
+    if batch_sizes is None:
+        batch_sizes = [1, 100, 10000]
+    if num_threads is None:
+        num_threads = [None]
+    models_persisted = predictor.persist_models(models='all') if persist_models else []
+    try:
+        return _benchmark_inference(data=data, predictor=predictor, models=models, batch_sizes=batch_sizes, num_threads=num_threads,
+                                    repeats=repeats, silent=silent)
+    finally:
+        if models_persisted:
+            predictor.unpersist_models(models=models_persisted)
+
+
+def _benchmark_inference(data: pd.DataFrame, *, predictor, models: List[str], batch_sizes: List[int], num_threads: list, repeats: int,
+                         silent: bool) -> pd.DataFrame:
+    learner = predictor._learner
+    trainer = predictor._trainer
+    if models is None:
+        models = trainer.get_model_names(can_infer=True)
+    else:
+        models = trainer.get_minimum_models_set(models)
+
+    if predictor.label in data:
+        leaderboard = predictor.leaderboard(data, silent=True)
+        score_col = 'score_test'
+        data = data.drop(columns=[predictor.label])
+    else:
+        leaderboard = predictor.leaderboard(silent=True)
+        score_col = 'score_val'
+    model_scores = leaderboard.set_index('model')[score_col]
+
+    results = []
+    for num_threads_config in num_threads:
+        for batch_size in batch_sizes:
+            data_batch = _get_data_batch(data=data, batch_size=batch_size)
+            with _limit_threads(num_threads=num_threads_config):
+                result = _benchmark_inference_batch(data=data_batch, learner=learner, trainer=trainer, models=models, repeats=repeats)
+            result['batch_size'] = batch_size
+            result['num_threads'] = -1 if num_threads_config is None else num_threads_config
+            result['score'] = result['model'].map(model_scores)
+            result = _add_pareto_frontier(result)
+            if not silent:
+                logger.log(20, f'Inference latency for batch_size={batch_size}, num_threads={result["num_threads"].iloc[0]}:')
+                for _, row in result.sort_values(by='pred_time').iterrows():
+                    pareto_str = ' (pareto frontier)' if row['is_pareto_frontier'] else ''
+                    logger.log(20, f'\t{round(row["pred_time"], 4)}s\t| {round(row["pred_time_per_row"] * 1e6, 2)}μs per row\t| {row["model"]}{pareto_str}')
+            results.append(result)
+    columns = ['model', 'batch_size', 'num_threads', 'transform_time', 'load_time', 'stack_time', 'preprocess_time', 'predict_time',
+               'pred_time_marginal', 'pred_time', 'pred_time_per_row', 'score', 'is_pareto_frontier']
+    return pd.concat(results, ignore_index=True)[columns]
+
+
+def _benchmark_inference_batch(data: pd.DataFrame, *, learner, trainer, models: List[str], repeats: int) -> pd.DataFrame:
+    """Returns the median stage times over `repeats` of predicting `data` with `models`, one row per model."""
+    transform_times = []
+    profiles = []
+    for _ in range(repeats):
+        time_start = time.time()
+        X = learner.transform_features(data)
+        transform_times.append(time.time() - time_start)
+        profiles.append(trainer.profile_inference(X=X, models=models))
+    profile = pd.concat(profiles).groupby(level=0, sort=False).median()
+    profile['transform_time'] = np.median(transform_times)
+    pred_time_marginal = profile['pred_time_marginal'].to_dict()
+    profile['pred_time'] = [
+        profile['transform_time'].iloc[0] + sum(pred_time_marginal[m] for m in trainer.get_minimum_model_set(model)) for model in profile.index
+    ]
+    profile['pred_time_per_row'] = profile['pred_time'] / len(data)
+    profile = profile.loc[[model for model in profile.index if model in models]]
+    return profile.rename_axis('model').reset_index()
+
+
+def _add_pareto_frontier(result: pd.DataFrame) -> pd.DataFrame:
+    result = result.copy()
+    scored = result[result['score'].notna()]
+    if len(scored) > 0:
+        pareto_frontier = get_leaderboard_pareto_frontier(scored, score_col='score', inference_time_col='pred_time')
+        result['is_pareto_frontier'] = result['model'].isin(pareto_frontier['model'])
+    else:
+        result['is_pareto_frontier'] = False
+    return result
+
+
+@contextmanager
+def _limit_threads(num_threads: int = None):
+    """Limits the thread pools of native libraries to `num_threads` threads within the context. Does nothing if `num_threads` is None."""
+    if num_threads is None:
+        yield
+        return
+    from threadpoolctl import threadpool_limits
+    with threadpool_limits(limits=num_threads):
+        yield
@@ -0,0 +1,199 @@
+import logging
+import os
+import pickle
+import sys
+import types
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['get_memory_size']
+
+# Objects which are shared rather than owned, and are therefore not counted towards the memory size of the objects referencing them
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    logging.Logger,
+)
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), range, np.generic)
+
+
+def _get_memory_size_lightgbm_booster(booster) -> int:
+    # The trees are held by the native library, their text representation has the same size as the model pickle
+    return sys.getsizeof(booster.model_to_string())
+
+
+def _get_memory_size_xgboost_booster(booster) -> int:
+    return len(booster.save_raw())
+
+
+def _get_memory_size_catboost(model) -> int:
+    if not model.is_fitted():
+        return sys.getsizeof(model)
+    return len(model._serialize_model())
+
+
+def _get_memory_size_onnxruntime_session(session) -> int:
+    # The graph and weights are held by the native library, they are about as large as the serialized model.
+    # onnxruntime also keeps the serialized model in Python if the session was created from bytes.
+    model_bytes = getattr(session, '_model_bytes', None)
+    if model_bytes is not None:
+        return sys.getsizeof(session) + sys.getsizeof(model_bytes) + len(model_bytes)
+    return sys.getsizeof(session) + os.path.getsize(session._model_path)
+
+
+# Hooks computing the memory size of objects whose memory is held by a native library, keyed by (module, class name).
+# Matched by name to avoid importing the optional model libraries.
+_NATIVE_MEMORY_SIZE_HOOKS: Dict[tuple, Callable[[Any], int]] = {
+    ('onnxruntime.capi.onnxruntime_inference_collection', 'InferenceSession'): _get_memory_size_onnxruntime_session,
+    ('lightgbm.basic', 'Booster'): _get_memory_size_lightgbm_booster,
+    ('xgboost.core', 'Booster'): _get_memory_size_xgboost_booster,
+    ('catboost.core', 'CatBoost'): _get_memory_size_catboost,
+    ('catboost.core', 'CatBoostClassifier'): _get_memory_size_catboost,
+    ('catboost.core', 'CatBoostRegressor'): _get_memory_size_catboost,
+}
+
+
+def get_memory_size(obj: Any, exclude_attributes: Optional[set] = None) -> int:
+    """
+    Returns the approximate memory size in bytes of `obj` and all objects it references, without serializing it.
+
+    The object graph is traversed once, counting each object a single time:
+        numpy arrays count their buffer (`nbytes`) once even when referenced through several views,
+        pandas objects count their `memory_usage(deep=True)`,
+        torch tensors count their storage,
+        scikit-learn trees count their node and value arrays,
+        LightGBM, XGBoost, CatBoost models and onnxruntime sessions count their native model size,
+        all other Python objects count `sys.getsizeof` plus the size of their attributes and elements.
+    Objects defining `__getstate__` also count the objects of their state which are not among their attributes,
+    such as the serialized form of native objects (for example faiss indexes), which approximates their native memory.
+    Objects which cannot be traversed fall back to the size of their pickle.
+    Modules, classes, functions and loggers are considered shared and are not counted.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to compute the memory size of.
+    exclude_attributes : set, default = None
+        Names of attributes of `obj` which are not counted.
+
+    Returns
+    -------
+    Memory size of `obj` in bytes.
+    """
+    seen = set()
+    memory_size = 0
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        cur_id = id(cur)
+        if cur_id in seen:
+            continue
+        seen.add(cur_id)
+        if isinstance(cur, _SHARED_TYPES):
+            continue
+        if isinstance(cur, _ATOMIC_TYPES):
+            memory_size += sys.getsizeof(cur)
+        elif isinstance(cur, np.ndarray):
+            # Includes the buffer if owned by the array, views share the buffer of their base which is counted once through the base
+            memory_size += sys.getsizeof(cur)
+            if cur.base is not None:
+                stack.append(cur.base)
+            if cur.dtype == object:
+                stack.extend(cur.ravel())
+        elif isinstance(cur, (pd.DataFrame, pd.Series, pd.Index)):
+            memory_size += int(np.sum(cur.memory_usage(deep=True)))
+        elif isinstance(cur, dict):
+            memory_size += sys.getsizeof(cur)
+            for key, value in cur.items():
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(cur, (list, tuple, set, frozenset)):
+            memory_size += sys.getsizeof(cur)
+            stack.extend(cur)
+        else:
+            cls = type(cur)
+            hook = _NATIVE_MEMORY_SIZE_HOOKS.get((cls.__module__, cls.__name__), None)
+            if hook is not None:
+                memory_size += _call_hook(hook, cur)
+                continue
+            torch = sys.modules.get('torch', None)  # Only check for tensors if torch was already imported
+            if torch is not None and isinstance(cur, torch.Tensor):
+                memory_size += _get_memory_size_torch_tensor(cur, seen=seen)
+                continue
+            if cls.__module__ == 'sklearn.tree._tree' and cls.__name__ == 'Tree':
+                # node and value arrays are views of the tree's buffers, no copy is made
+                state = cur.__getstate__()
+                memory_size += sys.getsizeof(cur) + state['nodes'].nbytes + state['values'].nbytes
+                continue
+            attributes = getattr(cur, '__dict__', None)
+            slots = [slot for klass in cls.__mro__ for slot in getattr(klass, '__slots__', ())]
+            if attributes is None and not slots:
+                memory_size += _get_memory_size_pickle(cur)
+                continue
+            memory_size += sys.getsizeof(cur)
+            if attributes is not None:
+                memory_size += sys.getsizeof(attributes)
+                seen.add(id(attributes))
+                for key, value in attributes.items():
+                    if exclude_attributes is not None and key in exclude_attributes and cur is obj:
+                        continue
+                    stack.append(value)
+            for slot in slots:
+                if isinstance(slot, str) and hasattr(cur, slot):
+                    stack.append(getattr(cur, slot))
+            if _has_custom_getstate(cls) and not (exclude_attributes is not None and cur is obj):
+                # Objects of the state which are already referenced by the attributes are skipped as they are already seen
+                state = _get_state(cur)
+                if state is not None and id(state) not in seen:
+                    stack.append(state)
+    return memory_size
+
+
+def _has_custom_getstate(cls: type) -> bool:
+    # Python >= 3.11 defines object.__getstate__, which returns the attributes
+    getstate = getattr(cls, '__getstate__', None)
+    return getstate is not None and getstate is not getattr(object, '__getstate__', None)
+
+
+def _get_state(obj: Any) -> Any:
+    try:
+        return obj.__getstate__()
+    except Exception as err:
+        logger.log(15, f'Failed to get the state of {type(obj).__name__}, only its attributes are counted: {err}')
+        return None
+
+
+def _call_hook(hook: Callable[[Any], int], obj: Any) -> int:
+    try:
+        return hook(obj)
+    except Exception as err:
+        logger.log(15, f'Failed to compute the native memory size of {type(obj).__name__}, falling back to its pickle size: {err}')
+        return _get_memory_size_pickle(obj)
+
+
+def _get_memory_size_torch_tensor(tensor, seen: set) -> int:
+    memory_size = sys.getsizeof(tensor)
+    try:
+        storage = tensor.untyped_storage()
+    except AttributeError:
+        storage = tensor.storage()
+    # Tensors sharing a storage (such as views) count it once
+    storage_key = ('torch_storage', storage.data_ptr())
+    if storage_key not in seen:
+        seen.add(storage_key)
+        memory_size += storage.nbytes()
+    return memory_size
+
+
+def _get_memory_size_pickle(obj: Any) -> int:
+    try:
+        return sys.getsizeof(pickle.dumps(obj, protocol=4))
+    except Exception:
+        return sys.getsizeof(obj)
@@ -0,0 +1,81 @@
+import logging
+import pickle
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+logger = logging.getLogger(__name__)
+
+# Segments attached by this process, kept open for the lifetime of the process as loaded objects may reference them.
+# Closing a segment while arrays still reference it raises a BufferError, including when the SharedMemory is garbage collected.
+_attached_segments = dict()
+
+
+class SharedMemoryObject:
+    """
+    Stores a Python object in a shared memory segment so that other local processes can load it without copying its array data.
+
+    The object is pickled with protocol 5, placing the buffers of contiguous numpy arrays (including the blocks of pandas DataFrames)
+    out-of-band in the shared memory segment. Loading the object only deserializes the small in-band payload,
+    the arrays of the loaded object are zero-copy, read-only views of the segment.
+
+    The SharedMemoryObject itself is cheap to pickle and can be sent to worker processes.
+    The process that created it is responsible for calling `unlink` once no process needs the object anymore.
+
+    Parameters
+    ----------
+    obj : object
+        The object to share. Loaded copies must be treated as read-only.
+    """
+    def __init__(self, obj):
+        buffers = []
+        self._payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        buffers = [buffer.raw() for buffer in buffers]
+        self._buffer_sizes = [buffer.nbytes for buffer in buffers]
+        self._shm = SharedMemory(create=True, size=max(sum(self._buffer_sizes), 1))
+        self.name = self._shm.name
+        self._is_owner = True
+        offset = 0
+        for buffer, size in zip(buffers, self._buffer_sizes):
+            self._shm.buf[offset:offset + size] = buffer
+            offset += size
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the shared memory segment."""
+        return sum(self._buffer_sizes)
+
+    def load(self):
+        """Returns the shared object, backed by the shared memory segment."""
+        shm = self._shm if self._shm is not None else self._attach()
+        buffers = []
+        offset = 0
+        for size in self._buffer_sizes:
+            buffers.append(shm.buf[offset:offset + size].toreadonly())
+            offset += size
+        return pickle.loads(self._payload, buffers=buffers)
+
+    def _attach(self) -> SharedMemory:
+        if self.name not in _attached_segments:
+            shm = SharedMemory(name=self.name)
+            # Python < 3.13 registers attached segments with the resource tracker, which would unlink the segment
+            # (and warn about a leak) when this process exits even though the segment is owned by another process.
+            resource_tracker.unregister(shm._name, 'shared_memory')
+            _attached_segments[self.name] = shm
+        return _attached_segments[self.name]
+
+    def unlink(self):
+        """Releases the shared memory segment. Only has an effect in the process that created the object."""
+        if self._is_owner and self._shm is not None:
+            self._shm.unlink()
+            try:
+                self._shm.close()
+            except BufferError:
+                # Objects loaded in this process still reference the segment, the memory is released at process exit.
+                _attached_segments[self.name] = self._shm
+            self._shm = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shm'] = None
+        state['_is_owner'] = False
+        return state
@@ -4,7 +4,9 @@ import pickle
 import time
 import random
 import sys
-from typing import Callable, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -119,6 +121,38 @@ def setup_trial_limits(time_limit, num_trials, hyperparameters):
     return time_limit, num_trials
 
 
+def map_prefetched(func: Callable, items: Iterable, num_workers: int = None) -> Iterator:
+    """
+    Lazily yields `func(item)` for each item of `items` in order, computing up to `num_workers` results ahead in background threads.
+    Used to overlap loading objects from disk (I/O and decompression) with their use, such as loading the next models while predicting with the current one.
+    At most `num_workers` results are held in memory at a time in addition to the yielded result.
+    If `num_workers` is None, all cpus are used. If `num_workers <= 1`, items are processed sequentially in the calling thread.
+    """
+    if num_workers is None:
+        num_workers = ResourceManager.get_cpu_count()
+    if num_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = deque()
+        for item in items:
+            futures.append(executor.submit(func, item))
+            if len(futures) >= num_workers:
+                break
+        try:
+            while futures:
+                result = futures.popleft().result()
+                for item in items:
+                    futures.append(executor.submit(func, item))
+                    break
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 def get_leaderboard_pareto_frontier(leaderboard: DataFrame, score_col='score_val', inference_time_col='pred_time_val_full') -> DataFrame:
     """
     Given a set of models, returns in ranked order from best score to worst score models which satisfy the criteria:
@@ -303,15 +337,25 @@ def convert_pred_probas_to_df(pred_proba_list: List[ArrayLike],
     Returns
     -------
     DataFrame
+        The DataFrame consists of a single float32 block of all columns.
     """
-    if problem_type in [MULTICLASS, SOFTCLASS, QUANTILE]:
-        pred_proba_list = np.concatenate(pred_proba_list, axis=1)
-        pred_proba_df = pd.DataFrame(data=pred_proba_list, columns=columns)
-    else:
-        pred_proba_df = pd.DataFrame(data=np.asarray(pred_proba_list).T, columns=columns)
-    if index is not None:
-        pred_proba_df.set_index(index, inplace=True)
-    return pred_proba_df
+    num_rows = len(index) if index is not None else (len(pred_proba_list[0]) if pred_proba_list else 0)
+    # The predictions are written directly into their slice of a single preallocated block, laid out column by column
+    # so that each write is contiguous and the DataFrame wraps the block without copying it.
+    pred_proba_block = np.empty((len(columns), num_rows), dtype=np.float32)
+    is_multi_column = problem_type in [MULTICLASS, SOFTCLASS, QUANTILE]
+    column_start = 0
+    for pred_proba in pred_proba_list:
+        pred_proba = np.asarray(pred_proba)
+        if is_multi_column:
+            pred_proba_block[column_start:column_start + pred_proba.shape[1]] = pred_proba.T
+            column_start += pred_proba.shape[1]
+        else:
+            pred_proba_block[column_start] = pred_proba
+            column_start += 1
+    if column_start != len(columns):
+        raise AssertionError(f'Number of prediction columns ({column_start}) does not match the number of columns ({len(columns)})')
+    return pd.DataFrame(data=pred_proba_block.T, columns=columns, index=index, copy=False)
 
 
 def extract_label(data: DataFrame, label: str) -> (DataFrame, Series):
@@ -195,4 +195,53 @@ def test_rmse_with_sklearn(sample_weight):
     if sample_weight is not None: kwargs["sample_weight"] = sample_weight
     computed_rmse = rmse_func(**kwargs)
 
-    assert np.isclose(computed_rmse, expected_rmse)
\ No newline at end of file
+    assert np.isclose(computed_rmse, expected_rmse)
+
+
+def _get_multi_model_data(problem_type: str, scorer: Scorer, num_models=4, num_rows=50):
+    rng = np.random.RandomState(0)
+    if problem_type == REGRESSION:
+        y_true = rng.randn(num_rows)
+        y_pred = y_true + rng.randn(num_models, num_rows)
+    else:
+        num_classes = 2 if problem_type == BINARY else 3
+        y_true = np.arange(num_rows) % num_classes
+        y_pred_proba = rng.dirichlet(np.ones(num_classes), size=(num_models, num_rows)).astype(np.float32)
+        if scorer.needs_pred:
+            y_pred = y_pred_proba.argmax(axis=2)
+        elif problem_type == BINARY:
+            y_pred = y_pred_proba[:, :, 1]
+        else:
+            y_pred = y_pred_proba
+    return y_true, y_pred
+
+
+@pytest.mark.parametrize("problem_type,metric",
+                         [(BINARY, metric) for metric in BINARY_METRICS]
+                         + [(MULTICLASS, metric) for metric in MULTICLASS_METRICS]
+                         + [(REGRESSION, metric) for metric in REGRESSION_METRICS])
+def test_score_multi(problem_type: str, metric: str):
+    """Ensure scoring the stacked predictions of multiple models equals scoring each model separately"""
+    scorer = METRICS[problem_type][metric]
+    y_true, y_pred = _get_multi_model_data(problem_type=problem_type, scorer=scorer)
+    scores = scorer.score_multi(y_true, y_pred)
+    expected_scores = [scorer(y_true, y_pred_model) for y_pred_model in y_pred]
+    assert len(scores) == len(y_pred)
+    assert np.allclose(scores, expected_scores)
+
+
+def test_score_multi_r2_constant_y_true():
+    scorer = METRICS[REGRESSION]['r2']
+    y_true = np.ones(5)
+    y_pred = np.array([np.ones(5), np.arange(5)])
+    assert np.allclose(scorer.score_multi(y_true, y_pred), [sklearn.metrics.r2_score(y_true, y_pred_model) for y_pred_model in y_pred])
+
+
+def test_score_multi_log_loss_unknown_labels():
+    """Ensure labels unknown to the models (encoded as -1) are scored identically by score_multi and by scoring each model separately"""
+    scorer = METRICS[MULTICLASS]['log_loss']
+    y_true, y_pred = _get_multi_model_data(problem_type=MULTICLASS, scorer=scorer)
+    y_true[:5] = -1
+    scores = scorer.score_multi(y_true, y_pred)
+    expected_scores = [scorer(y_true, y_pred_model) for y_pred_model in y_pred]
+    assert np.allclose(scores, expected_scores)
@@ -0,0 +1,22 @@
+import pytest
+
+from autogluon.common.utils.resource_utils import ResourceManager
+from autogluon.core.models import AbstractModel
+from autogluon.core.utils.exceptions import NotEnoughMemoryError
+
+
+class _DummyModel(AbstractModel):
+    def estimate_memory_usage(self, **kwargs) -> int:
+        return int(0.6e9)
+
+
+def test_validate_fit_memory_usage_available_mem_ratio(monkeypatch):
+    monkeypatch.setattr(ResourceManager, 'get_available_virtual_mem', lambda: int(1e9))
+    model = _DummyModel(name='', path='')
+    model.params_aux = dict(max_memory_usage_ratio=1.0)
+
+    model._validate_fit_memory_usage()
+    model._validate_fit_memory_usage(available_mem_ratio=1)
+    # The model only gets a share of the available memory when other models are fit at the same time
+    with pytest.raises(NotEnoughMemoryError):
+        model._validate_fit_memory_usage(available_mem_ratio=0.5)
@@ -0,0 +1,68 @@
+import time
+
+from autogluon.common import space
+from autogluon.core.scheduler import LocalParallelScheduler
+
+
+# Train functions are defined at module level so that they can be pickled to the worker processes
+def _train_fn(args, reporter):
+    reporter(epoch=1, accuracy=args['a'])
+
+
+def _train_fn_failing(args, reporter):
+    if args['a'] > 0.7:
+        raise Exception('Failed Trial')
+    reporter(epoch=1, accuracy=args['a'])
+
+
+def _train_fn_slow(args, reporter):
+    time.sleep(60)
+    reporter(epoch=1, accuracy=args['a'])
+
+
+def _get_scheduler(train_fn, **kwargs):
+    return LocalParallelScheduler(
+        train_fn,
+        search_space=dict(a=space.Real(0, 1)),
+        resource={'num_cpus': 1, 'num_gpus': 0},
+        total_resource={'num_cpus': 2, 'num_gpus': 0},
+        reward_attr='accuracy',
+        time_attr='epoch',
+        **kwargs,
+    )
+
+
+def test_local_parallel_scheduler():
+    scheduler = _get_scheduler(_train_fn, num_trials=6)
+    assert scheduler.num_workers == 2
+
+    scheduler.run()
+
+    assert sorted(scheduler.config_history.keys()) == list(range(6))
+    best_reward = max(scheduler.training_history[task_id][-1]['accuracy'] for task_id in scheduler.training_history)
+    assert scheduler.get_best_reward() == best_reward
+    assert scheduler.get_best_config()['a'] == best_reward
+    assert scheduler.config_history[scheduler.get_best_task_id()]['a'] == best_reward
+
+
+def test_local_parallel_scheduler_can_handle_failing_jobs():
+    scheduler = _get_scheduler(_train_fn_failing, num_trials=10)
+
+    scheduler.run()
+
+    assert len(scheduler.training_history) == 10
+    for task_id, trial in scheduler.training_history.items():
+        config = scheduler.config_history[task_id]
+        is_failed = any('traceback' in result for result in trial)
+        assert is_failed == (config['a'] > 0.7)
+    assert scheduler.get_best_reward() <= 0.7
+
+
+def test_local_parallel_scheduler_cancels_trials_on_time_out():
+    scheduler = _get_scheduler(_train_fn_slow, num_trials=4, time_out=3)
+
+    time_start = time.time()
+    scheduler.run()
+
+    assert time.time() - time_start < 30
+    assert len(scheduler.config_history) == 0
@@ -0,0 +1,63 @@
+import pytest
+
+from autogluon.common import space
+from autogluon.core.scheduler import LocalSuccessiveHalvingScheduler
+
+
+def _get_scheduler(train_fn, **kwargs):
+    return LocalSuccessiveHalvingScheduler(
+        train_fn,
+        search_space=dict(a=space.Real(0, 1)),
+        num_trials=20,
+        reward_attr='accuracy',
+        time_attr='epoch',
+        grace_period=1,
+        reduction_factor=3,
+        max_t=81,
+        **kwargs,
+    )
+
+
+def test_successive_halving_milestones():
+    scheduler = _get_scheduler(train_fn=None)
+    assert scheduler.milestones == [1, 3, 9, 27, 81]
+
+
+def test_successive_halving_invalid_arguments():
+    with pytest.raises(ValueError):
+        LocalSuccessiveHalvingScheduler(None, search_space=dict(a=space.Real(0, 1)), num_trials=20, reward_attr='accuracy', reduction_factor=1)
+
+
+def test_successive_halving_stops_trials_below_rung_cutoff():
+    scheduler = _get_scheduler(train_fn=None)
+    assert not scheduler.on_trial_result(trial=0, fidelity=1, reward=0.5)
+    assert not scheduler.on_trial_result(trial=1, fidelity=1, reward=0.8)
+    # Below the 67th percentile of the rewards previously recorded at the rung
+    assert scheduler.on_trial_result(trial=2, fidelity=1, reward=0.6)
+    # Already recorded at the rung and the next rung is not reached yet
+    assert not scheduler.on_trial_result(trial=1, fidelity=2, reward=0.1)
+    assert not scheduler.on_trial_result(trial=1, fidelity=3, reward=0.9)
+    assert scheduler._rungs[1] == {0: 0.5, 1: 0.8, 2: 0.6}
+    assert scheduler._rungs[3] == {1: 0.9}
+
+
+def test_successive_halving_scheduler():
+    num_epochs_trained = dict()
+
+    def train_fn(args, reporter):
+        num_epochs_trained[args['task_id']] = 0
+        for e in range(81):
+            num_epochs_trained[args['task_id']] += 1
+            reporter(epoch=e + 1, accuracy=args['a'] * (e + 1) / 81)
+            if reporter.should_stop:
+                break
+
+    scheduler = _get_scheduler(train_fn)
+    scheduler.run()
+
+    assert len(scheduler.config_history) == 20
+    assert scheduler.num_stopped_trials > 0
+    assert sum(num_epochs_trained.values()) < 20 * 81
+    best_task_id = scheduler.get_best_task_id()
+    assert num_epochs_trained[best_task_id] == 81
+    assert scheduler.get_best_config()['a'] == max(config['a'] for config in scheduler.config_history.values())
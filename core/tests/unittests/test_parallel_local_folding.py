@@ -6,10 +6,11 @@ import pandas as pd
 from autogluon.common import space
 
 from autogluon.core.models.ensemble.bagged_ensemble_model import BaggedEnsembleModel
-from autogluon.core.models.ensemble.fold_fitting_strategy import ParallelLocalFoldFittingStrategy
+from autogluon.core.models.ensemble.fold_fitting_strategy import ParallelFoldFittingStrategy, ParallelLocalFoldFittingStrategy, _load_fold_data
 from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.core.models import AbstractModel
 from autogluon.core.searcher import LocalRandomSearcher
+from autogluon.core.utils.shared_memory import SharedMemoryObject
 
 
 def _prepare_data():
@@ -88,3 +89,66 @@ def test_resource_allocation_and_time_limit():
     for i in range(num_iterations):
         config = searcher.get_config()
         _test_resource_allocation_and_time_limit(**config)
+
+
+def test_shared_fold_data():
+    X = pd.DataFrame({'a': np.arange(10), 'b': np.arange(10) * 0.5, 'c': pd.Categorical(list('xy') * 5)})
+    y = pd.Series(np.arange(10) % 2, name='label')
+    X_shared = SharedMemoryObject(X)
+    y_shared = SharedMemoryObject(y)
+    try:
+        X_loaded = _load_fold_data(X_shared)
+        y_loaded = _load_fold_data(y_shared)
+        pd.testing.assert_frame_equal(X_loaded, X)
+        pd.testing.assert_series_equal(y_loaded, y)
+        train_index = np.array([0, 2, 4, 6, 8])
+        X_fold = X_loaded.iloc[train_index, :]
+        y_fold = y_loaded.iloc[train_index]
+        pd.testing.assert_frame_equal(X_fold, X.iloc[train_index, :])
+        pd.testing.assert_series_equal(y_fold, y.iloc[train_index])
+        # fold subsets are copies, models are free to modify them
+        X_fold['a'].values[0] = -1
+        assert X_loaded['a'].iloc[0] == 0
+    finally:
+        X_shared.unlink()
+        y_shared.unlink()
+    # data that is not shared is returned as is
+    assert _load_fold_data(X) is X
+
+
+def test_prepare_shared_fold_data():
+    fold_fitting_strategy = _construct_dummy_fold_strategy(num_jobs=8, num_folds_parallel=8)
+    assert fold_fitting_strategy.is_data_shared
+    X, y, X_pseudo, y_pseudo = fold_fitting_strategy._prepare_data()
+    try:
+        assert isinstance(X, SharedMemoryObject)
+        assert isinstance(y, SharedMemoryObject)
+        assert X_pseudo is None and y_pseudo is None
+        pd.testing.assert_frame_equal(_load_fold_data(X), fold_fitting_strategy.X)
+    finally:
+        fold_fitting_strategy._release_data(X, y, X_pseudo, y_pseudo)
+
+
+def test_shared_fold_data_allows_more_parallel_folds():
+    num_rows = 10000
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame({
+        'float': rng.rand(num_rows),
+        'int': rng.randint(0, 100, num_rows),
+        'category': pd.Series(rng.choice(['a', 'b', 'c'], num_rows), dtype='category'),
+        'object': rng.choice(['a', 'b', 'c'], num_rows).astype(object),
+    })
+    y = pd.Series(rng.randint(0, 2, num_rows))
+    data_mem = ParallelFoldFittingStrategy._estimate_data_memory_usage(X=X, y=y, num_parallel_jobs=1)
+    mem_available = 7.5 * data_mem
+
+    def get_max_num_parallel_jobs(fold_fitting_strategy_cls):
+        num_parallel_jobs = 0
+        while fold_fitting_strategy_cls._estimate_data_memory_usage(X=X, y=y, num_parallel_jobs=num_parallel_jobs + 1) < mem_available:
+            num_parallel_jobs += 1
+        return num_parallel_jobs
+
+    assert get_max_num_parallel_jobs(ParallelFoldFittingStrategy) == 7
+    assert get_max_num_parallel_jobs(ParallelLocalFoldFittingStrategy) > 7
+    # The shared data is counted once
+    assert ParallelLocalFoldFittingStrategy._estimate_data_memory_usage(X=X, y=y, num_parallel_jobs=1) > data_mem
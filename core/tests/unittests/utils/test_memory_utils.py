@@ -0,0 +1,85 @@
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.core.utils.memory_utils import get_memory_size
+
+
+def test_get_memory_size_shared_array_counted_once():
+    array = np.zeros((1000, 100))
+    memory_size_array = get_memory_size(array)
+    assert memory_size_array >= array.nbytes
+    # Views and repeated references share the buffer of the array
+    memory_size_views = get_memory_size(dict(a=array, b=array, c=array[:10], d=array.T))
+    assert memory_size_array <= memory_size_views < memory_size_array + 2000
+
+
+def test_get_memory_size_exclude_attributes():
+    class Dummy:
+        def __init__(self):
+            self.model = np.zeros(100000)
+            self.name = 'dummy'
+
+    obj = Dummy()
+    memory_size = get_memory_size(obj)
+    assert memory_size >= obj.model.nbytes
+    assert get_memory_size(obj, exclude_attributes={'model'}) < obj.model.nbytes
+
+
+def test_get_memory_size_close_to_pickle_size():
+    from sklearn.ensemble import RandomForestClassifier
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.rand(1000, 10), columns=[f'f{i}' for i in range(10)])
+    y = rng.randint(0, 2, 1000)
+    X['category'] = pd.Series(rng.choice(['a', 'b', 'c'], 1000), dtype='category')
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X.drop(columns=['category']), y)
+    for obj in [X, model, dict(data=X, model=model, name='model')]:
+        pickle_size = sys.getsizeof(pickle.dumps(obj, protocol=4))
+        memory_size = get_memory_size(obj)
+        assert 0.5 * pickle_size < memory_size < 2 * pickle_size
+
+
+def test_get_memory_size_custom_getstate():
+    import threading
+
+    class NativeModel:
+        """Holds its model in a native handle whose memory is not visible to Python, serializing it in `__getstate__`"""
+        def __init__(self, num_bytes: int):
+            self.handle = threading.Lock()
+            self.num_bytes = num_bytes
+
+        def __getstate__(self):
+            state = self.__dict__.copy()
+            state['handle'] = bytes(self.num_bytes)
+            return state
+
+    obj = NativeModel(num_bytes=1000000)
+    assert get_memory_size(obj) >= 1000000
+    assert get_memory_size(dict(a=obj, b=obj)) < 2 * 1000000
+
+
+def test_get_memory_size_compiled_model():
+    onnxruntime = pytest.importorskip('onnxruntime')
+    skl2onnx = pytest.importorskip('skl2onnx')
+    from skl2onnx.common.data_types import FloatTensorType
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.RandomState(0)
+    X = rng.rand(1000, 10).astype(np.float32)
+    y = rng.randint(0, 2, 1000)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+    onnx_bytes = skl2onnx.convert_sklearn(model, initial_types=[('float_input', FloatTensorType([None, 10]))]).SerializeToString()
+
+    class InferenceSessionWrapper:
+        """Mirrors the wrapper of the ONNX compilers, whose state excludes the session"""
+        def __init__(self, onnx_bytes):
+            self.sess = onnxruntime.InferenceSession(onnx_bytes, providers=['CPUExecutionProvider'])
+
+        def __getstate__(self):
+            return {}
+
+    compiled_model = InferenceSessionWrapper(onnx_bytes)
+    assert get_memory_size(compiled_model) >= len(onnx_bytes)
@@ -0,0 +1,33 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.core.utils.shared_memory import SharedMemoryObject
+
+
+def _load_and_sum(shared_object):
+    X, y = shared_object.load()
+    return float(X['a'].sum() + y.sum())
+
+
+def test_shared_memory_object():
+    X = pd.DataFrame({'a': np.arange(1000, dtype=np.float64), 'b': np.arange(1000), 'c': ['x'] * 1000})
+    y = pd.Series(np.ones(1000))
+    shared_object = SharedMemoryObject((X, y))
+    try:
+        assert shared_object.size >= X['a'].nbytes + X['b'].nbytes + y.nbytes
+
+        X_loaded, y_loaded = pickle.loads(pickle.dumps(shared_object)).load()
+        assert X_loaded.equals(X)
+        assert y_loaded.equals(y)
+        with pytest.raises(ValueError):
+            # Loaded arrays are views of the shared memory segment and must not be altered
+            X_loaded['a'].values[0] = -1
+
+        with multiprocessing.get_context('spawn').Pool(1) as pool:
+            assert pool.apply(_load_and_sum, (shared_object,)) == X['a'].sum() + y.sum()
+    finally:
+        shared_object.unlink()
@@ -1,9 +1,11 @@
+import threading
+import time
 import unittest
 
 import numpy as np
 import pandas as pd
 
-from autogluon.core.utils import infer_problem_type
+from autogluon.core.utils import convert_pred_probas_to_df, infer_problem_type, map_prefetched
 from autogluon.core.constants import BINARY, MULTICLASS, MULTICLASS_UPPER_LIMIT, REGRESSION
 
 
@@ -78,3 +80,59 @@ class TestInferProblemType(unittest.TestCase):
         small_integer_regression_series = pd.Series(np.arange(MULTICLASS_UPPER_LIMIT-1), dtype=np.int64)
         inferred_problem_type = infer_problem_type(small_integer_regression_series)
         assert inferred_problem_type == REGRESSION
+
+
+class TestMapPrefetched(unittest.TestCase):
+
+    def test_map_prefetched_order(self):
+        for num_workers in [1, 2, 8]:
+            assert list(map_prefetched(lambda x: x * 2, range(20), num_workers=num_workers)) == [x * 2 for x in range(20)]
+        assert list(map_prefetched(lambda x: x, [], num_workers=4)) == []
+
+    def test_map_prefetched_limits_prefetch(self):
+        num_started = []
+        lock = threading.Lock()
+
+        def _func(x):
+            with lock:
+                num_started.append(x)
+            return x
+
+        results = map_prefetched(_func, range(100), num_workers=3)
+        assert next(results) == 0
+        time.sleep(0.1)
+        # The yielded result and at most `num_workers` results computed ahead
+        assert len(num_started) <= 4
+        results.close()
+
+    def test_map_prefetched_raises(self):
+        def _func(x):
+            if x == 3:
+                raise ValueError
+            return x
+
+        with self.assertRaises(ValueError):
+            list(map_prefetched(_func, range(10), num_workers=2))
+
+
+class TestConvertPredProbasToDf(unittest.TestCase):
+
+    def test_convert_pred_probas_to_df_multiclass(self):
+        pred_probas = [np.random.rand(5, 3).astype(np.float32) for _ in range(2)]
+        columns = [f'{model}_{c}' for model in ['A', 'B'] for c in range(3)]
+        index = pd.Index([10, 11, 12, 13, 14])
+        pred_proba_df = convert_pred_probas_to_df(pred_proba_list=pred_probas, columns=columns, problem_type=MULTICLASS, index=index)
+        assert list(pred_proba_df.columns) == columns
+        assert pred_proba_df.index.equals(index)
+        assert (pred_proba_df.dtypes == np.float32).all()
+        np.testing.assert_array_equal(pred_proba_df.to_numpy(), np.concatenate(pred_probas, axis=1))
+
+    def test_convert_pred_probas_to_df_binary(self):
+        pred_probas = [np.random.rand(5) for _ in range(3)]
+        pred_proba_df = convert_pred_probas_to_df(pred_proba_list=pred_probas, columns=['A', 'B', 'C'], problem_type=BINARY)
+        assert pred_proba_df.index.equals(pd.RangeIndex(5))
+        np.testing.assert_allclose(pred_proba_df.to_numpy(), np.asarray(pred_probas, dtype=np.float32).T)
+
+    def test_convert_pred_probas_to_df_invalid_columns(self):
+        with self.assertRaises(AssertionError):
+            convert_pred_probas_to_df(pred_proba_list=[np.random.rand(5)], columns=['A', 'B'], problem_type=BINARY)
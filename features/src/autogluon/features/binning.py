@@ -1,80 +1,99 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import pandas as pd
-from pandas import DataFrame, IntervalIndex, Series
+from pandas import DataFrame, Series
+
+from autogluon.common.utils.resource_utils import ResourceManager
 
 logger = logging.getLogger(__name__)
 
+_STARTING_CATS = 1000
+_MAX_ITERATIONS = 20
+_BIN_EPSILON = 0.000000001
+
 
 def bin_column(series: Series, bins, dtype):
     return np.digitize(series, bins=bins, right=True).astype(dtype)
 
 
-# TODO: Rewrite with normalized value counts as binning technique, will be more performant and optimal
-def generate_bins(X_features: DataFrame, features_to_bin: list, ideal_bins: int = 10):
-    X_len = len(X_features)
-    starting_cats = 1000
-    bin_index_starting = [np.floor(X_len * (num + 1) / starting_cats) for num in range(starting_cats - 1)]
-    bin_epsilon = 0.000000001
-    bin_mapping = dict()
-    max_iterations = 20
-    for column in features_to_bin:
-        num_cats_initial = starting_cats
-        bins_value_counts = X_features[column].value_counts(ascending=False, normalize=True)
-        max_bins = len(bins_value_counts)
-
-        if max_bins <= ideal_bins:
-            bins = pd.Series(data=sorted(X_features[column].unique()))
-            num_cats_initial = max_bins
-            cur_len = max_bins
-            bin_index = list(range(num_cats_initial))
-            interval_index = get_bins(bins=bins, bin_index=bin_index, bin_epsilon=bin_epsilon)
-        else:
-            cur_len = X_len
-            bins = X_features[column].sort_values(ascending=True)
-            interval_index = get_bins(bins=bins, bin_index=bin_index_starting, bin_epsilon=bin_epsilon)
-
-        # TODO: max_desired_bins and min_desired_bins are currently equivalent, but in future they will be parameterized to allow for flexibility.
-        max_desired_bins = min(ideal_bins, max_bins)
-        min_desired_bins = min(ideal_bins, max_bins)
-
-        is_satisfied = (len(interval_index) >= min_desired_bins) and (len(interval_index) <= max_desired_bins)
-
-        num_cats_current = num_cats_initial
-        cur_iteration = 0
-        while not is_satisfied:
-            ratio_reduction = max_desired_bins / len(interval_index)
-            num_cats_current = int(np.floor(num_cats_current * ratio_reduction))
-            bin_index = [np.floor(cur_len * (num + 1) / num_cats_current) for num in range(num_cats_current - 1)]
-            interval_index = get_bins(bins=bins, bin_index=bin_index, bin_epsilon=bin_epsilon)
-
-            if (len(interval_index) >= min_desired_bins) and (len(interval_index) <= max_desired_bins):
-                is_satisfied = True
-                # print('satisfied', column, len(interval_index))
-            cur_iteration += 1
-            if cur_iteration >= max_iterations:
-                is_satisfied = True
-                # print('max_iterations met, stopping prior to satisfaction!', column, len(interval_index))
-
-        bins_final = interval_index.right.values
-        bin_mapping[column] = bins_final
-    return bin_mapping
-
-
-# TODO: Clean code
-# TODO: Consider re-using bins variable instead of making bins_2-7 variables
-# bins is a sorted int/float series, ascending=True
-def get_bins(bins: Series, bin_index: list, bin_epsilon: float) -> IntervalIndex:
-    max_val = bins.max()
-    bins_2 = bins.iloc[bin_index]
-    bins_3 = list(bins_2.values)
-    bins_unique = sorted(list(set(bins_3)))
-    bins_with_epsilon_max = set([i for i in bins_unique] + [i - bin_epsilon for i in bins_unique if i == max_val])
-    removal_bins = set([bins_unique[index - 1] for index, i in enumerate(bins_unique[1:], start=1) if i == max_val])
-    bins_4 = sorted(list(bins_with_epsilon_max - removal_bins))
-    bins_5 = [np.inf if (x == max_val) else x for x in bins_4]
-    bins_6 = sorted(list(set([-np.inf] + bins_5 + [np.inf])))
-    bins_7 = [(bins_6[i], bins_6[i + 1]) for i in range(len(bins_6) - 1)]
-    interval_index = IntervalIndex.from_tuples(bins_7)
-    return interval_index
+def generate_bins(X_features: DataFrame, features_to_bin: list, ideal_bins: int = 10, num_cpus: int = None) -> dict:
+    """
+    Computes quantile bin edges for each feature in `features_to_bin`.
+
+    Cut points are taken from the cumulative value counts of each column, so each column is sorted only once
+    regardless of how many iterations are needed to reach `ideal_bins` bins.
+    Columns are processed in parallel across `num_cpus` threads (defaults to all available CPUs).
+
+    Returns
+    -------
+    dict mapping each feature to a sorted float array of the right edges of its bins, the last edge being `np.inf`.
+    The array can be passed as `bins` to `bin_column`. Missing values are ignored when computing the edges.
+    """
+    if num_cpus is None:
+        num_cpus = ResourceManager.get_cpu_count()
+    num_workers = min(num_cpus, len(features_to_bin))
+    columns = [X_features[feature] for feature in features_to_bin]
+    if num_workers > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            bins = list(executor.map(lambda series: _generate_bins_column(series, ideal_bins=ideal_bins), columns))
+    else:
+        bins = [_generate_bins_column(series, ideal_bins=ideal_bins) for series in columns]
+    return dict(zip(features_to_bin, bins))
+
+
+def _generate_bins_column(series: Series, ideal_bins: int) -> np.ndarray:
+    values = series.dropna().to_numpy()
+    unique, counts = np.unique(values, return_counts=True)
+    num_unique = len(unique)
+    if num_unique == 0:
+        return np.array([np.inf])
+
+    if num_unique <= ideal_bins:
+        # Cut points index directly into the sorted unique values
+        num_values = num_unique
+        cdf = np.arange(1, num_unique + 1)
+        bin_index = np.arange(num_unique)
+        num_cats_current = num_unique
+    else:
+        # Cut points index into the sorted values, located via the cumulative value counts
+        num_values = len(values)
+        cdf = np.cumsum(counts)
+        bin_index = _get_bin_index(num_values=num_values, num_cats=_STARTING_CATS)
+        num_cats_current = _STARTING_CATS
+    bins = _get_bins(unique=unique, cdf=cdf, bin_index=bin_index)
+
+    # TODO: max_desired_bins and min_desired_bins are currently equivalent, but in future they will be parameterized to allow for flexibility.
+    desired_bins = min(ideal_bins, num_unique)
+    cur_iteration = 0
+    while len(bins) != desired_bins and cur_iteration < _MAX_ITERATIONS:
+        ratio_reduction = desired_bins / len(bins)
+        num_cats_current = int(np.floor(num_cats_current * ratio_reduction))
+        bin_index = _get_bin_index(num_values=num_values, num_cats=num_cats_current)
+        bins = _get_bins(unique=unique, cdf=cdf, bin_index=bin_index)
+        cur_iteration += 1
+    return bins
+
+
+def _get_bin_index(num_values: int, num_cats: int) -> np.ndarray:
+    return np.floor(num_values * np.arange(1, max(num_cats, 1)) / num_cats)
+
+
+def _get_bins(unique: np.ndarray, cdf: np.ndarray, bin_index: np.ndarray) -> np.ndarray:
+    """
+    Returns the right edges of the bins whose cut points are the values at positions `bin_index` of the sorted data.
+
+    `unique` are the sorted unique values and `cdf` the number of values less than or equal to each of them,
+    so the value at sorted position `i` is the first unique value whose cdf exceeds `i`.
+    Ties between cut points collapse into a single edge. If the maximum value is a cut point, its edge is placed
+    just below the maximum (removing the edge preceding it) so that the maximum value gets its own bin.
+    """
+    max_val = unique[-1]
+    edges = np.unique(unique[np.searchsorted(cdf, bin_index, side='right')])
+    if len(edges) and edges[-1] == max_val:
+        removal_edges = edges[-2:-1]
+        edges = np.union1d(edges, [max_val - _BIN_EPSILON])
+        edges = np.setdiff1d(edges, removal_edges)
+    edges = np.where(edges == max_val, np.inf, edges)
+    edges = np.unique(np.concatenate([[-np.inf], edges, [np.inf]]))
+    return edges[1:].astype(np.float64)
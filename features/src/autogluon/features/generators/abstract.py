@@ -3,7 +3,7 @@ import inspect
 import logging
 import time
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from pandas import DataFrame, Series
 
@@ -637,6 +637,35 @@ class AbstractFeatureGenerator:
         else:
             return False
 
+    def _get_passthrough_features_out(self, features: List[str]) -> Optional[List[str]]:
+        """
+        Returns the column names output by _transform when given columns with the names `features`,
+        if _transform only forwards or renames its input columns without altering their values, else None.
+        Generators whose _transform is a passthrough should implement this to allow BulkFeatureGenerator to skip them during transform.
+        """
+        return None
+
+    def _get_passthrough_feature_links(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        Returns a list of (feature_in, feature_out) pairs in the column order of the transform output,
+        if transform only forwards or renames features_in (including pre and post generators), else None.
+        """
+        if not self._is_fit or self._pre_astype_generator is not None:
+            return None
+        features_out = self._get_passthrough_features_out(list(self.features_in))
+        if features_out is None or len(features_out) != len(self.features_in):
+            return None
+        feature_links = list(zip(self.features_in, features_out))
+        for generator in self._post_generators:
+            generator_feature_links = generator._get_passthrough_feature_links()
+            if generator_feature_links is None:
+                return None
+            feature_origin_map = {feature_out: feature_in for feature_in, feature_out in feature_links}
+            if any(feature not in feature_origin_map for feature, _ in generator_feature_links):
+                return None
+            feature_links = [(feature_origin_map[feature_in], feature_out) for feature_in, feature_out in generator_feature_links]
+        return feature_links
+
     def get_feature_links(self) -> Dict[str, List[str]]:
         """Returns feature links including all pre and post generators."""
         return self._get_feature_links_from_chain(self.get_feature_links_chain())
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import Dict, List, Tuple
 
 import pandas as pd
 from pandas import DataFrame
@@ -114,6 +114,8 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
 
         # FeatureMetadata object based on the original input features that were unused by any feature generator.
         self._feature_metadata_in_unused: FeatureMetadata = None
+        # Transform plan compiled from self.generators after fit, refer to `_compile_transform_plan`
+        self._transform_plan: List[List[Tuple[AbstractFeatureGenerator, List[Tuple[str, str]]]]] = None
 
     def _fit_transform(self, X: DataFrame, **kwargs) -> (DataFrame, dict):
         feature_metadata = self.feature_metadata_in
@@ -166,6 +168,71 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
         return X, feature_metadata.type_group_map_special
 
     def _transform(self, X: DataFrame) -> DataFrame:
+        transform_plan = getattr(self, '_transform_plan', None)
+        if transform_plan is None:
+            transform_plan = self._transform_plan = self._compile_transform_plan()
+        return self._transform_with_plan(X, transform_plan=transform_plan)
+
+    def _compile_transform_plan(self) -> List[List[Tuple[AbstractFeatureGenerator, List[Tuple[str, str]]]]]:
+        """
+        Compiles the generators into a transform plan with one list of (generator, passthrough_feature_links) pairs per stage.
+        passthrough_feature_links is not None for generators which only forward or rename their input features (such as IdentityFeatureGenerator,
+        DropUniqueFeatureGenerator and RenameFeatureGenerator), these are skipped during transform by forwarding the columns instead.
+        """
+        return [[(generator, generator._get_passthrough_feature_links()) for generator in generator_group] for generator_group in self.generators]
+
+    def _transform_with_plan(self, X: DataFrame, transform_plan: list) -> DataFrame:
+        """
+        Transforms X in a single pass over the transform plan.
+        The output of each stage is tracked as a map of feature name to its source DataFrame and column,
+        so generator outputs are not concatenated between stages and passthrough generators are not called.
+        Equivalent to `_transform_sequential`.
+        """
+        column_map = {column: (X, column) for column in X.columns}
+        columns = list(X.columns)
+        for stage in transform_plan:
+            column_map_stage = dict()
+            columns_stage = []
+            for generator, passthrough_feature_links in stage:
+                if passthrough_feature_links is not None:
+                    for feature_in, feature_out in passthrough_feature_links:
+                        column_map_stage[feature_out] = column_map[feature_in]
+                        columns_stage.append(feature_out)
+                else:
+                    X_generator = generator.transform(self._gather_columns(column_map, columns=generator.features_in, index=X.index))
+                    for column in X_generator.columns:
+                        column_map_stage[column] = (X_generator, column)
+                        columns_stage.append(column)
+            column_map = column_map_stage
+            columns = columns_stage
+        return self._gather_columns(column_map, columns=columns, index=X.index)
+
+    @staticmethod
+    def _gather_columns(column_map: Dict[str, Tuple[DataFrame, str]], columns: List[str], index) -> DataFrame:
+        """Returns a DataFrame of the columns from their source DataFrames in column_map, avoiding copies when a source DataFrame matches columns."""
+        if not columns:
+            return DataFrame(index=index)
+        # Consecutive columns from the same source DataFrame are selected together
+        sources = []
+        for column in columns:
+            X_source, column_source = column_map[column]
+            if sources and sources[-1][0] is X_source:
+                sources[-1][1].append(column_source)
+            else:
+                sources.append((X_source, [column_source]))
+        X_list = [X_source if columns_source == list(X_source.columns) else X_source[columns_source] for X_source, columns_source in sources]
+        if len(X_list) == 1:
+            X_out = X_list[0]
+        else:
+            X_out = pd.concat(X_list, axis=1, ignore_index=False, copy=False)
+        if list(X_out.columns) != columns:
+            # Renamed columns, shallow copy to avoid altering the source DataFrame
+            X_out = X_out.copy(deep=False)
+            X_out.columns = columns
+        return X_out
+
+    def _transform_sequential(self, X: DataFrame) -> DataFrame:
+        """Transforms X by calling every generator of each stage and concatenating their outputs to form the input of the next stage."""
         for generator_group in self.generators:
             feature_df_list = []
             for generator in generator_group:
@@ -195,7 +262,17 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
             feature_links_chain.append(feature_links_group)
         return feature_links_chain
 
+    def _post_fit_cleanup(self):
+        super()._post_fit_cleanup()
+        self._transform_plan = self._compile_transform_plan()
+
+    def _remove_features_in(self, features: list):
+        super()._remove_features_in(features)
+        if features:
+            self._transform_plan = None
+
     def _remove_unused_features(self, feature_links_chain):
+        self._transform_plan = None
         unused_features_by_stage = self._get_unused_features(feature_links_chain)
         if unused_features_by_stage:
             unused_features_in = [feature for feature in self.feature_metadata_in.get_features() if feature in unused_features_by_stage[0]]
@@ -1,6 +1,7 @@
 import copy
 import logging
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from pandas.api.types import CategoricalDtype
@@ -73,6 +74,8 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
         self._fillna = fillna
         self._fillna_flag = self._fillna is not None
         self._fillna_map = None
+        # If True, the CategoryMemoryMinimizeFeatureGenerator post generator is fused into transform
+        self._minimize_memory_fused = False
 
         if minimize_memory:
             self._post_generators = [CategoryMemoryMinimizeFeatureGenerator()] + self._post_generators
@@ -106,16 +109,33 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
         if self.features_in:
             X_category = dict()
             if self.category_map is not None:
+                fillna_map = self._fillna_map if self._fillna_map is not None else dict()
+                minimize_memory_fused = getattr(self, '_minimize_memory_fused', False)
                 for column, column_map in self.category_map.items():
-                    X_category[column] = pd.Categorical(X[column], categories=column_map)
+                    codes = self._get_category_codes(X[column], categories=column_map)
+                    if column in fillna_map:
+                        codes[codes == -1] = column_map.get_loc(fillna_map[column])
+                    # With fused memory minimization, the categories are their codes as in CategoryMemoryMinimizeFeatureGenerator
+                    categories = pd.RangeIndex(len(column_map)) if minimize_memory_fused else column_map
+                    X_category[column] = pd.Categorical.from_codes(codes, dtype=CategoricalDtype(categories=categories))
                 X_category = DataFrame(X_category, index=X.index)
-                if self._fillna_map is not None:
-                    for column, column_map in self._fillna_map.items():
-                        X_category[column].fillna(column_map, inplace=True)
         else:
             X_category = DataFrame(index=X.index)
         return X_category
 
+    @staticmethod
+    def _get_category_codes(series: pd.Series, categories: pd.Index) -> np.ndarray:
+        """
+        Returns the codes of the values of series in categories, -1 for missing values and values not in categories.
+        Equivalent to `pd.Categorical(series, categories=categories).codes`, without hashing every value again for categorical input.
+        """
+        if isinstance(series.dtype, CategoricalDtype):
+            # Remap the codes of the input categories through a lookup array, code -1 (missing) maps to the appended -1
+            lookup = np.append(categories.get_indexer(series.cat.categories), -1)
+            return lookup[series.cat.codes.to_numpy()]
+        else:
+            return categories.get_indexer(series)
+
     def _generate_category_map(self, X: DataFrame) -> (DataFrame, dict):
         if self.features_in:
             fill_nan_map = dict()
@@ -154,6 +174,16 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
         else:
             return DataFrame(index=X.index), None, None
 
+    def _post_fit_cleanup(self):
+        super()._post_fit_cleanup()
+        # Fuse memory minimization into transform, producing the minimized categories directly instead of renaming them afterwards
+        if self.category_map is not None and self._post_generators \
+                and isinstance(self._post_generators[0], CategoryMemoryMinimizeFeatureGenerator) \
+                and self._post_generators[0].features_in == list(self.category_map.keys()) \
+                and not self._post_generators[0]._pre_astype_generator and not self._post_generators[0]._post_generators:
+            self._post_generators = self._post_generators[1:]
+            self._minimize_memory_fused = True
+
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
         if self.category_map:
@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 from pandas import DataFrame
 
+from autogluon.common.features.infer_types import infer_datetime_format
 from autogluon.common.features.types import R_DATETIME, S_DATETIME_AS_OBJECT
 from .abstract import AbstractFeatureGenerator
 
@@ -28,6 +29,13 @@ class DatetimeFeatureGenerator(AbstractFeatureGenerator):
 
     def _fit_transform(self, X: DataFrame, **kwargs) -> (DataFrame, dict):
         self._fillna_map = dict()
+        # Formats of datetime_as_object features, used to parse them in a vectorized way instead of element-wise
+        self._datetime_format_map = dict()
+        for feature in self.features_in:
+            if X[feature].dtype == object:
+                datetime_format = infer_datetime_format(X[feature])
+                if datetime_format is not None:
+                    self._datetime_format_map[feature] = datetime_format
         X_out = self._transform(X, is_fit=True)
         type_family_groups_special = dict(
             datetime_as_int=list(X_out.columns)
@@ -48,28 +56,48 @@ class DatetimeFeatureGenerator(AbstractFeatureGenerator):
         # TODO: Be aware: When converted to float32 by downstream models, the seconds value will be up to 3 seconds off the true time due to rounding error.
         #  If seconds matter, find a separate way to generate (Possibly subtract smallest datetime from all values).
         # TODO: could also return an extra boolean column is_nan which could provide predictive signal.
-        # Note: The .replace call is required to handle the obnoxious edge-case of:
-        #   NaN, empty string, datetime without timezone, and datetime with timezone, all as an object type, all being present in the same column.
-        #   I don't know why, but in this specific situation (and not otherwise), NaN will be filled by .fillna, but empty string will be converted to NaT
-        #   and refuses to be filled by .fillna, requiring a dedicated replace call. (NaT is filled by .fillna in every other situation...)
-        series = pd.to_datetime(X[feature].copy(), utc=True, errors='coerce')
-        broken_idx = series[(series == 'NaT') | series.isna() | series.isnull()].index
-        bad_rows = series.iloc[broken_idx]
+        values = self._normalize_timeseries_int64(X, feature=feature, is_fit=is_fit)
+        return pd.Series(pd.to_datetime(values, utc=True), index=X.index, name=feature)
+
+    def _normalize_timeseries_int64(self, X: pd.DataFrame, feature: str, is_fit: bool) -> np.ndarray:
+        """Returns the UTC datetimes of the feature as int64 nanoseconds since epoch, with missing and unparseable values filled."""
+        series = self._to_datetime(X[feature], datetime_format=getattr(self, '_datetime_format_map', {}).get(feature, None))
+        # Copy, as the values of a datetime Series can be a view of the input data
+        values = series.to_numpy(dtype='datetime64[ns]').view(np.int64).copy()
+        is_missing = values == np.iinfo(np.int64).min  # NaT
         if is_fit:
-            good_rows = series[~series.isin(bad_rows)].astype(np.int64)
-            self._fillna_map[feature] = pd.to_datetime(int(good_rows.mean()), utc=True)
-        series[broken_idx] = self._fillna_map[feature]
-        return series
+            self._fillna_map[feature] = pd.to_datetime(int(values[~is_missing].mean()), utc=True)
+        values[is_missing] = self._fillna_map[feature].value
+        return values
+
+    @staticmethod
+    def _to_datetime(series: pd.Series, datetime_format: str = None) -> pd.Series:
+        if datetime_format is None:
+            return pd.to_datetime(series.copy(), utc=True, errors='coerce')
+        series_datetime = pd.to_datetime(series, format=datetime_format, utc=True, errors='coerce')
+        # Values not matching the format learned during fit fall back to element-wise parsing
+        unmatched = series_datetime.isnull() & series.notnull()
+        if unmatched.any():
+            series_datetime[unmatched] = pd.to_datetime(series[unmatched], utc=True, errors='coerce')
+        return series_datetime
 
     # TODO: Improve handling of missing datetimes
     def _generate_features_datetime(self, X: DataFrame, is_fit: bool) -> DataFrame:
-        X_datetime = DataFrame(index=X.index)
+        X_datetime = dict()
         for datetime_feature in self.features_in:
-            X_datetime[datetime_feature] = self.normalize_timeseries(X, datetime_feature, is_fit=is_fit)
+            values = self._normalize_timeseries_int64(X, datetime_feature, is_fit=is_fit)
+            X_datetime[datetime_feature] = values
+            components = _get_datetime_components(values, features=[f for f in self.features if f in _DATETIME_COMPONENT_DTYPES])
+            series_datetime = None
             for feature in self.features:
-                X_datetime[datetime_feature + '.' + feature] = getattr(X_datetime[datetime_feature].dt, feature).astype(np.int64)
-            X_datetime[datetime_feature] = pd.to_numeric(X_datetime[datetime_feature])
-        return X_datetime
+                if feature in components:
+                    X_datetime[datetime_feature + '.' + feature] = components[feature]
+                else:
+                    # Components without a vectorized implementation are extracted through the pandas accessor
+                    if series_datetime is None:
+                        series_datetime = pd.Series(pd.to_datetime(values, utc=True), index=X.index)
+                    X_datetime[datetime_feature + '.' + feature] = getattr(series_datetime.dt, feature).to_numpy(dtype=np.int64)
+        return DataFrame(X_datetime, index=X.index)
 
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
@@ -77,3 +105,63 @@ class DatetimeFeatureGenerator(AbstractFeatureGenerator):
             for feature in features:
                 if feature in self._fillna_map:
                     self._fillna_map.pop(feature)
+        if getattr(self, '_datetime_format_map', None):
+            for feature in features:
+                self._datetime_format_map.pop(feature, None)
+
+
+_NS_PER_SECOND = 10 ** 9
+_NS_PER_DAY = 86400 * _NS_PER_SECOND
+# Compact dtypes of the datetime components computed by `_get_datetime_components`
+_DATETIME_COMPONENT_DTYPES = dict(
+    year=np.int16,
+    month=np.int8,
+    day=np.int8,
+    dayofweek=np.int8,
+    weekday=np.int8,
+    dayofyear=np.int16,
+    quarter=np.int8,
+    hour=np.int8,
+    minute=np.int8,
+    second=np.int8,
+)
+# Number of days before the first day of each month in a non-leap year
+_DAYS_BEFORE_MONTH = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+
+
+def _get_datetime_components(values: np.ndarray, features: list) -> dict:
+    """
+    Computes datetime components of int64 nanoseconds since epoch (UTC) with integer arithmetic,
+    equal to the components of the pandas `.dt` accessor for the features in `_DATETIME_COMPONENT_DTYPES`.
+    The date is obtained from the number of days since epoch with the `civil_from_days` algorithm of Howard Hinnant.
+    """
+    components = dict()
+    if not features:
+        return components
+    days = values // _NS_PER_DAY
+    if any(f in features for f in ['year', 'month', 'day', 'dayofyear', 'quarter']):
+        z = days + 719468  # Days since 0000-03-01
+        era = z // 146097
+        day_of_era = z - era * 146097
+        year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+        day_of_year_from_march = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+        month_from_march = (5 * day_of_year_from_march + 2) // 153
+        day = day_of_year_from_march - (153 * month_from_march + 2) // 5 + 1
+        month = np.where(month_from_march < 10, month_from_march + 3, month_from_march - 9)
+        year = year_of_era + era * 400 + (month <= 2)
+        components['year'] = year
+        components['month'] = month
+        components['day'] = day
+        if 'dayofyear' in features:
+            is_leap_year = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+            components['dayofyear'] = _DAYS_BEFORE_MONTH[month - 1] + day + (is_leap_year & (month > 2))
+        if 'quarter' in features:
+            components['quarter'] = (month - 1) // 3 + 1
+    if 'dayofweek' in features or 'weekday' in features:
+        components['dayofweek'] = components['weekday'] = (days + 3) % 7  # 1970-01-01 is a Thursday
+    if any(f in features for f in ['hour', 'minute', 'second']):
+        seconds_of_day = (values - days * _NS_PER_DAY) // _NS_PER_SECOND
+        components['hour'] = seconds_of_day // 3600
+        components['minute'] = seconds_of_day // 60 % 60
+        components['second'] = seconds_of_day % 60
+    return {feature: components[feature].astype(_DATETIME_COMPONENT_DTYPES[feature]) for feature in features}
@@ -1,7 +1,9 @@
 import logging
-from typing import Union
+from typing import Callable, Union
 from collections import defaultdict
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from autogluon.common.features.types import R_INT, R_FLOAT, R_CATEGORY, R_BOOL
@@ -31,6 +33,9 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
     """
+    # Maximum number of values hashed at once when fingerprinting numeric features
+    _fingerprint_chunk_elements = 10000000
+
     def __init__(self, sample_size_init=1000, sample_size_final=20000, **kwargs):
         super().__init__(**kwargs)
         self.sample_size_init = sample_size_init
@@ -52,6 +57,11 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _get_passthrough_features_out(self, features: list):
+        if type(self)._transform is DropDuplicatesFeatureGenerator._transform:
+            return features
+        return None
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -83,27 +93,28 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
 
     @classmethod
     def _drop_duplicate_features_generic(cls, X: DataFrame, keep: Union[str, bool] = 'first'):
-        """Generic duplication dropping method. Much slower than optimized variants, but can handle all data types."""
+        """Generic duplication dropping method. Slower than optimized variants, but can handle all data types."""
         X_columns = list(X.columns)
-        features_to_keep = set(X.T.drop_duplicates(keep=keep).T.columns)
-        features_to_remove = [column for column in X_columns if column not in features_to_keep]
-        return features_to_remove
+        fingerprints = cls._get_fingerprints_chunked(
+            features=X_columns,
+            num_rows=len(X),
+            get_values=lambda features: np.column_stack([pd.util.hash_pandas_object(X[feature], index=False).to_numpy() for feature in features]),
+            hash_values=False,
+        )
+        return cls._drop_duplicate_fingerprints(features=X_columns, fingerprints=fingerprints, get_values=lambda feature: X[feature].to_numpy(), keep=keep)
 
     @classmethod
     def _drop_duplicate_features_numeric(cls, X: DataFrame, keep: Union[str, bool] = 'first'):
         X_columns = list(X.columns)
-        feature_sum_map = defaultdict(list)
-        for feature in X_columns:
-            feature_sum_map[round(X[feature].sum(), 2)].append(feature)
 
-        features_to_remove = []
-        for key in feature_sum_map:
-            if len(feature_sum_map[key]) <= 1:
-                continue
-            features_to_keep = set(X[feature_sum_map[key]].T.drop_duplicates(keep=keep).T.columns)
-            features_to_remove += [feature for feature in feature_sum_map[key] if feature not in features_to_keep]
+        def _get_values(features: list) -> np.ndarray:
+            # Cast to float64 so that equal int and float values share a fingerprint, mapping -0.0 to 0.0 and all NaN to a single bit pattern.
+            values = X[features].to_numpy(dtype=np.float64) + 0.0
+            values[np.isnan(values)] = np.nan
+            return values
 
-        return features_to_remove
+        fingerprints = cls._get_fingerprints_chunked(features=X_columns, num_rows=len(X), get_values=_get_values)
+        return cls._drop_duplicate_fingerprints(features=X_columns, fingerprints=fingerprints, get_values=lambda feature: X[feature].to_numpy(), keep=keep)
 
     @classmethod
     def _drop_duplicate_features_categorical(cls, X: DataFrame, keep: Union[str, bool] = 'first'):
@@ -112,26 +123,87 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
         For example, ['a', 'b', 'b'] is considered a duplicate of ['b', 'a', 'a'], but not ['a', 'b', 'a'].
         """
         X_columns = list(X.columns)
-        mapping_features_val_dict = {}
-        features_unique_count_dict = defaultdict(list)
-        features_to_remove = []
-        for feature in X_columns:
-            feature_unique_vals = X[feature].unique()
-            mapping_features_val_dict[feature] = dict(zip(feature_unique_vals, range(len(feature_unique_vals))))
-            features_unique_count_dict[len(feature_unique_vals)].append(feature)
-
-        for feature_unique_count in features_unique_count_dict:
-            # Only need to check features that have same amount of unique values.
-            features_to_check = features_unique_count_dict[feature_unique_count]
-            if len(features_to_check) <= 1:
-                continue
-            mapping_features_val_dict_cur = {feature: mapping_features_val_dict[feature] for feature in features_to_check}
-            # Converts ['a', 'd', 'f', 'a'] to [0, 1, 2, 0]
-            # Converts [5, 'a', np.nan, 5] to [0, 1, 2, 0], these would be considered duplicates since they carry the same information.
-            X_cur = X[features_to_check].replace(mapping_features_val_dict_cur)
-            features_to_remove += cls._drop_duplicate_features_numeric(X=X_cur, keep=keep)
+        # Converts ['a', 'd', 'f', 'a'] to [0, 1, 2, 0]
+        # Converts [5, 'a', np.nan, 5] to [0, 1, 2, 0], these would be considered duplicates since they carry the same information.
+        # The second factorize assigns missing values (code -1) their own code in order of appearance.
+        codes_map = {feature: pd.factorize(pd.factorize(X[feature], sort=False)[0], sort=False)[0] for feature in X_columns}
+        fingerprints = cls._get_fingerprints_chunked(
+            features=X_columns,
+            num_rows=len(X),
+            get_values=lambda features: np.column_stack([codes_map[feature] for feature in features]),
+        )
+        return cls._drop_duplicate_fingerprints(features=X_columns, fingerprints=fingerprints, get_values=codes_map.get, keep=keep)
 
-        return features_to_remove
+    @staticmethod
+    def _get_fingerprint_weights(num_rows: int) -> np.ndarray:
+        return np.random.RandomState(0).randint(1, np.iinfo(np.int64).max, size=num_rows, dtype=np.int64).astype(np.uint64)
+
+    @classmethod
+    def _get_fingerprints_chunked(cls, features: list, num_rows: int, get_values: Callable[[list], np.ndarray], hash_values: bool = True) -> np.ndarray:
+        """
+        Returns a 64-bit fingerprint for each feature, where `get_values` returns the 2-d array of values of a list of features.
+        Features are fingerprinted in chunks to bound the memory usage of the intermediate arrays, sharing the row weights across chunks.
+        """
+        weights = cls._get_fingerprint_weights(num_rows)
+        chunk_size = max(1, cls._fingerprint_chunk_elements // max(1, num_rows))
+        fingerprints = [cls._get_fingerprints(get_values(features[i:i + chunk_size]), weights=weights, hash_values=hash_values)
+                        for i in range(0, len(features), chunk_size)]
+        return np.concatenate(fingerprints) if fingerprints else np.array([], dtype=np.uint64)
+
+    @staticmethod
+    def _get_fingerprints(values: np.ndarray, weights: np.ndarray, hash_values: bool = True) -> np.ndarray:
+        """
+        Returns an order-sensitive 64-bit fingerprint for each column of the 2-d array `values`. Equal columns always share a fingerprint.
+        If `hash_values=False`, `values` must already contain 64-bit hashes of the rows.
+        """
+        num_rows, num_columns = values.shape
+        if hash_values:
+            row_hashes = pd.util.hash_array(values.ravel(order='F')).reshape(num_columns, num_rows)
+        else:
+            row_hashes = values.T
+        # uint64 arithmetic wraps around on overflow, which is the intended behavior here
+        return (row_hashes * weights).sum(axis=1, dtype=np.uint64)
+
+    @staticmethod
+    def _drop_duplicate_fingerprints(features: list,
+                                     fingerprints: np.ndarray,
+                                     get_values: Callable[[str], np.ndarray],
+                                     keep: Union[str, bool] = 'first') -> list:
+        """
+        Returns the duplicate features to remove, following the `keep` semantics of `DataFrame.drop_duplicates`.
+        Only features sharing a fingerprint are compared, and the comparison is exact (missing values are considered equal).
+        """
+        fingerprint_groups = defaultdict(list)
+        for feature, fingerprint in zip(features, fingerprints):
+            fingerprint_groups[fingerprint].append(feature)
+
+        features_to_remove = set()
+        for group in fingerprint_groups.values():
+            if len(group) <= 1:
+                continue
+            duplicate_sets = []
+            for feature in group:
+                values = get_values(feature)
+                for duplicate_set in duplicate_sets:
+                    if _array_equal(duplicate_set[0][1], values):
+                        duplicate_set.append((feature, values))
+                        break
+                else:
+                    duplicate_sets.append([(feature, values)])
+            for duplicate_set in duplicate_sets:
+                if len(duplicate_set) <= 1:
+                    continue
+                duplicate_features = [feature for feature, _ in duplicate_set]
+                if keep == 'first':
+                    duplicate_features = duplicate_features[1:]
+                elif keep == 'last':
+                    duplicate_features = duplicate_features[:-1]
+                features_to_remove.update(duplicate_features)
+        return [feature for feature in features if feature in features_to_remove]
 
     def _more_tags(self):
         return {'feature_interactions': False}
+
+
+def _array_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    return len(a) == len(b) and bool(np.all((a == b) | (pd.isnull(a) & pd.isnull(b))))
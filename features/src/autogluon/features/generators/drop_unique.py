@@ -26,6 +26,11 @@ class DropUniqueFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _get_passthrough_features_out(self, features: list):
+        if type(self)._transform is DropUniqueFeatureGenerator._transform:
+            return features
+        return None
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
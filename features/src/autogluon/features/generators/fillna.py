@@ -53,10 +53,16 @@ class FillNaFeatureGenerator(AbstractFeatureGenerator):
 
     def _transform(self, X: DataFrame) -> DataFrame:
         if self._fillna_feature_map:
+            # Only fill features which contain missing values, as filling a feature is far more costly than checking it
+            features_with_nan = X[list(self._fillna_feature_map.keys())].isnull().any()
+            fillna_feature_map = {feature: self._fillna_feature_map[feature] for feature in features_with_nan.index[features_with_nan]}
             if self.inplace:
-                X.fillna(self._fillna_feature_map, inplace=True, downcast=False)
+                if fillna_feature_map:
+                    X.fillna(fillna_feature_map, inplace=True, downcast=False)
+            elif fillna_feature_map:
+                X = X.fillna(fillna_feature_map, inplace=False, downcast=False)
             else:
-                X = X.fillna(self._fillna_feature_map, inplace=False, downcast=False)
+                X = X.copy()
         return X
 
     @staticmethod
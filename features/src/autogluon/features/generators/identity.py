@@ -16,6 +16,11 @@ class IdentityFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _get_passthrough_features_out(self, features: list):
+        if type(self)._transform is IdentityFeatureGenerator._transform:
+            return features
+        return None
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
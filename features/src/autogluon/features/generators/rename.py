@@ -49,6 +49,12 @@ class RenameFeatureGenerator(AbstractFeatureGenerator):
             X.columns = self.features_out
         return X
 
+    def _get_passthrough_features_out(self, features: list):
+        if self.inplace or type(self)._transform is not RenameFeatureGenerator._transform:
+            # Renaming inplace alters the outer context, which is not reproduced when skipping the generator
+            return None
+        return self.features_out if self._is_updated_name else features
+
     def _get_renamed_features(self, X: DataFrame) -> (DataFrame, dict):
         X_columns_orig = list(X.columns)
         X_columns_new = list(X.columns)
@@ -5,10 +5,11 @@ import traceback
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
+from scipy.sparse import csr_matrix, hstack
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression
 
 from autogluon.common.utils.lite import disable_if_lite_mode
-from autogluon.common.features.types import S_IMAGE_PATH, S_IMAGE_BYTEARRAY, S_TEXT, S_TEXT_NGRAM
+from autogluon.common.features.types import S_IMAGE_PATH, S_IMAGE_BYTEARRAY, S_SPARSE, S_TEXT, S_TEXT_NGRAM
 
 from .abstract import AbstractFeatureGenerator
 from ..vectorizers import get_ngram_freq, downscale_vectorizer, vectorizer_auto_ml_default
@@ -17,7 +18,6 @@ logger = logging.getLogger(__name__)
 
 
 # TODO: Add argument to define the text preprocessing logic
-# TODO: Add argument to output ngrams as a sparse matrix
 # TODO: Add HashingVectorizer support
 # TODO: Documentation
 class TextNgramFeatureGenerator(AbstractFeatureGenerator):
@@ -45,11 +45,18 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         ngram features will be removed in least frequent to most frequent order.
         Note: For vectorizer_strategy values other than 'combined', the resulting ngrams may use more than this value.
         It is recommended to only increase this value above 0.15 if confident that higher values will not result in out-of-memory errors.
+    sparse : bool, default False
+        If True, the ngram features are output as pandas sparse columns built directly from the sparse vectorizer output instead of dense columns,
+        and their memory usage is estimated from the number of non-zero values.
+        This greatly reduces memory usage for large vocabularies, and models which accept sparse input (such as XGBoost and LinearModel)
+        train on the sparse data without densifying it.
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
     """
-    def __init__(self, vectorizer=None, vectorizer_strategy='combined', max_memory_ratio=0.15, prefilter_tokens=False, prefilter_token_count=100, **kwargs):
+    def __init__(self, vectorizer=None, vectorizer_strategy='combined', max_memory_ratio=0.15, prefilter_tokens=False, prefilter_token_count=100,
+                 sparse=False, **kwargs):
         super().__init__(**kwargs)
+        self.sparse = sparse
         self.vectorizers = []
         # TODO: 0.20 causes OOM error with 64 GB ram on NN with several datasets. LightGBM and CatBoost succeed
         # TODO: Finetune this, or find a better way to ensure stability
@@ -95,6 +102,8 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         type_family_groups_special = {
             S_TEXT_NGRAM: list(X_out.columns)
         }
+        if getattr(self, 'sparse', False):
+            type_family_groups_special[S_SPARSE] = list(X_out.columns)
         return X_out, type_family_groups_special
 
     def _transform(self, X: DataFrame) -> DataFrame:
@@ -211,11 +220,17 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
                                                     )
                 self._feature_names_dict[nlp_feature] = nlp_features_names_final
 
-            transform_array = transform_matrix.toarray()
-            # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
-            nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
-            transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
-            X_nlp_features = pd.DataFrame(transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index)  # TODO: Consider keeping sparse
+            if getattr(self, 'sparse', False):
+                # Count from the sparse structure, equal to the dense count as vectorizers do not store explicit zeros
+                nonzero_count = transform_matrix.getnnz(axis=1).astype(np.uint16)
+                transform_matrix = hstack([transform_matrix, csr_matrix(np.expand_dims(nonzero_count, axis=1))], format='csc')
+                X_nlp_features = pd.DataFrame.sparse.from_spmatrix(transform_matrix, columns=self._feature_names_dict[nlp_feature], index=X.index)
+            else:
+                transform_array = transform_matrix.toarray()
+                # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
+                nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
+                transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
+                X_nlp_features = pd.DataFrame(transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index)
             X_nlp_features_combined.append(X_nlp_features)
 
         if X_nlp_features_combined:
@@ -233,8 +248,12 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         @disable_if_lite_mode(ret=downsample_ratio)
         def _adjust_per_memory_constraints(downsample_ratio: int):
             import psutil
-            # This assumes that the ngrams eventually turn into int32/float32 downstream
-            predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
+            if getattr(self, 'sparse', False):
+                # Sparse columns store a 4 byte value and a 4 byte index per non-zero value, the _total_ column is non-zero for most rows
+                predicted_ngrams_memory_usage_bytes = 8 * (transform_matrix.nnz + len(text_data)) + 80
+            else:
+                # This assumes that the ngrams eventually turn into int32/float32 downstream
+                predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
             mem_avail = psutil.virtual_memory().available
             mem_rss = psutil.Process().memory_info().rss
             predicted_rss = mem_rss + predicted_ngrams_memory_usage_bytes
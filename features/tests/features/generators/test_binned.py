@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from autogluon.features import binning
+from autogluon.features.generators import BinnedFeatureGenerator
+
+
+def test_binned_feature_generator(generator_helper, data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+
+    generator = BinnedFeatureGenerator(num_bins=3)
+
+    expected_feature_metadata_in_full = {
+        ('float', ()): ['float'],
+        ('int', ()): ['int_bool', 'int'],
+    }
+
+    expected_feature_metadata_full = {
+        ('int', ('binned',)): ['int_bool', 'int', 'float'],
+    }
+
+    # Missing values are placed in the bin after the last edge
+    expected_output_data = pd.DataFrame({
+        'int_bool': [0, 1, 1, 0, 0, 0, 1, 0, 1],
+        'int': [2, 0, 0, 1, 0, 0, 0, 0, 2],
+        'float': [2, 0, 3, 1, 0, 1, 1, 0, 2],
+    }, dtype=np.uint8)
+
+    # When
+    output_data = generator_helper.fit_transform_assert(
+        input_data=input_data,
+        generator=generator,
+        expected_feature_metadata_in_full=expected_feature_metadata_in_full,
+        expected_feature_metadata_full=expected_feature_metadata_full,
+    )
+
+    assert expected_output_data.equals(output_data)
+
+
+def test_generate_bins_ties_and_parallel():
+    # Given
+    rng = np.random.RandomState(0)
+    input_data = pd.DataFrame({
+        'float': rng.normal(size=1000),
+        'tied': np.repeat(np.arange(20), 50),
+        'max_heavy': np.where(rng.rand(1000) < 0.5, 100, rng.randint(0, 100, size=1000)),
+        'constant': np.ones(1000),
+        'few_unique': rng.randint(0, 3, size=1000),
+    })
+
+    # When
+    bin_map = binning.generate_bins(input_data, list(input_data.columns), ideal_bins=10, num_cpus=1)
+    bin_map_parallel = binning.generate_bins(input_data, list(input_data.columns), ideal_bins=10, num_cpus=4)
+
+    # Then
+    for feature, bins in bin_map.items():
+        assert np.array_equal(bins, bin_map_parallel[feature])
+        assert bins.dtype == np.float64
+        assert np.all(np.diff(bins) > 0)
+        assert bins[-1] == np.inf
+    assert len(bin_map['float']) == 10
+    assert len(bin_map['tied']) == 10
+    assert list(bin_map['constant']) == [np.inf]
+    assert list(bin_map['few_unique']) == [0, 2 - 0.000000001, np.inf]
+    # The maximum value always gets its own bin
+    assert bin_map['max_heavy'][-2] == 100 - 0.000000001
@@ -1,5 +1,6 @@
 
 import numpy as np
+import pandas as pd
 
 from autogluon.features.generators import CategoryFeatureGenerator
 
@@ -72,3 +73,36 @@ def test_category_feature_generator(generator_helper, data_helper):
             assert list(output_data[col].cat.categories) == expected_cat_categories_lst[i]
             assert list(output_data[col]) in expected_cat_values_lst[i]
             assert list(output_data[col].cat.codes) in expected_cat_codes_lst[i]
+
+
+def test_category_feature_generator_transform_matches_reference():
+    # Transform remaps codes instead of rebuilding the categoricals, the output must equal the reference implementation
+    rng = np.random.RandomState(0)
+    num_rows = 1000
+    X = pd.DataFrame({
+        'obj': pd.Series(rng.choice(['a', 'b', 'c', 'd', None], num_rows), dtype=object),
+        'cat': pd.Series(rng.choice(['x', 'y', 'z', np.nan], num_rows)).astype('category'),
+        'bool': rng.rand(num_rows) > 0.5,
+    })
+    # Unseen values and categories absent during fit
+    X_test = X.copy()
+    X_test['obj'] = X_test['obj'].where(rng.rand(num_rows) > 0.1, 'unseen')
+    X_test['cat'] = pd.Series(rng.choice(['y', 'w', 'x', np.nan], num_rows)).astype('category')
+
+    for kwargs in [dict(), dict(fillna='mode'), dict(minimize_memory=False), dict(minimize_memory=False, fillna='mode'), dict(minimum_cat_count=250)]:
+        generator = CategoryFeatureGenerator(**kwargs)
+        X_out = generator.fit_transform(X)
+        X_test_out = generator.transform(X_test)
+        assert generator._minimize_memory_fused == kwargs.get('minimize_memory', True)
+
+        X_test_expected = dict()
+        for column, categories in generator.category_map.items():
+            X_test_expected[column] = pd.Categorical(X_test[column], categories=categories)
+            if generator._fillna_map is not None and column in generator._fillna_map:
+                X_test_expected[column] = X_test_expected[column].fillna(generator._fillna_map[column])
+            if generator._minimize_memory_fused:
+                X_test_expected[column] = X_test_expected[column].rename_categories(pd.RangeIndex(len(categories)))
+        X_test_expected = pd.DataFrame(X_test_expected, index=X_test.index)
+
+        pd.testing.assert_frame_equal(X_test_out, X_test_expected)
+        pd.testing.assert_frame_equal(generator.transform(X), X_out)
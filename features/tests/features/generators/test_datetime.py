@@ -133,3 +133,57 @@ def test_datetime_feature_generator_advanced(generator_helper, data_helper):
     )
 
     assert expected_output_data_feat_datetime == list(output_data['datetime_as_object'].values)
+
+
+def test_datetime_feature_generator_components_match_pandas():
+    import numpy as np
+    import pandas as pd
+    from autogluon.features.generators.datetime import _DATETIME_COMPONENT_DTYPES
+
+    # Given
+    rng = np.random.RandomState(0)
+    values = rng.randint(pd.Timestamp.min.value, pd.Timestamp.max.value, 10000, dtype=np.int64)
+    values[:3] = [0, -1, pd.Timestamp('2000-02-29 23:59:59').value]
+    input_data = pd.DataFrame({'datetime': pd.to_datetime(values)})
+    features = list(_DATETIME_COMPONENT_DTYPES) + ['is_month_start']
+
+    generator = DatetimeFeatureGenerator(features=features)
+
+    # When
+    output_data = generator.fit_transform(input_data)
+
+    # Then
+    series_datetime = pd.Series(pd.to_datetime(values, utc=True))
+    assert list(output_data['datetime'].values) == list(values)
+    for feature in features:
+        assert list(output_data[f'datetime.{feature}'].values) == list(getattr(series_datetime.dt, feature).astype(np.int64).values)
+    for feature, dtype in _DATETIME_COMPONENT_DTYPES.items():
+        assert output_data[f'datetime.{feature}'].dtype == dtype
+
+
+def test_datetime_feature_generator_matches_parsing_without_format():
+    import numpy as np
+    import pandas as pd
+
+    # Given
+    num_rows = 1000
+    # The first sampled value is AM, values are in the AM and PM hours
+    dates = pd.Series(pd.date_range('1990-03-14 10:00', periods=num_rows, freq='7h'))
+    input_data = pd.DataFrame({
+        'datetime_am_pm': dates.dt.strftime('%Y/%m/%d %I:%M %p'),
+        'datetime_day_first': dates.dt.strftime('%d/%m/%Y'),
+        'datetime_day_first_time': dates.dt.strftime('%d.%m.%Y %H:%M'),
+        'datetime_unknown': pd.Series(dates.dt.strftime('%Y%m%d')).where(np.arange(num_rows) % 2 == 0, 'unknown'),
+    }).astype(object)
+
+    generator = DatetimeFeatureGenerator(features=['year'])
+
+    # When
+    output_data = generator.fit_transform(input_data)
+
+    # Then
+    for feature in input_data:
+        expected = pd.to_datetime(input_data[feature], utc=True, errors='coerce')
+        is_parsed = expected.notnull().to_numpy()
+        assert is_parsed.any()
+        assert list(output_data[feature].values[is_parsed]) == list(expected[is_parsed].to_numpy(dtype='datetime64[ns]').view(np.int64))
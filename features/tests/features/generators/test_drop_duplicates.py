@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from autogluon.common.features.feature_metadata import FeatureMetadata
+from autogluon.features.generators import DropDuplicatesFeatureGenerator
+
+
+def test_drop_duplicates_feature_generator(generator_helper):
+    # Given
+    input_data = pd.DataFrame({
+        'int': [0, 1, 2, 2, 5],
+        'int_dup': [0, 1, 2, 2, 5],
+        'float_dup': [0.0, 1.0, 2.0, 2.0, 5.0],
+        'float_nan': [-0.0, np.nan, 2.5, 1.0, np.nan],
+        'float_nan_dup': [0.0, np.nan, 2.5, 1.0, np.nan],
+        'cat': pd.Categorical(['a', 'b', None, 'a', 'b']),
+        'cat_dup': pd.Categorical(['x', 'y', None, 'x', 'y']),
+        'cat_not_dup': pd.Categorical(['x', 'y', 'x', 'x', 'y']),
+        'obj': ['a', 'b', None, 'a', 'b'],
+        'obj_dup': ['a', 'b', None, 'a', 'b'],
+    })
+
+    generator = DropDuplicatesFeatureGenerator()
+
+    expected_feature_metadata_full = {
+        ('category', ()): ['cat', 'cat_not_dup'],
+        ('float', ()): ['float_nan'],
+        ('int', ()): ['int'],
+        ('object', ()): ['obj'],
+    }
+
+    # Duplicate features are removed from the input features as well
+    expected_feature_metadata_in_full = expected_feature_metadata_full
+
+    # When
+    output_data = generator_helper.fit_transform_assert(
+        input_data=input_data,
+        generator=generator,
+        expected_feature_metadata_in_full=expected_feature_metadata_in_full,
+        expected_feature_metadata_full=expected_feature_metadata_full,
+    )
+
+    assert list(output_data.columns) == ['int', 'float_nan', 'cat', 'cat_not_dup', 'obj']
+
+
+def test_drop_duplicate_features_keep():
+    # Given
+    rng = np.random.RandomState(0)
+    input_data = pd.DataFrame(rng.randint(0, 2, size=(100, 6)), columns=[f'feature_{i}' for i in range(6)])
+    input_data['feature_3'] = input_data['feature_0']
+    input_data['feature_5'] = input_data['feature_0']
+    feature_metadata_in = FeatureMetadata.from_df(input_data)
+
+    # When
+    features_to_remove_first = DropDuplicatesFeatureGenerator._drop_duplicate_features(input_data, feature_metadata_in, keep='first')
+    features_to_remove_last = DropDuplicatesFeatureGenerator._drop_duplicate_features(input_data, feature_metadata_in, keep='last')
+    features_to_remove_all = DropDuplicatesFeatureGenerator._drop_duplicate_features(input_data, feature_metadata_in, keep=False)
+
+    # Then
+    assert features_to_remove_first == ['feature_3', 'feature_5']
+    assert features_to_remove_last == ['feature_0', 'feature_3']
+    assert features_to_remove_all == ['feature_0', 'feature_3', 'feature_5']
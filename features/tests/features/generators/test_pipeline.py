@@ -1,4 +1,5 @@
 
+import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import CountVectorizer
 
@@ -201,3 +202,49 @@ def test_pipeline_feature_generator_removal_advanced(generator_helper, data_help
     assert list(output_data['cat'].values) == [0, np.nan, 0, 1, 1, 1, np.nan, np.nan, np.nan]
 
     assert feature_metadata_in_unused_full == expected_feature_metadata_in_unused_full
+
+
+def test_pipeline_feature_generator_transform_plan(data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+
+    toy_vectorizer = CountVectorizer(min_df=2, ngram_range=(1, 3), max_features=10, dtype=np.uint8)
+
+    text_ngram_feature_generator = TextNgramFeatureGenerator(vectorizer=toy_vectorizer)
+    text_ngram_feature_generator.max_memory_ratio = None  # Necessary in test to avoid CI non-deterministically pruning ngram counts.
+
+    generator = PipelineFeatureGenerator(
+        generators=[
+            [
+                IdentityFeatureGenerator(infer_features_in_args=dict(valid_raw_types=[R_INT, R_FLOAT])),
+                IdentityFeatureGenerator(infer_features_in_args=dict(valid_raw_types=[R_INT]), name_suffix='_copy'),
+                CategoryFeatureGenerator(),
+                DatetimeFeatureGenerator(),
+                TextSpecialFeatureGenerator(),
+                text_ngram_feature_generator,
+            ],
+            [
+                IdentityFeatureGenerator(infer_features_in_args=dict(valid_raw_types=[R_FLOAT, R_CATEGORY])),
+                IdentityFeatureGenerator(infer_features_in_args=dict(valid_raw_types=[R_INT]), name_prefix='renamed_'),
+            ],
+        ],
+        verbosity=0,
+    )
+
+    # When
+    generator.fit_transform(input_data)
+    input_data_test = input_data.sample(frac=1, random_state=0)
+    input_data_test.index = input_data_test.index + 100
+    output_data = generator.transform(input_data_test)
+
+    # Then
+    # Identity and rename generators are forwarded by the transform plan instead of being called
+    passthrough_generators = [generator_inner for stage in generator._transform_plan for generator_inner, feature_links in stage if feature_links is not None]
+    assert len(passthrough_generators) == 5  # 4 IdentityFeatureGenerator and the DropUniqueFeatureGenerator post generator
+    assert 'renamed_int_copy' in output_data.columns
+
+    # The transform plan output is identical to transforming each stage sequentially
+    X = input_data_test.reset_index(drop=True)[generator.features_in]
+    expected_output_data = generator._transform_sequential(X)
+    expected_output_data.index = input_data_test.index
+    pd.testing.assert_frame_equal(output_data, expected_output_data)
@@ -1,4 +1,5 @@
 import copy
+import hashlib
 import json
 import logging
 import time
@@ -7,7 +8,7 @@ from collections.abc import Iterable
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
-from typing import List
+from typing import List, Tuple
 from sklearn.metrics import classification_report
 
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, QUANTILE, AUTO_WEIGHT, BALANCE_WEIGHT
@@ -75,6 +76,13 @@ class AbstractTabularLearner(AbstractLearner):
             raise ValueError("Must specify sample_weight column if you specify weight_evaluation=True")
         if groups is not None and not isinstance(groups, str):
             raise ValueError('groups must be a string indicating the name of the column that contains the split groups. If you have a vector of split groups, first add these as an extra column to your data.')
+        self._pred_cache = None  # Transformed labels and model predictions of the most recently scored data, refer to `_get_pred_cache`
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The cached predictions can be very large and are only valid for the loaded models
+        state['_pred_cache'] = None
+        return state
 
     @property
     def original_features(self) -> List[str]:
@@ -128,13 +136,23 @@ class AbstractTabularLearner(AbstractLearner):
              feature_prune=False, holdout_frac=0.1, hyperparameters=None, verbosity=2):
         raise NotImplementedError
 
-    def predict_proba(self, X: DataFrame, model=None, as_pandas=True, as_multiclass=True, inverse_transform=True, transform_features=True):
+    def predict_proba(self, X: DataFrame, model=None, as_pandas=True, as_multiclass=True, inverse_transform=True, transform_features=True, use_cache=False):
         if as_pandas:
             X_index = copy.deepcopy(X.index)
         else:
             X_index = None
         if X.empty:
             y_pred_proba = np.array([])
+        elif use_cache and transform_features and isinstance(model, (str, type(None))):
+            # Predictions are shared with `leaderboard` calls on the same data
+            trainer = self.load_trainer()
+            if model is None:
+                model = trainer._get_best()
+            if model in trainer.get_cascade_names():
+                y_pred_proba = trainer.predict_proba(self.transform_features(X), model=model)
+            else:
+                model_pred_proba_dict, _ = self._get_model_pred_proba_dict_cached(X=X, models=[model], pred_cache=self._get_pred_cache(X=X))
+                y_pred_proba = model_pred_proba_dict[model]
         else:
             if transform_features:
                 X = self.transform_features(X)
@@ -152,12 +170,13 @@ class AbstractTabularLearner(AbstractLearner):
                 y_pred_proba = pd.Series(data=y_pred_proba, name=self.label, index=X_index)
         return y_pred_proba
 
-    def predict(self, X: DataFrame, model=None, as_pandas=True, transform_features=True):
+    def predict(self, X: DataFrame, model=None, as_pandas=True, transform_features=True, use_cache=False):
         if as_pandas:
             X_index = copy.deepcopy(X.index)
         else:
             X_index = None
-        y_pred_proba = self.predict_proba(X=X, model=model, as_pandas=False, as_multiclass=False, inverse_transform=False, transform_features=transform_features)
+        y_pred_proba = self.predict_proba(X=X, model=model, as_pandas=False, as_multiclass=False, inverse_transform=False, transform_features=transform_features,
+                                          use_cache=use_cache)
         problem_type = self.label_cleaner.problem_type_transform or self.problem_type
         y_pred = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type=problem_type)
         if problem_type != QUANTILE:
@@ -409,6 +428,7 @@ class AbstractTabularLearner(AbstractLearner):
         leaderboard_df = self.leaderboard(extra_info=extra_info, silent=silent)
         if extra_metrics is None:
             extra_metrics = []
+        pred_cache = self._get_pred_cache(X=X, y=y)
         if y is None:
             error_if_missing = extra_metrics or not skip_score
             X, y = self.extract_label(X, error_if_missing=error_if_missing)
@@ -416,20 +436,19 @@ class AbstractTabularLearner(AbstractLearner):
         if self.weight_evaluation:
             X, w = extract_column(X, self.sample_weight)
 
-        X = self.transform_features(X)
         if y is not None:
-            self._validate_class_labels(y)
-            y_internal = self.label_cleaner.transform(y)
-            y_internal = y_internal.fillna(-1)
+            if 'y_internal' not in pred_cache:
+                self._validate_class_labels(y)
+                pred_cache['y_internal'] = self.label_cleaner.transform(y).fillna(-1)
+            y_internal = pred_cache['y_internal']
         else:
             y_internal = None
 
         trainer = self.load_trainer()
-        scores = {}
         all_trained_models = trainer.get_model_names()
         all_trained_models_can_infer = trainer.get_model_names(can_infer=True)
         all_trained_models_original = all_trained_models.copy()
-        model_pred_proba_dict, pred_time_test_marginal = trainer.get_model_pred_proba_dict(X=X, models=all_trained_models_can_infer, record_pred_time=True)
+        model_pred_proba_dict, pred_time_test_marginal = self._get_model_pred_proba_dict_cached(X=X, models=all_trained_models_can_infer, pred_cache=pred_cache)
 
         if compute_oracle:
             pred_probas = list(model_pred_proba_dict.values())
@@ -445,31 +464,28 @@ class AbstractTabularLearner(AbstractLearner):
             pred_time_test_marginal['OracleEnsemble'] = oracle_pred_time
             all_trained_models.append('OracleEnsemble')
 
+        pred_time_test_cascade = dict()
+        if trainer.get_cascade_names():
+            X = self.transform_features(X)
+        for cascade in trainer.get_cascade_names():
+            model_pred_proba_dict[cascade], pred_time_test_cascade[cascade] = trainer.get_cascade_pred_proba(X=X, name=cascade, record_pred_time=True)
+            pred_time_test_marginal[cascade] = None
+            all_trained_models.append(cascade)
+
         scoring_args = dict(
             y=y,
             y_internal=y_internal,
             sample_weight=w
         )
 
+        if skip_score:
+            scores = {model_name: np.nan for model_name in model_pred_proba_dict}
+        else:
+            scores = self._score_with_pred_proba_multi(model_pred_proba_dict=model_pred_proba_dict, metric=self.eval_metric, **scoring_args)
         extra_scores = {}
-        for model_name, y_pred_proba_internal in model_pred_proba_dict.items():
-            if skip_score:
-                scores[model_name] = np.nan
-            else:
-                scores[model_name] = self._score_with_pred_proba(
-                    y_pred_proba_internal=y_pred_proba_internal,
-                    metric=self.eval_metric,
-                    **scoring_args
-                )
-            for metric in extra_metrics:
-                metric = get_metric(metric, self.problem_type, 'leaderboard_metric')
-                if metric.name not in extra_scores:
-                    extra_scores[metric.name] = {}
-                extra_scores[metric.name][model_name] = self._score_with_pred_proba(
-                    y_pred_proba_internal=y_pred_proba_internal,
-                    metric=metric,
-                    **scoring_args
-                )
+        for metric in extra_metrics:
+            metric = get_metric(metric, self.problem_type, 'leaderboard_metric')
+            extra_scores[metric.name] = self._score_with_pred_proba_multi(model_pred_proba_dict=model_pred_proba_dict, metric=metric, **scoring_args)
 
         if extra_scores:
             series = []
@@ -495,6 +511,8 @@ class AbstractTabularLearner(AbstractLearner):
                     for base_model in base_model_set:
                         pred_time_test_full_num += pred_time_test_marginal[base_model]
                     pred_time_test[model] = pred_time_test_full_num
+            elif model in pred_time_test_cascade:
+                pred_time_test[model] = pred_time_test_cascade[model]
             else:
                 pred_time_test[model] = None
 
@@ -546,6 +564,88 @@ class AbstractTabularLearner(AbstractLearner):
 
         return df_merged
 
+    def _get_pred_cache(self, X: DataFrame, y=None) -> dict:
+        """
+        Returns the cache of the transformed labels and model predictions of the data X (and y if specified).
+        Only the cache of the most recent data is kept, such that consecutive calls to `leaderboard` and `evaluate` on the same data reuse the predictions.
+        """
+        try:
+            data_hash = hashlib.sha1(pd.util.hash_pandas_object(X, index=True).to_numpy())
+            data_hash.update(str(list(X.columns)).encode())
+            if y is not None:
+                data_hash.update(pd.util.hash_pandas_object(pd.Series(y), index=False).to_numpy())
+            data_hash = data_hash.hexdigest()
+        except TypeError:
+            # Data with unhashable values is not cached
+            data_hash = None
+        pred_cache = getattr(self, '_pred_cache', None)
+        if data_hash is None or pred_cache is None or pred_cache['data_hash'] != data_hash:
+            pred_cache = dict(data_hash=data_hash, model_pred_proba_dict=dict(), model_pred_time_dict=dict(), model_fit_time_dict=dict())
+            self._pred_cache = pred_cache if data_hash is not None else None
+        return pred_cache
+
+    def _get_model_pred_proba_dict_cached(self, X: DataFrame, models: List[str], pred_cache: dict) -> Tuple[dict, dict]:
+        """
+        Returns the prediction probabilities and marginal prediction times of `models` on X, which has not been transformed by the feature generators.
+        Only the models (and their dependencies) missing from `pred_cache` are predicted with, and their predictions are added to `pred_cache`.
+        """
+        trainer = self.load_trainer()
+        # Models refit under the same name since their predictions were cached are identified by their fit_time
+        model_fit_time_dict = trainer.get_models_attribute_dict('fit_time', models=trainer.get_model_names())
+        model_pred_proba_dict = dict()
+        model_pred_time_dict = dict()
+        for model, y_pred_proba in pred_cache['model_pred_proba_dict'].items():
+            if model in model_fit_time_dict and pred_cache['model_fit_time_dict'][model] == model_fit_time_dict[model]:
+                model_pred_proba_dict[model] = y_pred_proba
+                model_pred_time_dict[model] = pred_cache['model_pred_time_dict'][model]
+        if any(model not in model_pred_proba_dict for model in models):
+            X = self.transform_features(X)
+            model_pred_proba_dict, model_pred_time_dict = trainer.get_model_pred_proba_dict(X=X, models=models, model_pred_proba_dict=model_pred_proba_dict,
+                                                                                            model_pred_time_dict=model_pred_time_dict, record_pred_time=True)
+        pred_cache['model_pred_proba_dict'] = model_pred_proba_dict
+        pred_cache['model_pred_time_dict'] = model_pred_time_dict
+        pred_cache['model_fit_time_dict'] = {model: model_fit_time_dict[model] for model in model_pred_proba_dict}
+        return dict(model_pred_proba_dict), dict(model_pred_time_dict)
+
+    def _score_with_pred_proba_multi(self,
+                                     y,
+                                     y_internal,
+                                     model_pred_proba_dict: dict,
+                                     metric,
+                                     sample_weight=None,
+                                     weight_evaluation=None) -> dict:
+        """
+        Scores the prediction probabilities of each model in `model_pred_proba_dict`, returning a dict of model name to score.
+        The predictions of the models are stacked in batches and each batch is scored in a single call to the metric (refer to `Scorer.score_multi`).
+        """
+        metric = get_metric(metric, self.problem_type, 'leaderboard_metric')
+        if weight_evaluation is None:
+            weight_evaluation = self.weight_evaluation
+        if weight_evaluation or metric.needs_quantile:
+            return {model: self._score_with_pred_proba(y=y, y_internal=y_internal, y_pred_proba_internal=y_pred_proba_internal, metric=metric,
+                                                       sample_weight=sample_weight, weight_evaluation=weight_evaluation)
+                    for model, y_pred_proba_internal in model_pred_proba_dict.items()}
+        # Batches are limited to 256 MB of stacked predictions
+        max_batch_bytes = 2 ** 28
+        scores = dict()
+        batch_models = []
+        batch_y_pred = []
+        batch_bytes = 0
+        models = list(model_pred_proba_dict.keys())
+        for i, model in enumerate(models):
+            y_true, y_pred = self._get_y_true_and_pred_for_metric(y=y, y_internal=y_internal, y_pred_proba_internal=model_pred_proba_dict[model], metric=metric)
+            y_pred = np.asarray(y_pred)
+            batch_models.append(model)
+            batch_y_pred.append(y_pred)
+            batch_bytes += y_pred.nbytes
+            if batch_bytes >= max_batch_bytes or i == len(models) - 1:
+                batch_scores = metric.score_multi(y_true, np.stack(batch_y_pred))
+                scores.update({batch_model: float(score) for batch_model, score in zip(batch_models, batch_scores)})
+                batch_models = []
+                batch_y_pred = []
+                batch_bytes = 0
+        return scores
+
     def _score_with_pred_proba(self,
                                y,
                                y_internal,
@@ -556,6 +656,11 @@ class AbstractTabularLearner(AbstractLearner):
         metric = get_metric(metric, self.problem_type, 'leaderboard_metric')
         if weight_evaluation is None:
             weight_evaluation = self.weight_evaluation
+        y_tmp, y_pred = self._get_y_true_and_pred_for_metric(y=y, y_internal=y_internal, y_pred_proba_internal=y_pred_proba_internal, metric=metric)
+        return compute_weighted_metric(y_tmp, y_pred, metric, weights=sample_weight, weight_evaluation=weight_evaluation, quantile_levels=self.quantile_levels)
+
+    def _get_y_true_and_pred_for_metric(self, y, y_internal, y_pred_proba_internal, metric) -> tuple:
+        """Returns the labels and predictions in the format expected by `metric`, given the internal prediction probabilities of a model."""
         if metric.needs_pred:
             if self.problem_type == BINARY:
                 # Use 1 and 0, otherwise f1 can crash due to unknown pos_label.
@@ -570,7 +675,7 @@ class AbstractTabularLearner(AbstractLearner):
         else:
             y_pred = self.label_cleaner.inverse_transform_proba(y_pred_proba_internal, as_pred=False)
             y_tmp = y_internal
-        return compute_weighted_metric(y_tmp, y_pred, metric, weights=sample_weight, weight_evaluation=weight_evaluation, quantile_levels=self.quantile_levels)
+        return y_tmp, y_pred
 
     def _score_with_pred(self,
                          y,
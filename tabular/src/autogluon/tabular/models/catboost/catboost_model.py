@@ -61,11 +61,11 @@ class CatBoostModel(AbstractModel):
 
     def _estimate_memory_usage(self, X, **kwargs):
         num_classes = self.num_classes if self.num_classes else 1  # self.num_classes could be None after initialization if it's a regression problem
-        data_mem_usage = get_approximate_df_mem_usage(X).sum()
+        data_mem_usage = get_approximate_df_mem_usage(X, memory_profile=kwargs.get('data_memory_profile', None)).sum()
         approx_mem_size_req = data_mem_usage * 7 + data_mem_usage / 4 * num_classes  # TODO: Extremely crude approximation, can be vastly improved
         return approx_mem_size_req
 
-    # TODO: Use Pool in preprocess, optimize bagging to do Pool.split() to avoid re-computing pool for each fold! Requires stateful + y
+    # TODO: Use Pool in preprocess
     #  Pool is much more memory efficient, avoids copying data twice in memory
     def _fit(self,
              X,
@@ -98,16 +98,21 @@ class CatBoostModel(AbstractModel):
         num_cols_train = len(X.columns)
         num_classes = self.num_classes if self.num_classes else 1  # self.num_classes could be None after initialization if it's a regression problem
 
-        X = self.preprocess(X)
-        cat_features = list(X.select_dtypes(include='category').columns)
-        X = Pool(data=X, label=y, cat_features=cat_features, weight=sample_weight)
+        fold_dataset_cache = kwargs.get('fold_dataset_cache', None)
+        if fold_dataset_cache is not None and self.problem_type != SOFTCLASS:
+            X, X_val = self._generate_fold_pools(X=X, X_val=X_val, fold_dataset_cache=fold_dataset_cache, fold=kwargs['fold'])
+        else:
+            X = self.preprocess(X)
+            cat_features = list(X.select_dtypes(include='category').columns)
+            X = Pool(data=X, label=y, cat_features=cat_features, weight=sample_weight)
+            if X_val is not None:
+                X_val = self.preprocess(X_val)
+                X_val = Pool(data=X_val, label=y_val, cat_features=cat_features, weight=sample_weight_val)
 
         if X_val is None:
             eval_set = None
             early_stopping_rounds = None
         else:
-            X_val = self.preprocess(X_val)
-            X_val = Pool(data=X_val, label=y_val, cat_features=cat_features, weight=sample_weight_val)
             eval_set = X_val
             early_stopping_rounds = ag_params.get('early_stop', 'adaptive')
             if isinstance(early_stopping_rounds, (str, tuple, list)):
@@ -215,6 +220,27 @@ class CatBoostModel(AbstractModel):
 
         self.params_trained['iterations'] = self.model.tree_count_
 
+    def _generate_fold_pools(self, X, fold_dataset_cache, fold, X_val=None):
+        """
+        Selects the rows of the fold via `Pool.slice` from a Pool constructed once on the full bagged training data,
+        instead of preprocessing and constructing a new Pool for each fold.
+        """
+        from catboost import Pool
+        # Sets the preprocessing state of the model without copying the fold's rows, as they are taken from the full Pool
+        self.preprocess(X.iloc[:0])
+        key = (tuple(self.features), tuple(self._features_internal))
+
+        def construct_fn(X_full, y_full, sample_weight_full):
+            X_full = self.preprocess(X_full)
+            cat_features = list(X_full.select_dtypes(include='category').columns)
+            return Pool(data=X_full, label=y_full, cat_features=cat_features, weight=sample_weight_full)
+
+        pool_full = fold_dataset_cache.get(key=key, construct_fn=construct_fn)
+        train_index, val_index = fold
+        pool_train = pool_full.slice(train_index)
+        pool_val = pool_full.slice(val_index) if X_val is not None else None
+        return pool_train, pool_val
+
     # FIXME: This logic is a hack made to maintain compatibility with GPU CatBoost.
     #  GPU CatBoost does not support callbacks or custom metrics.
     #  Since we use callbacks to check memory and training time in CPU mode, we need a way to estimate these things prior to training for GPU mode.
@@ -311,4 +337,4 @@ class CatBoostModel(AbstractModel):
 
     def _more_tags(self):
         # `can_refit_full=True` because iterations is communicated at end of `_fit`
-        return {'can_refit_full': True}
+        return {'can_refit_full': True, 'can_use_fold_dataset_cache': True}
@@ -0,0 +1,23 @@
+class NNFastAiTabularNativeCompiler:
+    """
+    Native (no-op) compiler for fastai models.
+    The fastai learner is exported separately in `NNFastAiTabularModel.save`, so nothing is written here.
+    """
+    name = 'native'
+    save_in_pkl = True
+
+    @staticmethod
+    def can_compile():
+        return True
+
+    @staticmethod
+    def compile(model, path: str, input_types=None):
+        return model
+
+    @staticmethod
+    def save(model, path: str):
+        pass
+
+    @staticmethod
+    def load(path: str):
+        return None
@@ -0,0 +1,4 @@
+from ...tabular_nn.compilers.quantized import TabularNeuralNetTorchQuantizedCompiler
+
+# The fastai tabular network is a regular torch module, so the torch quantization compiler applies as-is.
+NNFastAiTabularQuantizedCompiler = TabularNeuralNetTorchQuantizedCompiler
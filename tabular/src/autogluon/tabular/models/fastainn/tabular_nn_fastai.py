@@ -19,6 +19,8 @@ from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.core.utils.files import make_temp_directory
 from autogluon.core.utils.loaders import load_pkl
 from autogluon.core.utils.savers import save_pkl
+from .compilers.native import NNFastAiTabularNativeCompiler
+from .compilers.quantized import NNFastAiTabularQuantizedCompiler
 from .hyperparameters.parameters import get_param_baseline
 from .hyperparameters.searchspaces import get_default_searchspace
 
@@ -83,6 +85,7 @@ class NNFastAiTabularModel(AbstractModel):
         self._cont_normalization = None
         self._load_model = None  # Whether to load inner model when loading.
         self._num_cpus_infer = None
+        self._inference_bf16 = False  # Whether to run inference under bfloat16 autocast, set by the quantize compiler
 
     def _preprocess_train(self, X, y, X_val, y_val):
         from fastai.tabular.core import TabularPandas
@@ -403,6 +406,7 @@ class NNFastAiTabularModel(AbstractModel):
         return objective_func_name_to_monitor
 
     def _predict_proba(self, X, **kwargs):
+        from ..tabular_nn.compilers.quantized import get_inference_context
         X = self.preprocess(X, **kwargs)
 
         single_row = len(X) == 1
@@ -415,7 +419,9 @@ class NNFastAiTabularModel(AbstractModel):
         test_dl = self.model.dls.test_dl(X, inplace=True)
         with self.model.no_bar():
             with self.model.no_logging():
-                preds, _ = self.model.get_preds(dl=test_dl)
+                with get_inference_context(bf16=self._inference_bf16):
+                    preds, _ = self.model.get_preds(dl=test_dl)
+        preds = preds.float()
         if single_row:
             preds = preds[:1, :]
         if self.problem_type == REGRESSION:
@@ -525,7 +531,7 @@ class NNFastAiTabularModel(AbstractModel):
         return metrics_map
 
     def _estimate_memory_usage(self, X, **kwargs):
-        return 10 * get_approximate_df_mem_usage(X).sum()
+        return 10 * get_approximate_df_mem_usage(X, memory_profile=kwargs.get('data_memory_profile', None)).sum()
     
     def _get_hpo_backend(self):
         """Choose which backend(Ray or Custom) to use for hpo"""
@@ -547,3 +553,34 @@ class NNFastAiTabularModel(AbstractModel):
 
     def _more_tags(self):
         return {'can_refit_full': True}
+
+    def _valid_compilers(self):
+        return [NNFastAiTabularNativeCompiler, NNFastAiTabularQuantizedCompiler]
+
+    def _default_compiler(self):
+        return NNFastAiTabularNativeCompiler
+
+    def _compile(self, compiler_configs=None, X_val=None, y_val=None, **kwargs):
+        """
+        Take the compiler to perform actual compilation.
+
+        This overrides the _compile() in AbstractModel, since the network lives inside
+        the fastai learner (self.model.model) rather than in self.model.
+        """
+        from ..tabular_nn.compilers.quantized import compile_network_with_validation
+        if self._compiler.name != NNFastAiTabularQuantizedCompiler.name:
+            return
+
+        def set_network(network):
+            self.model.model = network
+
+        is_compiled = compile_network_with_validation(
+            model=self,
+            network=self.model.model,
+            set_network=set_network,
+            compiler_configs=compiler_configs,
+            X_val=X_val,
+            y_val=y_val,
+        )
+        if not is_compiled:
+            self._compiler = self._default_compiler()
@@ -158,7 +158,8 @@ def early_stopping_custom(stopping_rounds, first_metric_only=False, metrics_to_u
             return
         if train_loss_name is not None:
             train_loss_evals = [eval for eval in env.evaluation_result_list if eval[0] == 'train_set' and eval[1] == train_loss_name]
-            train_loss_val = train_loss_evals[0][2]
+            # The train set is only evaluated if it is part of the validation sets
+            train_loss_val = train_loss_evals[0][2] if train_loss_evals else 0.0
         else:
             train_loss_val = 0.0
         for i in indices_to_check:
@@ -185,6 +186,11 @@ def early_stopping_custom(stopping_rounds, first_metric_only=False, metrics_to_u
                              eval_metric=eval_metric,  # eval_metric here is the stopping_metric from LGBModel
                              greater_is_better=greater_is_better,
                              )
+                    if getattr(reporter, 'should_stop', False):
+                        # The HPO scheduler decided to stop this trial early
+                        logger.log(15, 'Early stopping by HPO scheduler, best iteration is:\n[%d]\t%s' % (
+                            best_iter[i] + 1, '\t'.join([_format_eval_result(x) for x in best_score_list[i]])))
+                        raise EarlyStopException(best_iter[i], best_score_list[i])
             early_stop = es[i].update(cur_round=env.iteration, is_best=is_best_iter)
             if early_stop:
                 if verbose:
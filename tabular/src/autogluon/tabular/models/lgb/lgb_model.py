@@ -63,7 +63,7 @@ class LGBModel(AbstractModel):
 
     def _estimate_memory_usage(self, X, **kwargs):
         num_classes = self.num_classes if self.num_classes else 1  # self.num_classes could be None after initialization if it's a regression problem
-        data_mem_usage = get_approximate_df_mem_usage(X).sum()
+        data_mem_usage = get_approximate_df_mem_usage(X, memory_profile=kwargs.get('data_memory_profile', None)).sum()
         approx_mem_size_req = data_mem_usage * 7 + data_mem_usage / 4 * num_classes  # TODO: Extremely crude approximation, can be vastly improved
         return approx_mem_size_req
 
@@ -114,11 +114,16 @@ class LGBModel(AbstractModel):
             params['num_classes'] = self.num_classes
         if 'verbose' not in params:
             params['verbose'] = -1
+        seed_val = params.pop('seed_value', 0)
+        if seed_val is not None:
+            # Set prior to constructing the datasets as the seed also affects the sampling used for feature binning
+            params['seed'] = seed_val
 
         num_rows_train = len(X)
         dataset_train, dataset_val = self.generate_datasets(
             X=X, y=y, params=params, X_val=X_val, y_val=y_val,
-            sample_weight=sample_weight, sample_weight_val=sample_weight_val
+            sample_weight=sample_weight, sample_weight_val=sample_weight_val,
+            fold_dataset_cache=kwargs.get('fold_dataset_cache', None), fold=kwargs.get('fold', None),
         )
         gc.collect()
 
@@ -165,7 +170,6 @@ class LGBModel(AbstractModel):
         if log_period is not None:
             callbacks.append(log_evaluation(period=log_period))
 
-        seed_val = params.pop('seed_value', 0)
         train_params = {
             'params': params,
             'train_set': dataset_train,
@@ -186,7 +190,6 @@ class LGBModel(AbstractModel):
         elif self.problem_type == QUANTILE:
             train_params['params']['quantile_levels'] = self.quantile_levels
         if seed_val is not None:
-            train_params['params']['seed'] = seed_val
             random.seed(seed_val)
             np.random.seed(seed_val)
 
@@ -284,7 +287,10 @@ class LGBModel(AbstractModel):
         else:
             return X
 
-    def generate_datasets(self, X: DataFrame, y: Series, params, X_val=None, y_val=None, sample_weight=None, sample_weight_val=None, save=False):
+    def generate_datasets(self, X: DataFrame, y: Series, params, X_val=None, y_val=None, sample_weight=None, sample_weight_val=None, save=False,
+                          fold_dataset_cache=None, fold=None):
+        if fold_dataset_cache is not None and fold is not None and self.problem_type != SOFTCLASS and not save:
+            return self._generate_fold_datasets(X=X, params=params, X_val=X_val, fold_dataset_cache=fold_dataset_cache, fold=fold)
         lgb_dataset_params_keys = ['two_round']  # Keys that are specific to lightGBM Dataset object construction.
         data_params = {key: params[key] for key in lgb_dataset_params_keys if key in params}.copy()
 
@@ -318,6 +324,27 @@ class LGBModel(AbstractModel):
                 dataset_val.softlabels = y_val_og
         return dataset_train, dataset_val
 
+    def _generate_fold_datasets(self, X: DataFrame, params, fold_dataset_cache, fold, X_val=None):
+        """
+        Selects the rows of the fold via `Dataset.subset` from a Dataset constructed once on the full bagged training data,
+        instead of constructing (and binning) a new Dataset for each fold.
+        Note that feature bins are therefore computed on the full bagged training data instead of only the fold's training rows.
+        """
+        # Sets the preprocessing state of the model without copying the fold's rows, as they are taken from the full Dataset
+        self.preprocess(X.iloc[:0], is_train=True)
+        # Dataset parameters are identical across the folds of a bagged model, only the features may differ
+        key = (tuple(self.features), tuple(self._features_internal))
+
+        def construct_fn(X_full, y_full, sample_weight_full):
+            X_full = self.preprocess(X_full)
+            return construct_dataset(x=X_full, y=y_full, params=params.copy(), weight=sample_weight_full).construct()
+
+        dataset_full = fold_dataset_cache.get(key=key, construct_fn=construct_fn)
+        train_index, val_index = fold
+        dataset_train = dataset_full.subset(train_index)
+        dataset_val = dataset_full.subset(val_index) if X_val is not None else None
+        return dataset_train, dataset_val
+
     def _get_train_loss_name(self):
         if self.problem_type == BINARY:
             train_loss_name = 'binary_logloss'
@@ -377,4 +404,4 @@ class LGBModel(AbstractModel):
 
     def _more_tags(self):
         # `can_refit_full=True` because num_boost_round is communicated at end of `_fit`
-        return {'can_refit_full': True}
+        return {'can_refit_full': True, 'can_use_fold_dataset_cache': True}
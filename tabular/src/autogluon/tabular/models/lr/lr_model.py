@@ -11,7 +11,7 @@ from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import StandardScaler, QuantileTransformer
 
-from autogluon.common.features.types import R_BOOL, R_INT, R_FLOAT, R_CATEGORY, R_OBJECT, S_TEXT_AS_CATEGORY, S_BOOL
+from autogluon.common.features.types import R_BOOL, R_INT, R_FLOAT, R_CATEGORY, R_OBJECT, S_TEXT_AS_CATEGORY, S_BOOL, S_SPARSE
 from autogluon.core.constants import BINARY, REGRESSION
 
 from .hyperparameters.parameters import get_param_baseline, INCLUDE, IGNORE, ONLY, _get_solver, preprocess_params_set
@@ -66,18 +66,25 @@ class LinearModel(AbstractModel):
         return re.split('[ ]+', s)
 
     def _get_types_of_features(self, df):
-        """ Returns dict with keys: : 'continuous', 'skewed', 'onehot', 'embed', 'language', values = ordered list of feature-names falling into each category.
+        """ Returns dict with keys: : 'continuous', 'skewed', 'onehot', 'embed', 'language', 'sparse',
+            values = ordered list of feature-names falling into each category.
             Each value is a list of feature-names corresponding to columns in original dataframe.
         """
-        continuous_featnames = self._feature_metadata.get_features(valid_raw_types=[R_INT, R_FLOAT], invalid_special_types=[S_BOOL])
-        categorical_featnames = self._feature_metadata.get_features(valid_raw_types=[R_CATEGORY, R_OBJECT])
-        bool_featnames = self._feature_metadata.get_features(required_special_types=[S_BOOL])
+        continuous_featnames = self._feature_metadata.get_features(valid_raw_types=[R_INT, R_FLOAT], invalid_special_types=[S_BOOL, S_SPARSE])
+        categorical_featnames = self._feature_metadata.get_features(valid_raw_types=[R_CATEGORY, R_OBJECT], invalid_special_types=[S_SPARSE])
+        bool_featnames = self._feature_metadata.get_features(required_special_types=[S_BOOL], invalid_special_types=[S_SPARSE])
         language_featnames = []  # TODO: Disabled currently, have to pass raw text data features here to function properly
-        return self._select_features(df=df,
-                                     categorical_featnames=categorical_featnames,
-                                     language_featnames=language_featnames,
-                                     continuous_featnames=continuous_featnames,
-                                     bool_featnames=bool_featnames)
+        types_of_features = self._select_features(df=df,
+                                                  categorical_featnames=categorical_featnames,
+                                                  language_featnames=language_featnames,
+                                                  continuous_featnames=continuous_featnames,
+                                                  bool_featnames=bool_featnames)
+        if self.params.get('handle_text', IGNORE) != ONLY:
+            # Sparse features (such as sparse ngrams) are kept sparse, they are scaled without centering
+            sparse_featnames = self._feature_metadata.get_features(valid_raw_types=[R_INT, R_FLOAT], required_special_types=[S_SPARSE])
+            if sparse_featnames:
+                types_of_features['sparse'] = sparse_featnames
+        return types_of_features
 
     def _select_features(self, df, **kwargs):
         features_selector = {
@@ -126,6 +133,11 @@ class LinearModel(AbstractModel):
                 ('quantile', QuantileTransformer(output_distribution='normal')),  # Or output_distribution = 'uniform'
             ])
             transformer_list.append(('skew', pipeline, feature_types['skewed']))
+        if feature_types.get('sparse', None):
+            pipeline = Pipeline(steps=[
+                ('scaler', StandardScaler(with_mean=False))
+            ])
+            transformer_list.append(('sparse', pipeline, feature_types['sparse']))
         self._pipeline = ColumnTransformer(transformers=transformer_list)
         return self._pipeline.fit_transform(X)
 
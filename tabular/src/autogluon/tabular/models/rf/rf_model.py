@@ -1,8 +1,6 @@
 import logging
 import math
-import pickle
 import os
-import sys
 import time
 
 import numpy as np
@@ -11,6 +9,7 @@ from autogluon.common.features.types import R_BOOL, R_INT, R_FLOAT, R_CATEGORY
 from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.core.constants import MULTICLASS, REGRESSION, SOFTCLASS, QUANTILE
 from autogluon.core.utils.exceptions import NotEnoughMemoryError, TimeLimitExceeded
+from autogluon.core.utils.memory_utils import get_memory_size
 from autogluon.core.utils.utils import normalize_pred_probas
 
 from autogluon.core.models import AbstractModel
@@ -198,9 +197,7 @@ class RFModel(AbstractModel):
             model = model.fit(X, y, sample_weight=sample_weight)
             if (i == 0) and (len(n_estimator_increments) > 1):
                 time_elapsed = max(time.time() - time_train_start, 0.001)  # avoid it being too small and being truncated to 0
-                model_size_bytes = 0
-                for estimator in model.estimators_:  # Uses far less memory than pickling the entire forest at once
-                    model_size_bytes += sys.getsizeof(pickle.dumps(estimator))
+                model_size_bytes = get_memory_size(model.estimators_)
                 expected_final_model_size_bytes = model_size_bytes * (n_estimators_final / model.n_estimators)
                 available_mem = ResourceManager.get_available_virtual_mem()
                 model_memory_ratio = expected_final_model_size_bytes / available_mem
@@ -0,0 +1,137 @@
+import contextlib
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def is_bf16_supported() -> bool:
+    """Whether the CPU can run bfloat16 autocast natively (AVX512-BF16 or AMX)."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    if not hasattr(torch, 'autocast'):
+        return False
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            cpuinfo = f.read()
+    except OSError:
+        return False
+    return ('avx512_bf16' in cpuinfo) or ('amx_bf16' in cpuinfo)
+
+
+def get_inference_context(bf16: bool = False):
+    """Returns the context manager to run inference under, enabling bfloat16 autocast on CPU if requested."""
+    if bf16:
+        import torch
+        return torch.autocast(device_type='cpu', dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+
+def quantize_network(network, inplace: bool = False):
+    """
+    Applies post-training dynamic int8 quantization to all `torch.nn.Linear` layers of the network.
+    Weights are quantized ahead of time, activations are quantized on the fly during inference.
+    """
+    import torch
+    if not inplace:
+        network = copy.deepcopy(network)
+    network = network.cpu()
+    if hasattr(network, 'device'):
+        network.device = torch.device('cpu')
+    network.eval()
+    return torch.quantization.quantize_dynamic(network, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def compile_network_with_validation(model, network, set_network, compiler_configs: dict = None, X_val=None, y_val=None) -> bool:
+    """
+    Quantizes `network` according to `compiler_configs` and sets the result on `model` via `set_network`.
+    If validation data is provided, the score of `model` is computed before and after quantization
+    and the native network is restored if the score drops by more than `max_score_drop`.
+
+    Returns
+    -------
+    True if the compiled network is kept, False if the model fell back to the native network.
+    """
+    if compiler_configs is None:
+        compiler_configs = {}
+    int8 = compiler_configs.get('int8', True)
+    bf16 = compiler_configs.get('bf16', False)
+    max_score_drop = compiler_configs.get('max_score_drop', 0.01)
+    if bf16 and not is_bf16_supported():
+        logger.log(30, f'\tWarning: bf16 was requested for {model.name} but the CPU lacks native bfloat16 support, running inference in fp32...')
+        bf16 = False
+    if not int8 and not bf16:
+        return False
+
+    validate = X_val is not None and y_val is not None and max_score_drop is not None
+    if validate:
+        score_native = model.score(X_val, y_val)
+    if int8:
+        set_network(quantize_network(network))
+    model._inference_bf16 = bf16
+    if validate:
+        score_compiled = model.score(X_val, y_val)
+        score_delta = score_compiled - score_native
+        logger.log(20, f'\tValidation {model.eval_metric.name}: {round(score_compiled, 4)} compiled vs {round(score_native, 4)} native '
+                       f'(delta = {round(score_delta, 4)})')
+        if -score_delta > max_score_drop:
+            logger.log(20, f'\tScore dropped by more than max_score_drop={max_score_drop}, falling back to the native network...')
+            set_network(network)
+            model._inference_bf16 = False
+            return False
+    return True
+
+
+class TabularNeuralNetTorchQuantizedCompiler:
+    """
+    Compiler that quantizes the Linear layers of the torch network to int8 for faster CPU inference.
+
+    Unlike the onnx compiler, the data processor is left untouched and the network itself is replaced.
+    The quantized network is pickled alongside the model, so no extra artifacts are written to disk.
+
+    Supported compiler_configs keys:
+        int8 : bool, default = True
+            Whether to apply dynamic int8 quantization to the Linear layers.
+        bf16 : bool, default = False
+            Whether to run inference under bfloat16 autocast. Ignored if the CPU lacks native bfloat16 support.
+        max_score_drop : float, default = 0.01
+            Maximum allowed drop in validation score (in `eval_metric` units, higher is better) after compilation.
+            If exceeded, the model falls back to the native (fp32) network.
+    """
+    name = 'quantize'
+    save_in_pkl = True
+
+    @staticmethod
+    def can_compile():
+        try:
+            import torch
+        except ImportError:
+            return False
+        supported_engines = torch.backends.quantized.supported_engines
+        return any(engine in supported_engines for engine in ['x86', 'fbgemm', 'qnnpack'])
+
+    @staticmethod
+    def compile(model, path: str, input_types=None):
+        """
+        Compile the trained model for faster inference.
+
+        Parameters
+        ----------
+        model
+            The torch network that is expected to be compiled.
+        path : str
+            Unused, the quantized network is saved as part of the model pickle.
+        input_types : list, default=None
+            Unused, dynamic quantization does not depend on the input shape.
+        """
+        return quantize_network(model)
+
+    @staticmethod
+    def save(model, path: str):
+        pass
+
+    @staticmethod
+    def load(path: str):
+        return None
@@ -19,6 +19,7 @@ from autogluon.core.models.abstract.abstract_nn_model import AbstractNeuralNetwo
 
 from ..compilers.native import TabularNeuralNetTorchNativeCompiler
 from ..compilers.onnx import TabularNeuralNetTorchOnnxCompiler
+from ..compilers.quantized import TabularNeuralNetTorchQuantizedCompiler, get_inference_context, compile_network_with_validation
 from ..hyperparameters.parameters import get_default_param
 from ..hyperparameters.searchspaces import get_default_searchspace
 from ..utils.data_preprocessor import create_preprocessor, get_feature_arraycol_map, get_feature_type_map
@@ -49,6 +50,7 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
         self.device = None
         self.max_batch_size = None
         self._num_cpus_infer = None
+        self._inference_bf16 = False  # Whether to run inference under bfloat16 autocast, set by the quantize compiler
 
     def _set_default_params(self):
         """ Specifies hyperparameter values to use by default """
@@ -364,6 +366,9 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
                              train_loss=total_train_loss / total_train_size,
                              eval_metric=self.eval_metric.name,
                              greater_is_better=self.eval_metric.greater_is_better)
+                    if getattr(reporter, 'should_stop', False):
+                        logger.log(15, f"\tStopping training early as requested by the HPO scheduler. (Stopping on epoch {epoch})")
+                        break
 
                 # no improvement
                 if epoch - val_improve_epoch >= epochs_wo_improve:
@@ -420,9 +425,10 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
             raise ValueError("new_data must of of type TabularTorchDataset if process=False")
         val_dataloader = new_data.build_loader(self.max_batch_size, self.num_dataloading_workers, is_test=True)
         preds_dataset = []
-        for data_batch in val_dataloader:
-            preds_batch = self.model.predict(data_batch)
-            preds_dataset.append(preds_batch)
+        with get_inference_context(bf16=self._inference_bf16):
+            for data_batch in val_dataloader:
+                preds_batch = self.model.predict(data_batch)
+                preds_dataset.append(preds_batch)
         preds_dataset = np.concatenate(preds_dataset, 0)
         return preds_dataset
 
@@ -565,7 +571,7 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
     @classmethod
     def load(cls, path: str, reset_paths=True, verbose=True):
         model: TabularNeuralNetTorchModel = super().load(path=path, reset_paths=reset_paths, verbose=verbose)
-        if hasattr(model, '_compiler') and model._compiler and model._compiler.name != 'native':
+        if hasattr(model, '_compiler') and model._compiler and model._compiler.name == TabularNeuralNetTorchOnnxCompiler.name:
             model.model.eval()
             model.processor = model._compiler.load(path=model.path)
         return model
@@ -591,7 +597,8 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
 
     def _valid_compilers(self):
         return [TabularNeuralNetTorchNativeCompiler,
-                TabularNeuralNetTorchOnnxCompiler]
+                TabularNeuralNetTorchOnnxCompiler,
+                TabularNeuralNetTorchQuantizedCompiler]
 
     def _default_compiler(self):
         return TabularNeuralNetTorchNativeCompiler
@@ -602,7 +609,7 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
             input_types.append((f, [batch_size, 1]))
         return input_types
 
-    def compile(self, compiler_configs=None):
+    def compile(self, compiler_configs=None, X_val=None, y_val=None):
         """
         Compile the trained model for faster inference.
 
@@ -610,6 +617,8 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
         overwrite self.model in the compilation process.
         Instead, self.processor would be converted from sklearn ColumnTransformer
         to its alternative counterpart.
+        The exception is the "quantize" compiler, which replaces the network in self.model
+        with its int8 quantized counterpart and leaves self.processor untouched.
         """
         assert self.is_fit(), "The model must be fit before calling the compile method."
         if compiler_configs is None:
@@ -617,7 +626,7 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
         # Take self.max_batch_size as default batch size, instead of None in AbstractModel
         batch_size = compiler_configs.get("batch_size", self.max_batch_size)
         compiler_configs.update(batch_size=batch_size)
-        super().compile(compiler_configs)
+        super().compile(compiler_configs, X_val=X_val, y_val=y_val)
 
     def _compile(self, **kwargs):
         """
@@ -630,9 +639,28 @@ class TabularNeuralNetTorchModel(AbstractNeuralNetworkModel):
         """
         from sklearn.compose._column_transformer import ColumnTransformer
 
+        if self._compiler.name == TabularNeuralNetTorchQuantizedCompiler.name:
+            self._compile_quantized(**kwargs)
+            return
         input_types = kwargs.get('input_types', self._get_input_types(batch_size=self.max_batch_size))
         assert isinstance(self.processor, ColumnTransformer), f"unexpected processor type {type(self.processor)}, " \
             "expecting processor type to be sklearn.compose._column_transformer.ColumnTransformer"
         self.processor = self._compiler.compile(model=(self.processor, self.model),
                                                 path=self.path,
                                                 input_types=input_types)
+
+    def _compile_quantized(self, compiler_configs=None, X_val=None, y_val=None, **kwargs):
+        """Quantize the network in self.model, falling back to the native network if the validation score regresses."""
+        def set_network(network):
+            self.model = network
+
+        is_compiled = compile_network_with_validation(
+            model=self,
+            network=self.model,
+            set_network=set_network,
+            compiler_configs=compiler_configs,
+            X_val=X_val,
+            y_val=y_val,
+        )
+        if not is_compiled:
+            self._compiler = self._default_compiler()
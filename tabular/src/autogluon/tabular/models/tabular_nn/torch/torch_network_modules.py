@@ -255,4 +255,4 @@ class EmbedNet(nn.Module):
                 predict_data = predict_data.flatten()
             if self.problem_type == BINARY:
                 predict_data = predict_data[:,1]
-            return predict_data.data.cpu().numpy()
+            return predict_data.data.cpu().float().numpy()
@@ -6,6 +6,7 @@ Unknown categories are returned as None in inverse transforms. Always converts i
 from numbers import Integral
 
 import numpy as np
+import pandas as pd
 from scipy import sparse
 
 from sklearn.base import BaseEstimator, TransformerMixin
@@ -146,10 +147,19 @@ def _encode_check_unknown(values, uniques, return_mask=False):
             return diff
 
 
+def _is_categorical_frame(X):
+    return isinstance(X, pd.DataFrame) and all(isinstance(dtype, pd.CategoricalDtype) for dtype in X.dtypes)
+
+
 class _BaseEncoder(BaseEstimator, TransformerMixin):
     """
     Base class for encoders that includes the code to categorize and
     transform the input features.
+
+    If fit on a DataFrame of pandas categorical columns, the encoder additionally
+    precomputes per-feature lookup tables from categorical codes to encoded values.
+    At transform time, DataFrames with the same categories are then encoded by
+    indexing these tables with the codes, skipping the conversion to Python objects.
     """
     
     def _check_X(self, X):
@@ -313,6 +323,42 @@ class _BaseEncoder(BaseEstimator, TransformerMixin):
         
         return X_int, X_mask
     
+    def _fit_codes_lookup(self, X):
+        """
+        Precompute the lookup tables used by the categorical codes fast path.
+        The tables are obtained by encoding every category of X (plus NaN, which has code -1)
+        through the regular transform, so the fast path matches it by construction.
+        The probe keeps the dtypes of X, as the conversion of X to a numpy array depends on them.
+        The NaN entry is stored last, so that code -1 indexes it directly.
+        """
+        self.codes_categories_ = None
+        self.codes_lookup_ = None
+        if not _is_categorical_frame(X):
+            return
+        codes_categories = [X[column].cat.categories for column in X.columns]
+        num_probe_rows = max(len(categories) for categories in codes_categories) + 1
+        X_probe = dict()
+        for column, categories in zip(X.columns, codes_categories):
+            # Padded rows are NaN and are discarded
+            probe_codes = np.full(num_probe_rows, -1)
+            probe_codes[:len(categories)] = np.arange(len(categories))
+            X_probe[column] = pd.Categorical.from_codes(probe_codes, dtype=X[column].dtype)
+        X_probe_out = self._transform_values(pd.DataFrame(X_probe, columns=X.columns))
+        self.codes_lookup_ = self._get_codes_lookup(X_probe_out=X_probe_out, codes_categories=codes_categories)
+        self.codes_categories_ = codes_categories
+
+    def _can_transform_codes(self, X):
+        codes_categories = getattr(self, 'codes_categories_', None)
+        if codes_categories is None or not _is_categorical_frame(X) or X.shape[1] != len(codes_categories):
+            return False
+        return all(X[column].cat.categories.equals(categories) for column, categories in zip(X.columns, codes_categories))
+
+    def _get_codes_lookup(self, X_probe_out, codes_categories):
+        raise NotImplementedError
+
+    def _transform_values(self, X):
+        raise NotImplementedError
+
     def _more_tags(self):
         return {'X_types': ['categorical']}
 
@@ -464,6 +510,7 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         -------
         self
         """
+        X_in = X
         X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         self._validate_keywords()
         self._fit(X, handle_unknown=self.handle_unknown)
@@ -482,6 +529,7 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
                             feature_idx
                         )
                     )
+        self._fit_codes_lookup(X_in)
         return self
     
     def fit_transform(self, X, y=None):
@@ -499,9 +547,7 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         X_out : sparse matrix if sparse=True else a 2-d array
             Transformed input.
         """
-        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
-        self._validate_keywords()
-        return super().fit_transform(X, y)
+        return self.fit(X, y).transform(X)
     
     def transform(self, X):
         """Transform X using one-hot encoding.
@@ -516,16 +562,17 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
         X_out : sparse matrix if sparse=True else a 2-d array
             Transformed input.
         """
-        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         check_is_fitted(self, 'categories_')
-        # validation of X happens in _check_X called by _transform
-        X_int, X_mask = self._transform(X, handle_unknown=self.handle_unknown)
-        n_samples, n_features = X_int.shape
-        
+        if self._can_transform_codes(X):
+            return self._transform_codes(X)
+        return self._transform_values(X)
+
+    def _get_n_columns(self):
         # n_columns indicates, for each feature, how many columns are used in
         # X_trans. By default this corresponds to the number of categories, but
         # will differ if we drop some of them, or if there are infrequent
         # categories (all mapped to the same column)
+        n_features = len(self.categories_)
         n_columns = [len(cats) for cats in self.categories_]
         for feature_idx in range(n_features):
             n_infrequent = self.infrequent_indices_[feature_idx].size
@@ -540,7 +587,42 @@ class OneHotMergeRaresHandleUnknownEncoder(_BaseEncoder):
                 if (isinstance(self.drop, str) and self.drop == 'infrequent'
                         and n_infrequent == 0):
                     n_columns[feature_idx] += 1  # revert decrement from above
-        
+        return n_columns
+
+    def _get_codes_lookup(self, X_probe_out, codes_categories):
+        # For each feature, maps categorical codes to the index of the output column set to 1 (-1 if all zeros)
+        if sparse.issparse(X_probe_out):
+            X_probe_out = X_probe_out.toarray()
+        feature_indices = np.cumsum([0] + self._get_n_columns())
+        codes_lookup = []
+        for i, categories in enumerate(codes_categories):
+            X_block = X_probe_out[:len(categories) + 1, feature_indices[i]:feature_indices[i + 1]]
+            codes_lookup.append(np.where(X_block.any(axis=1), feature_indices[i] + X_block.argmax(axis=1), -1))
+        return codes_lookup
+
+    def _transform_codes(self, X):
+        n_samples = X.shape[0]
+        n_columns_out = sum(self._get_n_columns())
+        X_cols = np.empty((n_samples, X.shape[1]), dtype=np.int64)
+        for i, column in enumerate(X.columns):
+            X_cols[:, i] = self.codes_lookup_[i][X[column].cat.codes.to_numpy()]
+        X_mask = X_cols >= 0
+        if not self.sparse:
+            out = np.zeros((n_samples, n_columns_out), dtype=self.dtype)
+            row_indices = np.broadcast_to(np.arange(n_samples).reshape(-1, 1), X_cols.shape)
+            out[row_indices[X_mask], X_cols[X_mask]] = 1
+            return out
+        indptr = np.insert(X_mask.sum(axis=1).cumsum(), 0, 0)
+        data = np.ones(indptr[-1])
+        return sparse.csr_matrix((data, X_cols[X_mask], indptr), shape=(n_samples, n_columns_out), dtype=self.dtype)
+
+    def _transform_values(self, X):
+        X = np.array(X).tolist() # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
+        # validation of X happens in _check_X called by _transform
+        X_int, X_mask = self._transform(X, handle_unknown=self.handle_unknown)
+        n_samples, n_features = X_int.shape
+        n_columns = self._get_n_columns()
+
         if self.drop is not None:
             to_drop = self.drop_idx_.copy()
             if isinstance(self.drop, str):
@@ -765,6 +847,7 @@ class OrdinalMergeRaresHandleUnknownEncoder(_BaseEncoder):
         self
         
         """
+        X_in = X
         X = np.array(X).tolist()  # converts all elements in X to the same type (i.e. cannot mix floats, ints, and str)
         self._fit(X, handle_unknown='ignore')
 
@@ -772,6 +855,7 @@ class OrdinalMergeRaresHandleUnknownEncoder(_BaseEncoder):
         # new level introduced to account for unknown categories, always = 1 + total number of categories seen during training
         self.categories_unknown_level_ = [min(len(categories), self.max_levels) for categories in self.categories_]
         self.categories_len_ = [len(categories) for categories in self.categories_]
+        self._fit_codes_lookup(X_in)
         return self
     
     def transform(self, X):
@@ -788,6 +872,22 @@ class OrdinalMergeRaresHandleUnknownEncoder(_BaseEncoder):
             Transformed input.
         
         """
+        if self._can_transform_codes(X):
+            return self._transform_codes(X)
+        return self._transform_values(X)
+
+    def _get_codes_lookup(self, X_probe_out, codes_categories):
+        return [X_probe_out[:len(categories) + 1, i] for i, categories in enumerate(codes_categories)]
+
+    def _transform_codes(self, X):
+        X_out = np.empty(X.shape, dtype=self.dtype)
+        for i, column in enumerate(X.columns):
+            X_out[:, i] = self.codes_lookup_[i][X[column].cat.codes.to_numpy()]
+        return X_out
+
+    def _transform_values(self, X):
+        if _is_categorical_frame(X):
+            X = np.array(X)  # convert as in fit, per-column validation of categorical columns rejects NaN
         X_og_array = np.array(X)  # original X array before transform
         X_int, _ = self._transform(X, handle_unknown='ignore')  # will contain zeros for 0th category as well as unknown values.
 
@@ -1,6 +1,7 @@
 """ Data preprocessing helper functions for tabular neural network models """
 
 from collections import OrderedDict
+import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
@@ -22,17 +23,26 @@ def create_preprocessor(impute_strategy, max_category_levels, unique_category_st
             ('quantile', QuantileTransformer(output_distribution='normal')) ])  # Or output_distribution = 'uniform'
         transformers.append( ('skewed', power_transformer, skewed_features) )
     if onehot_features:
-        onehot_transformer = Pipeline(steps=[
-            ('imputer', SimpleImputer(strategy='constant', fill_value=unique_category_str)),
+        onehot_transformer = Pipeline(steps=_get_categorical_imputer_steps(unique_category_str) + [
             ('onehot', OneHotMergeRaresHandleUnknownEncoder(max_levels=max_category_levels, sparse=False))])  # test-time unknown values will be encoded as all zeros vector
         transformers.append( ('onehot', onehot_transformer, onehot_features) )
     if embed_features:  # Ordinal transformer applied to convert to-be-embedded categorical features to integer levels
-        ordinal_transformer = Pipeline(steps=[
-            ('imputer', SimpleImputer(strategy='constant', fill_value=unique_category_str)),
+        ordinal_transformer = Pipeline(steps=_get_categorical_imputer_steps(unique_category_str) + [
             ('ordinal', OrdinalMergeRaresHandleUnknownEncoder(max_levels=max_category_levels))])  # returns 0-n when max_category_levels = n-1. category n is reserved for unknown test-time categories.
         transformers.append( ('ordinal', ordinal_transformer, embed_features) )
     return ColumnTransformer(transformers=transformers, remainder='passthrough')  # numeric features are processed in the same order as in numeric_features vector, so feature-names remain the same.
 
+
+def _get_categorical_imputer_steps(unique_category_str):
+    """
+    Returns the imputation steps preceding the categorical encoders.
+    Imputing NaN with NaN is a no-op, so the imputer is skipped in that case: this keeps pandas categorical dtypes intact
+    and lets the encoders take their fast path that encodes categorical codes directly.
+    """
+    if pd.isnull(unique_category_str):
+        return []
+    return [('imputer', SimpleImputer(strategy='constant', fill_value=unique_category_str))]
+
 def convert_df_dtype_to_str(df):
     return df.astype(str)
 
@@ -179,7 +179,7 @@ class XGBoostModel(AbstractModel):
 
     def _estimate_memory_usage(self, X, **kwargs):
         num_classes = self.num_classes if self.num_classes else 1  # self.num_classes could be None after initialization if it's a regression problem
-        data_mem_usage = get_approximate_df_mem_usage(X).sum()
+        data_mem_usage = get_approximate_df_mem_usage(X, memory_profile=kwargs.get('data_memory_profile', None)).sum()
         approx_mem_size_req = data_mem_usage * 7 + data_mem_usage / 4 * num_classes  # TODO: Extremely crude approximation, can be vastly improved
         return approx_mem_size_req
 
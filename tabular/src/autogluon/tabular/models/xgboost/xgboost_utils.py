@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from collections import OrderedDict
 from scipy.sparse import hstack, csr_matrix
 from sklearn.base import BaseEstimator, TransformerMixin
@@ -58,12 +59,15 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         self.labels = OrderedDict()
         self.cat_cols = []
         self.other_cols = []
+        self.sparse_cols = []
         self.ohe_encs = None
         self.max_levels=max_levels
 
     def fit(self, X, y=None):
         self.cat_cols = list(X.select_dtypes(include='category').columns)
-        self.other_cols = list(X.select_dtypes(exclude='category').columns)
+        # Sparse columns are converted to csr without densifying them
+        self.sparse_cols = [c for c in X.columns if isinstance(X[c].dtype, pd.SparseDtype)]
+        self.other_cols = [c for c in X.select_dtypes(exclude='category').columns if c not in self.sparse_cols]
         self.ohe_encs = OneHotMergeRaresHandleUnknownEncoder(max_levels=self.max_levels)
 
         if self.cat_cols:
@@ -80,6 +84,9 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         if self.other_cols:
             for c in self.other_cols:
                 self._feature_map[c] = 'int' if X[c].dtypes == int else 'float'
+        if self.sparse_cols:
+            for c in self.sparse_cols:
+                self._feature_map[c] = 'int' if X[c].dtypes.subtype == int else 'float'
         return self
 
     def transform(self, X, y=None):
@@ -88,6 +95,9 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
             X_list.append(self.ohe_encs.transform(X[self.cat_cols]))
         if self.other_cols:
             X_list.append(csr_matrix(X[self.other_cols]))
+        sparse_cols = getattr(self, 'sparse_cols', None)
+        if sparse_cols:
+            X_list.append(X[sparse_cols].sparse.to_coo())
         return hstack(X_list, format="csr")
 
     def get_feature_names(self):
@@ -97,4 +107,4 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         return list(self._feature_map.values())
 
     def get_original_feature_names(self):
-        return self.cat_cols + self.other_cols
+        return self.cat_cols + self.other_cols + getattr(self, 'sparse_cols', [])
@@ -6,7 +6,7 @@ import os
 import pprint
 import shutil
 import time
-from typing import Union, List, Tuple
+from typing import Union, List, Optional, Tuple
 import warnings
 
 import networkx as nx
@@ -28,6 +28,7 @@ from autogluon.core.trainer import AbstractTrainer
 from autogluon.core.utils import get_pred_from_proba_df
 from autogluon.core.utils import plot_performance_vs_trials, plot_summary_of_models, plot_tabular_models
 from autogluon.core.utils.decorators import apply_presets
+from autogluon.core.utils.infer_utils import benchmark_inference
 from autogluon.core.utils.loaders import load_pkl, load_str
 from autogluon.core.utils.savers import save_pkl, save_str
 from autogluon.core.utils.utils import default_holdout_frac
@@ -230,6 +231,7 @@ class TabularPredictor:
                                                              **learner_kwargs)
         self._learner_type = type(self._learner)
         self._trainer = None
+        self._post_fit_kwargs_resume = None  # Arguments of `_post_fit` for the fit in progress, used by `resume_fit`
 
     @property
     def class_labels(self):
@@ -611,6 +613,16 @@ class TabularPredictor:
                 For valid dictionary keys, refer to :class:`autogluon.core.utils.feature_selection.FeatureSelector` and
                 `autogluon.core.trainer.abstract_trainer.AbstractTrainer._proxy_model_feature_prune` documentation.
                 To force all models to work with the pruned set of features, set force_prune=True in the dictionary.
+            num_bag_models_parallel : int, default = 1
+                Number of bagged models of a stack layer to fit at the same time.
+                Only models whose folds are fit in parallel with Ray (`fold_fitting_strategy='parallel_local'` in `ag_args_ensemble`,
+                the default when Ray is installed) are fit at the same time, other models are fit one after another.
+                The folds of all models being fit are queued together and assigned to workers as they free up,
+                rather than waiting for the slowest fold of each model before starting the next model.
+                Models with the longest fold durations during previous bagging repeats are started first. Each model still respects its share of `time_limit`.
+                Only used when bagging is enabled and hyperparameter tuning is disabled.
+                The memory checks of models fit at the same time divide the available memory between them,
+                so higher values can cause models to fit their folds sequentially or to be skipped due to insufficient memory.
             ag_args : dict, default = None
                 Keyword arguments to pass to all models (i.e. common hyperparameters shared by all AutoGluon models).
                 See the `ag_args` argument from "Advanced functionality: Custom AutoGluon model arguments" in the `hyperparameters` argument documentation for valid values.
@@ -857,11 +869,21 @@ class TabularPredictor:
             'ag_args_ensemble': ag_args_ensemble,
             'ag_args_fit': ag_args_fit,
             'excluded_model_types': excluded_model_types,
-            'feature_prune_kwargs': kwargs.get('feature_prune_kwargs', None)
+            'feature_prune_kwargs': kwargs.get('feature_prune_kwargs', None),
+            'num_bag_models_parallel': kwargs.get('num_bag_models_parallel', 1),
         }
         aux_kwargs = {}
         if fit_weighted_ensemble is False:
             aux_kwargs['fit_weighted_ensemble'] = False
+        post_fit_kwargs = dict(
+            keep_only_best=kwargs['keep_only_best'],
+            refit_full=kwargs['refit_full'],
+            set_best_to_refit_full=kwargs['set_best_to_refit_full'],
+            save_space=kwargs['save_space'],
+            calibrate=kwargs['calibrate'],
+            infer_limit=infer_limit,
+        )
+        self._post_fit_kwargs_resume = post_fit_kwargs
         self.save(silent=True)  # Save predictor to disk to enable prediction and training after interrupt
         self._learner.fit(X=train_data, X_val=tuning_data, X_unlabeled=unlabeled_data,
                           holdout_frac=holdout_frac, num_bag_folds=num_bag_folds, num_bag_sets=num_bag_sets,
@@ -871,14 +893,45 @@ class TabularPredictor:
                           verbosity=verbosity, use_bag_holdout=use_bag_holdout)
         self._set_post_fit_vars()
 
-        self._post_fit(
-            keep_only_best=kwargs['keep_only_best'],
-            refit_full=kwargs['refit_full'],
-            set_best_to_refit_full=kwargs['set_best_to_refit_full'],
-            save_space=kwargs['save_space'],
-            calibrate=kwargs['calibrate'],
-            infer_limit=infer_limit,
-        )
+        self._post_fit(**post_fit_kwargs)
+        self._post_fit_kwargs_resume = None
+        self.save()
+        return self
+
+    def resume_fit(self, time_limit: float = None):
+        """
+        Resumes a call to `fit()` which was interrupted during training, for example by running out of memory or by the machine being preempted.
+        The predictor must be loaded from the `path` of the interrupted fit via `TabularPredictor.load` before calling this method.
+        `cache_data` must have been set to `True` in the interrupted fit (the default).
+
+        Models and bagging repeats which were fit before the interruption are kept as is and not fit again.
+        Bagged models whose fit was interrupted partway through a bagging repeat are fit on the remaining folds of the repeat.
+        The remaining models of each stack layer are fit with the arguments of the interrupted fit,
+        followed by the post-fit operations of the interrupted fit such as `refit_full` and `calibrate`.
+        Models which were being fit at the time of the interruption are fit again from scratch.
+
+        Parameters
+        ----------
+        time_limit : float, default = None
+            Approximately how long `resume_fit()` should run for (wallclock time in seconds).
+            If None, the time remaining from the `time_limit` of the interrupted fit is used,
+            not counting the time between the last model fit before the interruption and the interruption.
+
+        Returns
+        -------
+        :class:`TabularPredictor` object. Returns self.
+        """
+        self._assert_is_fit('resume_fit')
+        if not self._trainer.can_resume_fit():
+            raise AssertionError('No interrupted fit was found to resume. '
+                                 '`resume_fit` can only be called on a predictor whose fit was interrupted during training with `cache_data=True`.')
+        self._trainer.resume_fit(time_limit=time_limit)
+        self._learner.save_trainer(trainer=self._trainer)
+        self._set_post_fit_vars()
+        post_fit_kwargs = getattr(self, '_post_fit_kwargs_resume', None)
+        if post_fit_kwargs is not None:
+            self._post_fit(**post_fit_kwargs)
+        self._post_fit_kwargs_resume = None
         self.save()
         return self
 
@@ -1065,7 +1118,8 @@ class TabularPredictor:
             'ag_args': ag_args,
             'ag_args_ensemble': ag_args_ensemble,
             'ag_args_fit': ag_args_fit,
-            'excluded_model_types': excluded_model_types
+            'excluded_model_types': excluded_model_types,
+            'num_bag_models_parallel': kwargs['num_bag_models_parallel'],
         }
 
         if X_pseudo is not None and y_pseudo is not None:
@@ -1363,6 +1417,7 @@ class TabularPredictor:
         model : str (optional)
             The name of the model to get predictions from. Defaults to None, which uses the highest scoring model on the validation set.
             Valid models are listed in this `predictor` by calling `predictor.get_model_names()`
+            Cascades fit by `predictor.fit_cascade()` are also valid models.
         as_pandas : bool, default = True
             Whether to return the output as a :class:`pd.Series` (True) or :class:`np.ndarray` (False).
         transform_features : bool, default = True
@@ -1393,6 +1448,7 @@ class TabularPredictor:
         model : str (optional)
             The name of the model to get prediction probabilities from. Defaults to None, which uses the highest scoring model on the validation set.
             Valid models are listed in this `predictor` by calling `predictor.get_model_names()`.
+            Cascades fit by `predictor.fit_cascade()` are also valid models.
         as_pandas : bool, default = True
             Whether to return the output as a pandas object (True) or numpy array (False).
             Pandas object is a DataFrame if this is a multiclass problem or `as_multiclass=True`, otherwise it is a Series.
@@ -1448,6 +1504,7 @@ class TabularPredictor:
         """
         Report the predictive performance evaluated over a given dataset.
         This is basically a shortcut for: `pred_proba = predict_proba(data); evaluate_predictions(data[label], pred_proba)`.
+        Model predictions are cached, consecutive calls to `evaluate` and `leaderboard` on the same data only predict with each model once.
 
         Parameters
         ----------
@@ -1474,9 +1531,9 @@ class TabularPredictor:
         self._assert_is_fit('evaluate')
         data = self.__get_dataset(data)
         if self.can_predict_proba:
-            y_pred = self.predict_proba(data=data, model=model)
+            y_pred = self._learner.predict_proba(X=data, model=model, use_cache=True)
         else:
-            y_pred = self.predict(data=data, model=model)
+            y_pred = self._learner.predict(X=data, model=model, use_cache=True)
         if self.sample_weight is not None and self.weight_evaluation and self.sample_weight in data:
             sample_weight = data[self.sample_weight]
         else:
@@ -1560,6 +1617,8 @@ class TabularPredictor:
                 'pred_time_test_marginal': The inference time of the model for the data provided, minus the inference time for the model's base models, if it has any.
                     Note that this ignores the time required to load the model into memory when bagging is disabled.
             If str is passed, `data` will be loaded using the str value as the file path.
+            Model predictions on `data` are cached, consecutive calls to `leaderboard` and `evaluate` on the same data only predict with each model once
+            (reporting the inference times of the first prediction).
         extra_info : bool, default = False
             If `True`, will return extra columns with advanced info.
             This requires additional computation as advanced info data is calculated on demand.
@@ -2036,6 +2095,7 @@ class TabularPredictor:
         model : str, default = None
             Model to get feature importances for, if None the best model is chosen.
             Valid models are listed in this `predictor` by calling `predictor.get_model_names()`
+            Cascades fit by `predictor.fit_cascade()` are not supported.
         features : list, default = None
             List of str feature names that feature importances are calculated for and returned, specify None to get all feature importances.
             If you only want to compute feature importances for some of the features, you can pass their names in as a list of str.
@@ -2103,6 +2163,9 @@ class TabularPredictor:
             'pXX_low': Lower end of XX% confidence interval for true feature importance score.
         """
         self._assert_is_fit('feature_importance')
+        if isinstance(model, str) and model in self._trainer.get_cascade_names():
+            raise ValueError(f'Feature importance is not supported for cascades, specify one of the models of the cascade instead '
+                             f'(model={model}, cascade models={self._trainer.get_cascade_info(model)["models"]})')
         data = self.__get_dataset(data, allow_nan=True)
         if (data is None) and (not self._trainer.is_data_saved):
             raise AssertionError(
@@ -2151,7 +2214,7 @@ class TabularPredictor:
         Compile models for accelerated prediction.
         This can be helpful to reduce prediction latency and improve throughput.
 
-        Note that this is currently an experimental feature, the supported compilers can be ['native', 'onnx'].
+        Note that this is currently an experimental feature, the supported compilers can be ['native', 'onnx', 'quantize'].
 
         In order to compile with a specific compiler, that compiler must be installed in the Python environment.
 
@@ -2186,6 +2249,17 @@ class TabularPredictor:
                     However, it can be slow for batch processing, because of the overhead of multiple kernel execution.
                     Increasing batch size to a number that is larger than 1 would help increase the prediction throughput.
                     This comes with an expense of utilizing larger memory for prediction.
+
+            Additional values for the "quantize" compiler (supported by "NN_TORCH" and "FASTAI"):
+                int8 : bool, default = True
+                    Whether to apply post-training dynamic int8 quantization to the Linear layers of the network.
+                bf16 : bool, default = False
+                    Whether to run inference under bfloat16 autocast. Only applied on CPUs with native bfloat16 support.
+                max_score_drop : float, default = 0.01
+                    The compiled model is scored on the validation data (or the training data if no validation data was used during fit)
+                    before and after compilation, and the score delta is logged.
+                    If the score drops by more than `max_score_drop`, the model falls back to the native network.
+                    Set to None to skip the validation.
         """
         self._assert_is_fit('compile_models')
         if isinstance(compiler_configs, str):
@@ -2199,10 +2273,11 @@ class TabularPredictor:
                 raise ValueError(f'Unknown compiler_configs preset: "{compiler_configs}"')
         self._trainer.compile_models(model_names=models, with_ancestors=with_ancestors, compiler_configs=compiler_configs)
 
-    def persist_models(self, models='best', with_ancestors=True, max_memory=0.1) -> list:
+    def persist_models(self, models='best', with_ancestors=True, max_memory=0.1, warm_up_data: pd.DataFrame = None) -> list:
         """
         Persist models in memory for reduced inference latency. This is particularly important if the models are being used for online-inference where low latency is critical.
         If models are not persisted in memory, they are loaded from disk every time they are asked to make predictions.
+        Models (and the child models of bagged ensembles) are loaded from disk in parallel threads.
 
         Parameters
         ----------
@@ -2219,14 +2294,23 @@ class TabularPredictor:
             Proportion of total available memory to allow for the persisted models to use.
             If the models' summed memory usage requires a larger proportion of memory than max_memory, they are not persisted. In this case, the output will be an empty list.
             If None, then models are persisted regardless of estimated memory usage. This can cause out-of-memory errors.
+        warm_up_data : :class:`TabularDataset` or :class:`pd.DataFrame`, default = None
+            If specified, each persisted model predicts once on this data after being persisted,
+            so that one-time initialization performed on the first prediction (such as lazy imports, memory allocation and JIT compilation)
+            does not add latency to the first real prediction.
+            A few rows in the same format as the data passed to `predict` are sufficient.
 
         Returns
         -------
         List of persisted model names.
         """
         self._assert_is_fit('persist_models')
-        return self._learner.persist_trainer(low_memory=False, models=models, with_ancestors=with_ancestors,
-                                             max_memory=max_memory)
+        models_persisted = self._learner.persist_trainer(low_memory=False, models=models, with_ancestors=with_ancestors,
+                                                         max_memory=max_memory)
+        if warm_up_data is not None and models_persisted:
+            warm_up_data = self.__get_dataset(warm_up_data)
+            self._learner.predict_proba_multi(X=warm_up_data, models=models_persisted, as_pandas=False)
+        return models_persisted
 
     def unpersist_models(self, models='all') -> list:
         """
@@ -2248,6 +2332,47 @@ class TabularPredictor:
         self._assert_is_fit('unpersist_models')
         return self._learner.load_trainer().unpersist_models(model_names=models)
 
+    def benchmark_inference(self, data, models: List[str] = None, batch_sizes: List[int] = None, num_threads: List[int] = None, repeats: int = 3,
+                            persist_models: bool = True, silent: bool = False) -> pd.DataFrame:
+        """
+        Benchmarks the inference latency of models for a sweep of batch sizes and thread counts,
+        breaking down the latency of each model into global feature preprocessing, model loading, stacker input construction,
+        model preprocessing and core prediction.
+        Useful to find which models and which stages of inference are responsible for latency, and which models offer the best trade-off of score and latency.
+
+        Parameters
+        ----------
+        data : str or :class:`TabularDataset` or :class:`pd.DataFrame`
+            Data to benchmark inference on. Rows are duplicated or sampled to form each batch.
+            If it contains the label column, models are scored on it to compute the Pareto frontier of score and latency,
+            otherwise their validation scores are used.
+        models : list of str, default = None
+            Models to benchmark. Models they depend on are benchmarked as well. If None, all models that can infer are benchmarked.
+        batch_sizes : list of int, default = [1, 100, 10000]
+            Batch sizes to benchmark.
+        num_threads : list of int, default = None
+            Thread counts to benchmark, by limiting the native thread pools (OpenMP, BLAS) used by models. If None, the thread count is not limited.
+        repeats : int, default = 3
+            Repeats of each measurement. The median time over the repeats is reported.
+        persist_models : bool, default = True
+            If True, models are persisted in memory before benchmarking, as recommended for online inference.
+            Models persisted by this call are unpersisted once the benchmark is done, models that were already persisted stay persisted.
+            If False, model loading from disk is included in the latency of each prediction of models that are not already persisted.
+            Models that are already persisted (for example by `predictor.persist_models`) stay persisted.
+        silent : bool, default = False
+            If False, logs the latency of each model for each configuration.
+
+        Returns
+        -------
+        pd.DataFrame with one row per model, batch size and thread count, containing the time of each stage of inference,
+        the end-to-end latency 'pred_time', the 'score' of the model and whether it is on the Pareto frontier of score and latency ('is_pareto_frontier').
+        Refer to :func:`autogluon.core.utils.infer_utils.benchmark_inference` for details on the columns.
+        """
+        self._assert_is_fit('benchmark_inference')
+        data = self.__get_dataset(data)
+        return benchmark_inference(data, predictor=self, models=models, batch_sizes=batch_sizes, num_threads=num_threads, repeats=repeats,
+                                   persist_models=persist_models, silent=silent)
+
     def refit_full(self, model='all', set_best_to_refit_full=True):
         """
         Retrain model on all of the data (training + validation).
@@ -2487,6 +2612,42 @@ class TabularPredictor:
 
         return models
 
+    def fit_cascade(self, models: List[str] = None, max_score_loss: float = 0.01, name: str = None) -> Optional[str]:
+        """
+        Fits an early-exit cascade of previously-trained models, which is then a valid `model` in `predict`, `predict_proba` and `leaderboard`.
+        `cache_data` must have been set to `True` during the original training to enable this functionality.
+        Only valid for binary and multiclass classification.
+
+        Rows are predicted by the models of the cascade from first to last, exiting at the first model confident enough in its prediction.
+        When most rows are easy to predict, the cascade predicts most of them with its cheaper models,
+        reducing the average inference time compared to predicting all rows with its final model.
+        The confidence threshold of each model is fit on the validation data (out-of-fold predictions in bagged mode) so that the cascade's
+        validation score is at most `max_score_loss` lower than the validation score of its final model.
+
+        Parameters
+        ----------
+        models : List[str], default = None
+            The models of the cascade, ordered from first to predict to last. Models should be ordered by increasing inference time,
+            the final model usually being the best model.
+            If None, uses the models on the pareto frontier of validation score and inference time, ordered by increasing inference time.
+            Must contain at least two models.
+        max_score_loss : float, default = 0.01
+            The maximum decrease in validation score (in terms of `eval_metric`) of the cascade compared to its final model.
+            Greater values allow more rows to exit the cascade early.
+        name : str, default = None
+            The name of the cascade. If None, the name is 'Cascade_' followed by the name of the final model.
+
+        Returns
+        -------
+        The name of the cascade.
+        The cascade's validation score and expected inference time are listed in `predictor.leaderboard()`.
+        If no model can exit rows early within `max_score_loss`, or the default models contain fewer than two models,
+        the cascade would be identical to its final model: a warning is logged, no cascade is registered and None is returned.
+        """
+        self._assert_is_fit('fit_cascade')
+        trainer = self._learner.load_trainer()
+        return trainer.fit_cascade(models=models, max_score_loss=max_score_loss, name=name)
+
     def get_oof_pred(self, model: str = None, transformed=False, train_data=None, internal_oof=False, can_infer=None) -> pd.Series:
         """
         Note: This is advanced functionality not intended for normal usage.
@@ -3300,6 +3461,7 @@ class TabularPredictor:
             # other
             verbosity=self.verbosity,
             feature_prune_kwargs=None,
+            num_bag_models_parallel=1,
 
             # private
             _save_bag_folds=None,
@@ -212,6 +212,24 @@ class FitHelper:
         predictor.predict(test_data, model=cascade)
         predictor.predict_proba(test_data, model=cascade)
 
+        max_score_loss = 0.01
+        cascade_name = predictor.fit_cascade(models=cascade, max_score_loss=max_score_loss)
+        assert cascade_name is not None
+        cascade_info = predictor._trainer.get_cascade_info(cascade_name)
+        assert len(cascade_info['models']) >= 2
+        assert len(cascade_info['thresholds']) == len(cascade_info['models']) - 1
+        assert len(cascade_info['exit_frac']) == len(cascade_info['models'])
+        assert abs(sum(cascade_info['exit_frac']) - 1) < 1e-6
+        score_val_final = predictor._trainer.get_model_attribute(model=cascade_info['models'][-1], attribute='val_score')
+        assert cascade_info['score_val'] >= score_val_final - max_score_loss - 1e-9
+        y_pred = predictor.predict(test_data, model=cascade_name)
+        y_pred_proba = predictor.predict_proba(test_data, model=cascade_name)
+        assert len(y_pred) == len(test_data)
+        assert len(y_pred_proba) == len(test_data)
+        assert cascade_name in predictor.leaderboard(test_data, silent=True)['model'].tolist()
+        with pytest.raises(ValueError, match='not supported for cascades'):
+            predictor.feature_importance(test_data, model=cascade_name)
+
         if delete_directory:
             shutil.rmtree(predictor.path, ignore_errors=True)  # Delete AutoGluon output directory to ensure runs' information has been removed.
 
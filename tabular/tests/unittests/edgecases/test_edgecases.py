@@ -1,8 +1,12 @@
 
 import shutil
 
+import pytest
+
 from autogluon.core.constants import BINARY
 from autogluon.core.metrics import METRICS
+from autogluon.core.models import DummyModel
+from autogluon.tabular import TabularPredictor
 
 
 def test_no_weighted_ensemble(fit_helper):
@@ -119,3 +123,47 @@ def test_use_bag_holdout_calibrate(fit_helper):
         expected_model_count=2,
         refit_full=False,
     )
+
+
+class _InterruptedDummyModel(DummyModel):
+    """DummyModel which interrupts the process fitting it while `interrupt=True`, simulating the process being killed"""
+    interrupt = True
+
+    def _fit(self, **kwargs):
+        if _InterruptedDummyModel.interrupt:
+            raise KeyboardInterrupt
+        return super()._fit(**kwargs)
+
+
+def test_resume_fit(dataset_loader_helper):
+    """Tests that resume_fit continues an interrupted fit without refitting the models fit before the interruption"""
+    train_data, _, dataset_info = dataset_loader_helper.load_dataset(name='adult')
+    train_data = train_data.sample(n=500, random_state=0)
+    path = './datasets/AdultIncomeBinaryClassification/AutogluonOutput_resume_fit'
+    shutil.rmtree(path, ignore_errors=True)
+    fit_args = dict(
+        hyperparameters={'DUMMY': {}, _InterruptedDummyModel: {}},
+        num_bag_folds=2,
+        num_bag_sets=2,
+    )
+
+    _InterruptedDummyModel.interrupt = True
+    with pytest.raises(KeyboardInterrupt):
+        TabularPredictor(label=dataset_info['label'], path=path).fit(train_data, **fit_args)
+    predictor = TabularPredictor.load(path)
+    assert predictor.get_model_names() == ['DummyModel_BAG_L1']
+    fit_time = predictor.leaderboard(silent=True).set_index('model')['fit_time']['DummyModel_BAG_L1']
+
+    _InterruptedDummyModel.interrupt = False
+    predictor.resume_fit()
+    leaderboard = predictor.leaderboard(silent=True, extra_info=True).set_index('model')
+    assert len(leaderboard) == 3
+    assert leaderboard['fit_time']['DummyModel_BAG_L1'] == fit_time
+    # 2 folds * 2 sets = 4
+    assert leaderboard['num_models']['_InterruptedDummyModel_BAG_L1'] == 4
+    with pytest.raises(AssertionError):
+        predictor.resume_fit()
+
+    predictor = TabularPredictor.load(path)
+    assert len(predictor.get_model_names()) == 3
+    shutil.rmtree(path, ignore_errors=True)
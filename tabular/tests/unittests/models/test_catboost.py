@@ -35,3 +35,14 @@ def test_catboost_quantile(fit_helper):
     dataset_name = 'ames'
     init_args = dict(problem_type='quantile', quantile_levels=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, init_args=init_args)
+
+
+def test_catboost_binary_bag_sequential(fit_helper):
+    """Tests that sequentially fit fold models train on rows selected from a dataset shared across folds"""
+    fit_args = dict(
+        hyperparameters={CatBoostModel: {}},
+        num_bag_folds=3,
+        ag_args_ensemble={'fold_fitting_strategy': 'sequential_local'},
+    )
+    dataset_name = 'adult'
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
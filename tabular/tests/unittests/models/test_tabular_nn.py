@@ -1,6 +1,10 @@
+import numpy as np
+import pandas as pd
 import pytest
+from scipy import sparse
 
 from autogluon.tabular.models.tabular_nn.torch.tabular_nn_torch import TabularNeuralNetTorchModel
+from autogluon.tabular.models.tabular_nn.utils.categorical_encoders import OneHotMergeRaresHandleUnknownEncoder, OrdinalMergeRaresHandleUnknownEncoder
 
 
 def test_tabular_nn_binary(fit_helper):
@@ -72,3 +76,62 @@ def test_tabular_nn_regression_compile_onnx(fit_helper):
                                                     compile_models=True, compiler_configs=compiler_configs)
     from autogluon.tabular.models.tabular_nn.compilers.onnx import TabularNeuralNetTorchOnnxTransformer
     assert isinstance(predictor._learner.trainer.models['NeuralNetTorch'].processor, TabularNeuralNetTorchOnnxTransformer)
+
+
+def test_tabular_nn_binary_compile_quantize(fit_helper):
+    fit_args = dict(
+        hyperparameters={TabularNeuralNetTorchModel: {}},
+    )
+    dataset_name = 'adult'
+    compiler_configs = {TabularNeuralNetTorchModel: {'compiler': 'quantize', 'max_score_drop': None}}
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args,
+                                                    compile_models=True, compiler_configs=compiler_configs)
+    from torch.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+    model = predictor._learner.trainer.models['NeuralNetTorch']
+    assert model.get_compiler_name() == 'quantize'
+    assert any(isinstance(module, DynamicQuantizedLinear) for module in model.model.modules())
+
+
+def test_tabular_nn_regression_compile_quantize_fallback(fit_helper):
+    fit_args = dict(
+        hyperparameters={TabularNeuralNetTorchModel: {}},
+        time_limit=20,  # TabularNN trains for a long time on ames
+    )
+    dataset_name = 'ames'
+    # max_score_drop=-inf always triggers the fallback to the native network
+    compiler_configs = {TabularNeuralNetTorchModel: {'compiler': 'quantize', 'max_score_drop': -float('inf')}}
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args,
+                                                    compile_models=True, compiler_configs=compiler_configs)
+    from torch.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+    model = predictor._learner.trainer.models['NeuralNetTorch']
+    assert model.get_compiler_name() == 'native'
+    assert not any(isinstance(module, DynamicQuantizedLinear) for module in model.model.modules())
+
+
+@pytest.mark.parametrize('encoder', [
+    OneHotMergeRaresHandleUnknownEncoder(max_levels=5, sparse=False),
+    OneHotMergeRaresHandleUnknownEncoder(max_levels=5, sparse=True),
+    OrdinalMergeRaresHandleUnknownEncoder(max_levels=5),
+])
+def test_tabular_nn_categorical_encoder_codes_fast_path(encoder):
+    """Tests that encoding categorical codes gives the same output as encoding the values, including NaN and rare categories"""
+    rng = np.random.default_rng(0)
+
+    def get_data(num_rows):
+        data = dict()
+        for i, num_categories in enumerate([2, 10, 30]):
+            codes = rng.integers(-1, num_categories, num_rows)
+            data[f'cat_{i}'] = pd.Categorical.from_codes(codes, categories=list(range(num_categories)))
+        return pd.DataFrame(data)
+
+    X_train = get_data(num_rows=1000)
+    X_test = get_data(num_rows=500)
+    encoder.fit(X_train)
+    assert encoder.codes_lookup_ is not None
+    X_test_out_codes = encoder.transform(X_test)
+    X_test_out_values = encoder.transform(np.array(X_test))
+    if sparse.issparse(X_test_out_codes):
+        X_test_out_codes = X_test_out_codes.toarray()
+        X_test_out_values = X_test_out_values.toarray()
+    assert X_test_out_codes.dtype == X_test_out_values.dtype
+    assert np.array_equal(X_test_out_codes, X_test_out_values)
@@ -32,6 +32,20 @@ def test_tabular_nn_fastai_regression(fit_helper):
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
 
 
+def test_tabular_nn_fastai_binary_compile_quantize(fit_helper):
+    fit_args = dict(
+        hyperparameters={NNFastAiTabularModel: {}},
+    )
+    dataset_name = 'adult'
+    compiler_configs = {NNFastAiTabularModel: {'compiler': 'quantize', 'max_score_drop': None}}
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args,
+                                                    compile_models=True, compiler_configs=compiler_configs)
+    from torch.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+    model = predictor._learner.trainer.models['NeuralNetFastAI']
+    assert model.get_compiler_name() == 'quantize'
+    assert any(isinstance(module, DynamicQuantizedLinear) for module in model.model.model.modules())
+
+
 __GET_EPOCHS_NUMBER_CASES = {
     'happy_path': [dict(time_left=45, batch_size=256, epochs='auto'), 2],
     'given negative time return 0 epochs': [dict(time_left=-45, batch_size=256, epochs='auto'), 0],
@@ -469,3 +469,30 @@ def test_hpo_without_bagging_no_resources_per_trial(mock_system_resources_ctx_mg
         elif executor_cls == CustomHpoExecutor:
             # custom backend use all resources for one trial
             assert executor.hyperparameter_tune_kwargs['resources_per_trial'] == {'num_cpus': 8, 'num_gpus': 1}
+
+
+def test_hpo_without_bagging_no_resources_per_trial_local_parallel_scheduler(mock_system_resources_ctx_mgr):
+    hyperparameter_tune_kwargs = {
+        'scheduler': 'local_parallel',
+        'searcher': 'random',
+        'num_trials': 4
+    }
+    executor = _initialize_executor(CustomHpoExecutor, hyperparameter_tune_kwargs)
+    total_resources = {
+        'num_cpus': 8,
+        'num_gpus': 1
+    }
+    with mock_system_resources_ctx_mgr(num_cpus=total_resources['num_cpus'], num_gpus=total_resources['num_gpus']):
+        model = DummyModel(
+            minimum_resources={
+                'num_cpus': 1,
+                'num_gpus': 0.1
+            },
+        )
+        model.initialize()
+        executor.register_resources(model, X=dummy_x, **total_resources)
+        # local_parallel scheduler runs 4 trials in parallel like the ray backend
+        assert executor.runs_trials_in_parallel
+        assert executor.hyperparameter_tune_kwargs['resources_per_trial'] == {'num_cpus': 2, 'num_gpus': 0.25}
+        assert executor.scheduler_options[1]['resource'] == {'num_cpus': 2, 'num_gpus': 0.25}
+        assert executor.scheduler_options[1]['total_resource'] == total_resources
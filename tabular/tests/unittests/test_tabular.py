@@ -131,6 +131,10 @@ def test_advanced_functionality():
     assert set(leaderboard_extra.columns).issuperset(set(leaderboard.columns))
     assert len(leaderboard) == len(leaderboard_extra)
     assert set(leaderboard_extra.columns).issuperset(set(extra_metrics))  # Assert that extra_metrics are present in output
+    # Predictions cached by the prior leaderboard calls on test_data give identical scores
+    score_test = leaderboard.set_index('model')['score_test']
+    assert score_test.equals(leaderboard_extra.set_index('model')['score_test'].loc[score_test.index])
+    assert np.isclose(predictor.evaluate(test_data, silent=True)[predictor.eval_metric.name], score_test.loc[predictor.get_model_best()])
     num_models = len(predictor.get_model_names())
     feature_importances = predictor.feature_importance(data=test_data)
     original_features = set(train_data.columns)
@@ -174,6 +178,18 @@ def test_advanced_functionality():
     assert len(leaderboard) == len(leaderboard_loaded)
     assert predictor_loaded.get_model_names_persisted() == []  # Assert that models were not still persisted after loading predictor
 
+    benchmark = predictor_loaded.benchmark_inference(test_data, batch_sizes=[1, 10], repeats=1, persist_models=False, silent=True)
+    models_can_infer = predictor_loaded.get_model_names(can_infer=True)
+    assert len(benchmark) == 2 * len(models_can_infer)
+    assert set(benchmark['model']) == set(models_can_infer)
+    assert benchmark['is_pareto_frontier'].any()
+    assert (benchmark['pred_time'] >= benchmark['pred_time_marginal']).all()
+    # Only the models persisted by the benchmark are unpersisted once it is done
+    models_persisted = predictor_loaded.persist_models(models='best', max_memory=None)
+    predictor_loaded.benchmark_inference(test_data, batch_sizes=[1], repeats=1, silent=True)
+    assert set(predictor_loaded.get_model_names_persisted()) == set(models_persisted)
+    predictor_loaded.unpersist_models()
+
     _assert_predictor_size(predictor=predictor)
     # Test cloning logic
     with pytest.raises(AssertionError):
@@ -242,6 +258,19 @@ def _assert_predictor_size(predictor: TabularPredictor):
     assert predictor_size_disk == predictor_size_disk_per_file.sum()
 
 
+def test_persist_models_warm_up(fit_helper, dataset_loader_helper):
+    fit_args = dict(hyperparameters={'GBM': {}}, num_bag_folds=2)
+    predictor = fit_helper.fit_and_validate_dataset(dataset_name='adult', fit_args=fit_args, refit_full=False, delete_directory=False)
+    _, test_data, _ = dataset_loader_helper.load_dataset(name='adult')
+    # Warm up models with a prediction when persisting them
+    persisted_models = predictor.persist_models(models='all', warm_up_data=test_data.head(5))
+    assert set(predictor.get_model_names_persisted()) == set(persisted_models)
+    assert set(persisted_models) == set(predictor.get_model_names())
+    predictor.unpersist_models()
+    assert predictor.get_model_names_persisted() == []
+    shutil.rmtree(predictor.path, ignore_errors=True)
+
+
 def test_advanced_functionality_bagging():
     fast_benchmark = True
     dataset = {'url': 'https://autogluon.s3.amazonaws.com/datasets/AdultIncomeBinaryClassification.zip',
@@ -800,6 +829,20 @@ def test_tabular_sequential_local_bagging():
     run_tabular_benchmarks(**config)
 
 
+def test_tabular_bagging_models_parallel():
+    pytest.importorskip('ray')
+    config = _construct_tabular_bag_test_config(PARALLEL_LOCAL_BAGGING)
+    config['fit_args']['num_bag_models_parallel'] = 2
+    run_tabular_benchmarks(**config)
+
+
+def test_tabular_bagging_models_parallel_sequential_local():
+    # Models with sequential fold fitting are fit one after another
+    config = _construct_tabular_bag_test_config(SEQUENTIAL_LOCAL_BAGGING)
+    config['fit_args']['num_bag_models_parallel'] = 2
+    run_tabular_benchmarks(**config)
+
+
 def test_sample_weight():
     dataset = {'url': 'https://autogluon.s3.amazonaws.com/datasets/toyRegression.zip',
                'name': 'toyRegression',